@@ -0,0 +1,297 @@
+# Benchmark fit/predict DecisionTreeClassifier & DecisionTreeRegressor
+#
+# Menjalankan:
+#     python benchmarks/bench_tree.py                    # bandingkan dengan baseline
+#     python benchmarks/bench_tree.py --quick            # ukuran data lebih kecil
+#     python benchmarks/bench_tree.py --update-baseline  # simpan hasil sebagai baseline
+#
+# Seluruh data dibuat secara sintetis (tanpa akses jaringan). Hasil disimpan ke JSON
+# dan dibandingkan dengan baseline, benchmark yang lebih lambat dari
+# baseline * (1 + tolerance) membuat script keluar dengan status 1.
+#
+# Waktu absolut berbeda antar mesin (dan antar run pada mesin yang sama), sehingga
+# waktu fit/predict dibandingkan sebagai rasio terhadap workload kalibrasi yang
+# diukur berselang-seling pada run yang sama. Setiap rasio adalah median dari
+# beberapa pengukuran, dan setiap pengukuran mengulang operasi hingga minimal
+# MIN_MEASURE_TIME detik. Batas noise hanya relatif terhadap rasio baseline
+# (tolerance), sehingga rasio kecil seperti predict tetap diperiksa.
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from ml_from_scratch.tree import DecisionTreeClassifier
+from ml_from_scratch.tree import DecisionTreeRegressor
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Durasi minimal satu pengukuran (detik), operasi yang lebih cepat diulang beberapa kali
+MIN_MEASURE_TIME = 0.05
+
+# Konfigurasi default, setiap sweep hanya mengubah satu parameter
+DEFAULT_CASE = {
+    "n_samples": 2000,
+    "n_features": 5,
+    "n_unique": 100,
+    "n_classes": 2,
+    "max_depth": 6
+}
+
+SWEEPS = {
+    "n_samples": [1000, 4000, 16000],
+    "n_features": [2, 20],
+    "n_unique": [10, 1000, None],
+    "n_classes": [10, 50],
+    "max_depth": [2, 12],
+    "criteria": ["gini", "entropy", "log_loss", "squared_error", "absolute_error"]
+}
+
+def make_data(n_samples, n_features, n_unique, n_classes, seed=0):
+    """
+    Membuat data sintetis.
+
+    Args:
+        n_samples (int): Jumlah baris.
+        n_features (int): Jumlah fitur.
+        n_unique (int or None): Jumlah nilai unik tiap fitur (None berarti kontinu).
+        n_classes (int): Jumlah class target klasifikasi.
+        seed (int, optional): Seed random generator.
+
+    Returns:
+        tuple: (X, y_clf, y_reg).
+    """
+    rng = np.random.default_rng(seed)
+    X = rng.random((n_samples, n_features))
+    if n_unique is not None:
+        X = np.floor(X * n_unique) / n_unique
+
+    # Target bergantung pada dua fitur pertama ditambah noise
+    signal = X[:, 0] + X[:, min(1, n_features - 1)] ** 2
+    y_reg = signal + 0.1 * rng.standard_normal(n_samples)
+    y_clf = np.minimum((signal / 2 * n_classes).astype(int), n_classes - 1)
+
+    return X, y_clf, y_reg
+
+def make_cases(quick=False):
+    """
+    Membuat daftar benchmark berupa (nama, parameter).
+
+    Args:
+        quick (bool, optional): Gunakan data lebih kecil.
+
+    Returns:
+        list: Daftar tuple (nama, parameter).
+    """
+    cases = []
+    for estimator in ("clf", "reg"):
+        criteria = "gini" if estimator == "clf" else "squared_error"
+        for param, values in SWEEPS.items():
+            for value in values:
+                if param == "n_classes" and estimator == "reg":
+                    continue
+                if param == "criteria":
+                    is_clf = value in ("gini", "entropy", "log_loss")
+                    if is_clf != (estimator == "clf"):
+                        continue
+
+                case = dict(DEFAULT_CASE, criteria=criteria, estimator=estimator)
+                case[param] = value
+                if quick:
+                    case["n_samples"] = max(case["n_samples"] // 4, 100)
+                cases.append((f"{estimator}-{param}={value}", case))
+
+    return cases
+
+def _autorange(func):
+    """Jumlah pemanggilan func agar satu pengukuran berlangsung minimal MIN_MEASURE_TIME."""
+    number = 1
+    while _timer(func, number) < MIN_MEASURE_TIME:
+        number *= 2
+    return number
+
+def _timer(func, number):
+    """Waktu total number kali pemanggilan func (detik)."""
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+def make_calibration():
+    """
+    Membuat workload kalibrasi: operasi NumPy dan loop Python seperti pada fit/predict,
+    tetapi tidak bergantung pada kode library, sebagai satuan waktu mesin.
+
+    Returns:
+        callable: Workload kalibrasi.
+    """
+    rng = np.random.default_rng(0)
+    x = rng.random(100000)
+    values = x[:20000].tolist()
+
+    def workload():
+        order = np.argsort(x)
+        np.cumsum(x[order])
+        total = 0.0
+        for value in values:
+            total += value * value
+        return total
+
+    return workload
+
+def measure(func, calibration, repeat=5):
+    """
+    Mengukur waktu satu pemanggilan func relatif terhadap workload kalibrasi.
+
+    Setiap pengukuran func langsung diikuti pengukuran kalibrasi sehingga perubahan
+    kecepatan mesin selama benchmark (beban lain, frekuensi CPU) ikut terbagi.
+
+    Args:
+        func (callable): Fungsi tanpa argumen yang diukur.
+        calibration (callable): Workload kalibrasi.
+        repeat (int, optional): Jumlah pengukuran, median yang diambil.
+
+    Returns:
+        tuple: Median waktu per pemanggilan (detik) dan median rasio terhadap kalibrasi.
+    """
+    number = _autorange(func)
+    number_calibration = _autorange(calibration)
+
+    times, ratios = [], []
+    for _ in range(repeat):
+        elapsed = _timer(func, number) / number
+        reference = _timer(calibration, number_calibration) / number_calibration
+        times.append(elapsed)
+        ratios.append(elapsed / reference)
+
+    return float(np.median(times)), float(np.median(ratios))
+
+def run_case(case, calibration, repeat=5):
+    """
+    Menjalankan satu benchmark.
+
+    Args:
+        case (dict): Parameter benchmark.
+        calibration (callable): Workload kalibrasi.
+        repeat (int, optional): Jumlah pengukuran, median yang diambil.
+
+    Returns:
+        dict: fit_time, predict_time, fit_ratio, predict_ratio (waktu relatif terhadap kalibrasi),
+        peak_memory, n_nodes dan nodes_per_sec.
+    """
+    X, y_clf, y_reg = make_data(case["n_samples"], case["n_features"],
+                                case["n_unique"], case["n_classes"])
+    if case["estimator"] == "clf":
+        estimator, y = DecisionTreeClassifier, y_clf
+    else:
+        estimator, y = DecisionTreeRegressor, y_reg
+
+    model = estimator(criteria=case["criteria"], max_depth=case["max_depth"])
+    fit_time, fit_ratio = measure(lambda: model.fit(X, y), calibration, repeat)
+    predict_time, predict_ratio = measure(lambda: model.predict(X), calibration, repeat)
+
+    # Peak memory diukur terpisah karena tracemalloc memperlambat eksekusi
+    tracemalloc.start()
+    model = estimator(criteria=case["criteria"], max_depth=case["max_depth"])
+    model.fit(X, y)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    n_nodes = int(model.tree_.node_count)
+    return {
+        "fit_time": fit_time,
+        "predict_time": predict_time,
+        "fit_ratio": fit_ratio,
+        "predict_ratio": predict_ratio,
+        "peak_memory": peak_memory,
+        "n_nodes": n_nodes,
+        "nodes_per_sec": n_nodes / fit_time
+    }
+
+def compare(results, baseline, tolerance):
+    """
+    Membandingkan hasil benchmark dengan baseline. Waktu dibandingkan sebagai rasio
+    terhadap kalibrasi sehingga baseline dari mesin lain tetap dapat digunakan.
+
+    Args:
+        results (dict): Hasil benchmark.
+        baseline (dict): Hasil baseline.
+        tolerance (float): Batas perlambatan relatif yang masih diterima.
+
+    Returns:
+        list: Daftar regresi berupa (nama, metrik, baseline, hasil).
+    """
+    regressions = []
+    for name, result in results.items():
+        # Hanya dibandingkan jika parameter benchmark sama (misal bukan mode --quick)
+        if name not in baseline or baseline[name].get("params") != result.get("params"):
+            continue
+        for metric in ("fit_ratio", "predict_ratio", "peak_memory"):
+            # Baseline lama tanpa rasio kalibrasi tidak dapat dibandingkan waktunya
+            if metric not in baseline[name]:
+                continue
+            base, value = baseline[name][metric], result[metric]
+            if value > base * (1 + tolerance):
+                regressions.append((name, metric, base, value))
+
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Decision Tree from scratch")
+    parser.add_argument("--quick", action="store_true", help="gunakan data lebih kecil")
+    parser.add_argument("--repeat", type=int, default=5, help="jumlah pengukuran tiap benchmark (median)")
+    parser.add_argument("--filter", default="", help="hanya jalankan benchmark yang namanya mengandung teks ini")
+    parser.add_argument("--output", default=None, help="path JSON hasil benchmark")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="path JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="perlambatan relatif maksimal")
+    parser.add_argument("--update-baseline", action="store_true", help="simpan hasil sebagai baseline")
+    args = parser.parse_args(argv)
+
+    calibration = make_calibration()
+
+    results = {}
+    for name, case in make_cases(args.quick):
+        if args.filter not in name:
+            continue
+        results[name] = dict(run_case(case, calibration, args.repeat), params=case)
+        result = results[name]
+        print(f"{name:<36} fit {result['fit_time']:9.4f}s  "
+              f"predict {result['predict_time']:8.4f}s  "
+              f"mem {result['peak_memory'] / 2**20:8.2f}MB  "
+              f"ratio {result['fit_ratio']:7.3f}/{result['predict_ratio']:7.4f}  "
+              f"{result['nodes_per_sec']:10.1f} nodes/s")
+
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"Baseline disimpan ke {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Baseline {args.baseline} tidak ditemukan, perbandingan dilewati")
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+
+    regressions = compare(results, baseline, args.tolerance)
+    for name, metric, base, value in regressions:
+        print(f"REGRESI {name} {metric}: {base:.4g} -> {value:.4g} ({value / base:.2f}x)")
+    if regressions:
+        return 1
+
+    print("Tidak ada regresi terhadap baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,11 @@
+from ._forest import RandomForestClassifier
+from ._forest import RandomForestRegressor
+from ._gradient_boosting import GradientBoostingClassifier
+from ._gradient_boosting import GradientBoostingRegressor
+
+__all__ = [
+    "RandomForestClassifier",
+    "RandomForestRegressor",
+    "GradientBoostingClassifier",
+    "GradientBoostingRegressor"
+]
@@ -0,0 +1,376 @@
+# Random Forest (bagging Decision Tree dengan pemilihan fitur acak per node)
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from ..tree import DecisionTreeClassifier
+from ..tree import DecisionTreeRegressor
+from ..tree._classes import _bin_data
+from ..tree._classes import _bin_thresholds
+from ..tree._tree import TREE_LEAF
+from ..tree._tree import FlatTree
+
+'============================================================================================================'
+# Data training pada proses worker, diisi satu kali oleh _init_worker
+_worker_data = {}
+
+def _init_worker(shm_name, shape, dtype, y, sample_weight):
+    """
+    Menghubungkan proses worker ke shared memory berisi X.
+
+    Args:
+        shm_name (str): Nama blok shared memory.
+        shape (tuple): Shape X.
+        dtype (numpy.dtype): Tipe data X.
+        y (numpy.ndarray): Data target.
+        sample_weight (numpy.ndarray or None): Bobot setiap sample.
+    """
+    # Worker berbagi resource tracker dengan proses utama, sehingga blok
+    # hanya dihapus (unlink) oleh proses utama setelah training selesai
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_data["shm"] = shm
+    _worker_data["X"] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    _worker_data["y"] = y
+    _worker_data["sample_weight"] = sample_weight
+
+def _fit_tree(tree, seed, bootstrap, bin_thresholds, X=None, y=None, sample_weight=None):
+    """
+    Melatih satu tree pada sample bootstrap (berupa index, tanpa menyalin X).
+
+    Args:
+        tree (DecisionTreeBase): Tree yang belum di-fit.
+        seed (numpy.random.SeedSequence): Seed sample bootstrap.
+        bootstrap (bool): Apakah sample bootstrap digunakan.
+        bin_thresholds (list or None): Threshold bin jika X berupa kode bin.
+        X (numpy.ndarray, optional): Data fitur, default X pada shared memory worker.
+        y (numpy.ndarray, optional): Data target, default y pada worker.
+        sample_weight (numpy.ndarray, optional): Bobot setiap sample, default bobot pada worker.
+
+    Returns:
+        DecisionTreeBase: Tree yang sudah di-fit.
+    """
+    if X is None:
+        X, y = _worker_data["X"], _worker_data["y"]
+        sample_weight = _worker_data["sample_weight"]
+
+    samples = None
+    if bootstrap:
+        n_samples = len(X)
+        samples = np.random.default_rng(seed).integers(0, n_samples, n_samples)
+
+    tree._fit(X, y, samples, bin_thresholds, sample_weight)
+    return tree
+
+def _stack_trees(trees):
+    """
+    Menggabungkan beberapa FlatTree menjadi satu FlatTree dengan banyak root.
+
+    Args:
+        trees (list): Daftar FlatTree.
+
+    Returns:
+        tuple: (FlatTree gabungan, index root setiap tree).
+    """
+    sizes = np.array([tree.node_count for tree in trees])
+    roots = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+    def shift(children, offset):
+        return np.where(children != TREE_LEAF, children + offset, TREE_LEAF)
+
+    stacked = FlatTree(
+        feature = np.concatenate([tree.feature for tree in trees]),
+        threshold = np.concatenate([tree.threshold for tree in trees]),
+        left = np.concatenate([shift(tree.left, root) for tree, root in zip(trees, roots)]),
+        right = np.concatenate([shift(tree.right, root) for tree, root in zip(trees, roots)]),
+        value = np.concatenate([tree.value for tree in trees]),
+        impurity = np.concatenate([tree.impurity for tree in trees]),
+        n_samples = np.concatenate([tree.n_samples for tree in trees]),
+        weighted_n_samples = np.concatenate([tree.weighted_n_samples for tree in trees])
+    )
+    return stacked, roots
+
+class ForestBase:
+    """
+    Fungsi yang digunakan untuk melakukan Base Random Forest untuk Regressor & Classifier,
+
+        - n_estimators              = Jumlah tree
+        - bootstrap                 = Apakah setiap tree dilatih pada sample bootstrap
+        - n_jobs                    = Jumlah proses untuk melatih tree
+        - random_state              = Seed sample bootstrap dan pemilihan fitur
+        - tree_params               = Hyperparameter Decision Tree (criteria, max_depth, dst.)
+
+    """
+    _tree_class = None
+
+    def __init__(
+        self,
+        n_estimators,
+        bootstrap,
+        n_jobs,
+        random_state,
+        **tree_params
+    ):
+        self.n_estimators = n_estimators
+        self.bootstrap = bootstrap
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        for name, value in tree_params.items():
+            setattr(self, name, value)
+        self._tree_params = list(tree_params)
+
+    def fit(self, X, y, sample_weight=None):
+        """
+        Fungsi yang digunakan untuk melatih seluruh tree.
+
+        Sample bootstrap setiap tree berupa array index ke X sehingga X tidak pernah
+        disalin. Dengan n_jobs > 1, X diletakkan satu kali pada shared memory dan
+        dibaca oleh seluruh proses worker.
+
+        Args:
+            X: Data fitur.
+            y: Data target.
+            sample_weight: Bobot setiap sample. Default: None (bobot 1).
+        """
+        X = np.asarray(X)
+        y = np.ravel(y)
+        if sample_weight is not None:
+            sample_weight = np.asarray(sample_weight, dtype=np.float64)
+        if self.n_estimators < 1:
+            raise ValueError("n_estimators harus lebih besar atau sama dengan 1")
+
+        self.n_samples, self.n_fitur = X.shape
+        self._init_target(y)
+
+        # Kuantisasi fitur dilakukan satu kali untuk seluruh tree
+        bin_thresholds = None
+        if self.max_bins is not None:
+            bin_thresholds = [_bin_thresholds(X[:, fitur_i], self.max_bins)
+                              for fitur_i in range(self.n_fitur)]
+            X = _bin_data(X, bin_thresholds)
+
+        # Seed setiap tree diturunkan dari random_state
+        seeds = np.random.SeedSequence(self.random_state).spawn(self.n_estimators)
+        params = {name: getattr(self, name) for name in self._tree_params}
+        trees = [self._tree_class(random_state = int(seed.generate_state(1)[0]), **params)
+                 for seed in seeds]
+
+        n_jobs = os.cpu_count() if self.n_jobs == -1 else (self.n_jobs or 1)
+        n_jobs = min(n_jobs, self.n_estimators)
+        if n_jobs > 1:
+            self.estimators_ = self._fit_processes(X, y, sample_weight, trees, seeds,
+                                                   bin_thresholds, n_jobs)
+        else:
+            self.estimators_ = [_fit_tree(tree, seed, self.bootstrap, bin_thresholds,
+                                          X, y, sample_weight)
+                                for tree, seed in zip(trees, seeds)]
+
+        # Seluruh tree digabung agar prediksi dilakukan sekaligus
+        self._stacked, self._roots = _stack_trees([tree.tree_ for tree in self.estimators_])
+
+    def _init_target(self, y):
+        # Informasi target tambahan (misal classes_) disiapkan oleh subclass
+        pass
+
+    def _fit_processes(self, X, y, sample_weight, trees, seeds, bin_thresholds, n_jobs):
+        """
+        Fungsi yang digunakan untuk melatih tree pada beberapa proses dengan X pada shared memory.
+
+        Returns:
+            list: Tree yang sudah di-fit sesuai urutan seeds.
+        """
+        shm = shared_memory.SharedMemory(create=True, size=max(X.nbytes, 1))
+        try:
+            X_shared = np.ndarray(X.shape, dtype=X.dtype, buffer=shm.buf)
+            X_shared[...] = X
+            with ProcessPoolExecutor(max_workers = n_jobs,
+                                     initializer = _init_worker,
+                                     initargs = (shm.name, X.shape, X.dtype, y, sample_weight)) as executor:
+                futures = [executor.submit(_fit_tree, tree, seed, self.bootstrap, bin_thresholds)
+                           for tree, seed in zip(trees, seeds)]
+                estimators = [future.result() for future in futures]
+            del X_shared
+        finally:
+            shm.close()
+            shm.unlink()
+
+        return estimators
+
+    def _apply_trees(self, X):
+        """
+        Fungsi yang digunakan untuk mencari nilai leaf seluruh tree untuk seluruh baris.
+
+        Pasangan (tree, baris) diturunkan bersama-sama pada tree gabungan, sehingga
+        jumlah iterasi sama dengan kedalaman tree terdalam, bukan jumlah tree.
+
+        Args:
+            X: Data fitur.
+
+        Returns:
+            numpy.ndarray: Nilai leaf berbentuk (n_estimators, n_samples).
+        """
+        X = np.asarray(X)
+        n_rows = len(X)
+        rows = np.tile(np.arange(n_rows), len(self._roots))
+        node = np.repeat(self._roots, n_rows)
+        leaves = self._stacked._descend(X, rows, node)
+
+        return self._stacked.value[leaves].reshape(len(self._roots), n_rows)
+
+class RandomForestClassifier(ForestBase):
+    """
+    Random Forest Classifier, majority vote dari Decision Tree Classifier.
+
+    Args:
+        n_estimators (int, optional): Jumlah tree. Default: 100.
+        criteria (str, optional): Kriteria yang digunakan untuk pemilihan atribut pemisah. Default: "gini".
+        max_depth (int or None, optional): Kedalaman maksimum setiap tree. Default: None.
+        sample_split_min (int, optional): Jumlah minimum sampel yang diperlukan untuk melakukan split pada node. Default: 2.
+        sample_leaf_min (int, optional): Jumlah minimum sampel yang diperlukan pada leaf node. Default: 1.
+        impurity_reduction_min (float, optional): Jumlah minimum pengurangan impurity yang diperlukan untuk melakukan split. Default: 0.0.
+        alpha (float, optional): Parameter alpha untuk pruning setiap tree. Default: 0.0.
+        max_bins (int or None, optional): Jumlah bin maksimal tiap fitur, kuantisasi dilakukan satu kali untuk seluruh tree. Default: None.
+        max_leaf_nodes (int or None, optional): Jumlah leaf maksimal setiap tree. Default: None.
+        max_features (int, float, str or None, optional): Jumlah fitur yang dipilih acak pada setiap node. Default: "sqrt".
+        bootstrap (bool, optional): Apakah setiap tree dilatih pada sample bootstrap. Default: True.
+        n_jobs (int or None, optional): Jumlah proses untuk melatih tree. -1 berarti seluruh core. Default: None.
+        random_state (int or None, optional): Seed sample bootstrap dan pemilihan fitur. Default: None.
+
+    """
+    _tree_class = DecisionTreeClassifier
+
+    def __init__(
+        self,
+        n_estimators = 100,
+        criteria = "gini",
+        max_depth = None,
+        sample_split_min = 2,
+        sample_leaf_min = 1,
+        impurity_reduction_min = 0.0,
+        alpa = 0.0,
+        max_bins = None,
+        max_leaf_nodes = None,
+        max_features = "sqrt",
+        bootstrap = True,
+        n_jobs = None,
+        random_state = None
+    ):
+        super().__init__(
+            n_estimators = n_estimators,
+            bootstrap = bootstrap,
+            n_jobs = n_jobs,
+            random_state = random_state,
+            criteria = criteria,
+            max_depth = max_depth,
+            sample_split_min = sample_split_min,
+            sample_leaf_min = sample_leaf_min,
+            impurity_reduction_min = impurity_reduction_min,
+            alpa = alpa,
+            max_bins = max_bins,
+            max_leaf_nodes = max_leaf_nodes,
+            max_features = max_features
+        )
+
+    def _init_target(self, y):
+        self.classes_ = np.unique(y)
+
+    def predict_proba(self, X):
+        """
+        Melakukan prediksi proporsi vote setiap class.
+
+        Args:
+            X (array-like): Data fitur.
+
+        Returns:
+            numpy.ndarray: Proporsi vote berbentuk (n_samples, n_classes), urutan sesuai classes_.
+        """
+        values = self._apply_trees(X)
+        n_estimators, n_rows = values.shape
+        n_classes = len(self.classes_)
+
+        # Menghitung vote setiap (baris, class) dengan satu bincount
+        codes = np.searchsorted(self.classes_, values)
+        index = (np.arange(n_rows) * n_classes + codes).ravel()
+        votes = np.bincount(index, minlength=n_rows * n_classes).reshape(n_rows, n_classes)
+
+        return votes / n_estimators
+
+    def predict(self, X):
+        """
+        Melakukan prediksi class dengan majority vote seluruh tree.
+
+        Args:
+            X (array-like): Data fitur.
+
+        Returns:
+            numpy.ndarray: Class yang diprediksi.
+        """
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+class RandomForestRegressor(ForestBase):
+    """
+    Random Forest Regressor, rata-rata prediksi Decision Tree Regressor.
+
+    Args:
+        n_estimators (int, optional): Jumlah tree. Default: 100.
+        criteria (str, optional): Kriteria yang digunakan untuk pemilihan atribut pemisah. Default: "squared_error".
+        max_depth (int or None, optional): Kedalaman maksimum setiap tree. Default: None.
+        sample_split_min (int, optional): Jumlah minimum sampel yang diperlukan untuk melakukan split pada node. Default: 2.
+        sample_leaf_min (int, optional): Jumlah minimum sampel yang diperlukan pada leaf node. Default: 1.
+        impurity_reduction_min (float, optional): Jumlah minimum pengurangan impurity yang diperlukan untuk melakukan split. Default: 0.0.
+        alpha (float, optional): Parameter alpha untuk pruning setiap tree. Default: 0.0.
+        max_bins (int or None, optional): Jumlah bin maksimal tiap fitur, kuantisasi dilakukan satu kali untuk seluruh tree. Default: None.
+        max_leaf_nodes (int or None, optional): Jumlah leaf maksimal setiap tree. Default: None.
+        max_features (int, float, str or None, optional): Jumlah fitur yang dipilih acak pada setiap node. Default: 1.0.
+        bootstrap (bool, optional): Apakah setiap tree dilatih pada sample bootstrap. Default: True.
+        n_jobs (int or None, optional): Jumlah proses untuk melatih tree. -1 berarti seluruh core. Default: None.
+        random_state (int or None, optional): Seed sample bootstrap dan pemilihan fitur. Default: None.
+
+    """
+    _tree_class = DecisionTreeRegressor
+
+    def __init__(
+        self,
+        n_estimators = 100,
+        criteria = "squared_error",
+        max_depth = None,
+        sample_split_min = 2,
+        sample_leaf_min = 1,
+        impurity_reduction_min = 0.0,
+        alpa = 0.0,
+        max_bins = None,
+        max_leaf_nodes = None,
+        max_features = 1.0,
+        bootstrap = True,
+        n_jobs = None,
+        random_state = None
+    ):
+        super().__init__(
+            n_estimators = n_estimators,
+            bootstrap = bootstrap,
+            n_jobs = n_jobs,
+            random_state = random_state,
+            criteria = criteria,
+            max_depth = max_depth,
+            sample_split_min = sample_split_min,
+            sample_leaf_min = sample_leaf_min,
+            impurity_reduction_min = impurity_reduction_min,
+            alpa = alpa,
+            max_bins = max_bins,
+            max_leaf_nodes = max_leaf_nodes,
+            max_features = max_features
+        )
+
+    def predict(self, X):
+        """
+        Melakukan prediksi dengan rata-rata prediksi seluruh tree.
+
+        Args:
+            X (array-like): Data fitur.
+
+        Returns:
+            numpy.ndarray: Nilai target yang diprediksi.
+        """
+        return self._apply_trees(X).mean(axis=0)
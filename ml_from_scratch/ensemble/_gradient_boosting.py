@@ -0,0 +1,360 @@
+# Gradient Boosting dari Decision Tree Regressor dengan split berbasis histogram
+
+import numpy as np
+
+from ..tree import DecisionTreeRegressor
+from ..tree._classes import _bin_data
+from ..tree._classes import _bin_thresholds
+from ..tree._criteria import NewtonCriterion
+from ._forest import _stack_trees
+
+'============================================================================================================'
+def _sigmoid(raw):
+    return 1 / (1 + np.exp(-raw))
+
+def _softmax(raw):
+    raw = raw - raw.max(axis=1, keepdims=True)
+    exp = np.exp(raw)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+class GradientBoostingBase:
+    """
+    Fungsi yang digunakan untuk melakukan Base Gradient Boosting untuk Regressor & Classifier,
+
+        - n_estimators              = Jumlah iterasi boosting
+        - learning_rate             = Faktor pengali nilai leaf setiap tree
+        - max_depth                 = Maksimal kedalaman setiap tree
+        - sample_leaf_min           = Jumlah sample leaf minimal
+        - max_leaf_nodes            = Jumlah leaf maksimal setiap tree
+        - max_bins                  = Jumlah bin maksimal tiap fitur
+        - l2_regularization         = Regularisasi L2 nilai leaf
+        - n_iter_no_change          = Jumlah iterasi tanpa perbaikan loss validasi sebelum berhenti
+        - validation_fraction       = Proporsi data training untuk validasi (early stopping)
+        - tol                       = Perbaikan loss validasi minimal
+        - random_state              = Seed pembagian data validasi
+
+    Setiap tree adalah DecisionTreeRegressor dengan NewtonCriterion yang dilatih pada
+    gradient dan hessian dari loss. Raw score data training (dan validasi) disimpan
+    dan di-update setiap iterasi, sehingga tidak ada prediksi ulang seluruh tree.
+    """
+    def __init__(
+        self,
+        n_estimators,
+        learning_rate,
+        max_depth,
+        sample_leaf_min,
+        max_leaf_nodes,
+        max_bins,
+        l2_regularization,
+        n_iter_no_change,
+        validation_fraction,
+        tol,
+        random_state
+    ):
+        self.n_estimators = n_estimators
+        self.learning_rate = learning_rate
+        self.max_depth = max_depth
+        self.sample_leaf_min = sample_leaf_min
+        self.max_leaf_nodes = max_leaf_nodes
+        self.max_bins = max_bins
+        self.l2_regularization = l2_regularization
+        self.n_iter_no_change = n_iter_no_change
+        self.validation_fraction = validation_fraction
+        self.tol = tol
+        self.random_state = random_state
+
+    def fit(self, X, y, X_val=None, y_val=None, sample_weight=None):
+        """
+        Fungsi yang digunakan untuk melatih model Gradient Boosting.
+
+        Fitur dikuantisasi satu kali dan kode bin yang sama digunakan oleh seluruh tree.
+        Jika n_iter_no_change diisi, training berhenti saat loss validasi tidak membaik
+        selama n_iter_no_change iterasi dan model dipotong pada iterasi terbaik.
+
+        Args:
+            X: Data fitur.
+            y: Data target.
+            X_val: Data fitur validasi. Default: validation_fraction dari data training.
+            y_val: Data target validasi.
+            sample_weight: Bobot setiap sample training. Default: None (bobot 1).
+        """
+        X = np.asarray(X)
+        y = np.ravel(y)
+        w = None if sample_weight is None else np.asarray(sample_weight, dtype=np.float64)
+        if self.n_estimators < 1:
+            raise ValueError("n_estimators harus lebih besar atau sama dengan 1")
+        if self.max_bins is None or not 2 <= self.max_bins <= 65536:
+            raise ValueError("max_bins harus berada di antara 2 dan 65536")
+        self._init_target(y)
+
+        # Menyiapkan data validasi untuk early stopping
+        if X_val is None and self.n_iter_no_change is not None:
+            rng = np.random.default_rng(self.random_state)
+            order = rng.permutation(len(X))
+            n_val = max(int(len(X) * self.validation_fraction), 1)
+            X_val, y_val = X[order[:n_val]], y[order[:n_val]]
+            X, y = X[order[n_val:]], y[order[n_val:]]
+            if w is not None:
+                w = w[order[n_val:]]
+        Y = self._encode_target(y)
+        Y_val = None if X_val is None else self._encode_target(np.ravel(y_val))
+        if X_val is not None:
+            X_val = np.asarray(X_val)
+
+        self.n_samples, self.n_fitur = X.shape
+
+        # Kuantisasi fitur dilakukan satu kali untuk seluruh iterasi
+        self.bin_thresholds_ = [_bin_thresholds(X[:, fitur_i], self.max_bins)
+                                for fitur_i in range(self.n_fitur)]
+        X_binned = _bin_data(X, self.bin_thresholds_)
+
+        # Raw score awal, di-update secara incremental setiap iterasi
+        self.init_raw_ = self._init_raw(Y, w)
+        raw = np.tile(self.init_raw_, (len(X), 1))
+        raw_val = None if X_val is None else np.tile(self.init_raw_, (len(X_val), 1))
+
+        criterion = NewtonCriterion(self.l2_regularization)
+        self.estimators_ = []
+        self.validation_loss_ = []
+        best_loss, best_iter = np.inf, 0
+        for iteration in range(self.n_estimators):
+            grad, hess = self._gradients(raw, Y)
+
+            trees = []
+            for k in range(raw.shape[1]):
+                tree = DecisionTreeRegressor(criteria = criterion,
+                                             max_depth = self.max_depth,
+                                             sample_leaf_min = self.sample_leaf_min,
+                                             max_leaf_nodes = self.max_leaf_nodes,
+                                             max_bins = self.max_bins)
+                tree._fit(X_binned, np.column_stack((grad[:, k], hess[:, k])),
+                          bin_thresholds = self.bin_thresholds_,
+                          sample_weight = w)
+                trees.append(tree)
+
+                # Update raw score hanya dengan nilai leaf tree baru
+                raw[:, k] += self.learning_rate * tree.predict(X)
+                if raw_val is not None:
+                    raw_val[:, k] += self.learning_rate * tree.predict(X_val)
+            self.estimators_.append(trees)
+
+            if raw_val is None:
+                continue
+
+            # Early stopping berdasarkan loss validasi
+            loss = self._loss(raw_val, Y_val)
+            self.validation_loss_.append(loss)
+            if loss < best_loss - self.tol:
+                best_loss, best_iter = loss, iteration
+            elif self.n_iter_no_change is not None and iteration - best_iter >= self.n_iter_no_change:
+                break
+
+        if self.n_iter_no_change is not None:
+            del self.estimators_[best_iter+1:]
+        self.n_iter_ = len(self.estimators_)
+
+        # Seluruh tree digabung agar prediksi dilakukan sekaligus
+        self._stacked, self._roots = _stack_trees([tree.tree_ for trees in self.estimators_
+                                                   for tree in trees])
+
+    def _init_target(self, y):
+        # Informasi target tambahan (misal classes_) disiapkan oleh subclass
+        pass
+
+    def _raw_predict(self, X):
+        """
+        Fungsi yang digunakan untuk menghitung raw score dari seluruh tree.
+
+        Args:
+            X: Data fitur.
+
+        Returns:
+            numpy.ndarray: Raw score berbentuk (n_samples, n_outputs).
+        """
+        X = np.asarray(X)
+        n_rows = len(X)
+        n_outputs = len(self.init_raw_)
+
+        # Pasangan (tree, baris) diturunkan bersama-sama pada tree gabungan
+        rows = np.tile(np.arange(n_rows), len(self._roots))
+        node = np.repeat(self._roots, n_rows)
+        leaves = self._stacked._descend(X, rows, node)
+        values = self._stacked.value[leaves].reshape(self.n_iter_, n_outputs, n_rows)
+
+        return self.init_raw_ + self.learning_rate * values.sum(axis=0).T
+
+class GradientBoostingRegressor(GradientBoostingBase):
+    """
+    Gradient Boosting Regressor dengan loss squared error.
+
+    Args:
+        n_estimators (int, optional): Jumlah iterasi boosting. Default: 100.
+        learning_rate (float, optional): Faktor pengali nilai leaf setiap tree. Default: 0.1.
+        max_depth (int or None, optional): Kedalaman maksimum setiap tree. Default: 3.
+        sample_leaf_min (int, optional): Jumlah minimum sampel yang diperlukan pada leaf node. Default: 20.
+        max_leaf_nodes (int or None, optional): Jumlah leaf maksimal setiap tree. Default: None.
+        max_bins (int, optional): Jumlah bin maksimal tiap fitur. Default: 255.
+        l2_regularization (float, optional): Regularisasi L2 nilai leaf. Default: 0.0.
+        n_iter_no_change (int or None, optional): Jumlah iterasi tanpa perbaikan loss validasi sebelum training dihentikan. None berarti tanpa early stopping. Default: None.
+        validation_fraction (float, optional): Proporsi data training untuk validasi jika X_val tidak diberikan. Default: 0.1.
+        tol (float, optional): Perbaikan loss validasi minimal. Default: 1e-7.
+        random_state (int or None, optional): Seed pembagian data validasi. Default: None.
+
+    """
+    def __init__(
+        self,
+        n_estimators = 100,
+        learning_rate = 0.1,
+        max_depth = 3,
+        sample_leaf_min = 20,
+        max_leaf_nodes = None,
+        max_bins = 255,
+        l2_regularization = 0.0,
+        n_iter_no_change = None,
+        validation_fraction = 0.1,
+        tol = 1e-7,
+        random_state = None
+    ):
+        super().__init__(
+            n_estimators = n_estimators,
+            learning_rate = learning_rate,
+            max_depth = max_depth,
+            sample_leaf_min = sample_leaf_min,
+            max_leaf_nodes = max_leaf_nodes,
+            max_bins = max_bins,
+            l2_regularization = l2_regularization,
+            n_iter_no_change = n_iter_no_change,
+            validation_fraction = validation_fraction,
+            tol = tol,
+            random_state = random_state
+        )
+
+    def _encode_target(self, y):
+        return y.astype(float)[:, None]
+
+    def _init_raw(self, Y, w):
+        return np.average(Y, axis=0, weights=w)
+
+    def _gradients(self, raw, Y):
+        # Squared error 0.5 * (raw - y)^2
+        return raw - Y, np.ones_like(raw)
+
+    def _loss(self, raw, Y):
+        return float(np.mean((raw - Y) ** 2))
+
+    def predict(self, X):
+        """
+        Melakukan prediksi nilai target.
+
+        Args:
+            X (array-like): Data fitur.
+
+        Returns:
+            numpy.ndarray: Nilai target yang diprediksi.
+        """
+        return self._raw_predict(X)[:, 0]
+
+class GradientBoostingClassifier(GradientBoostingBase):
+    """
+    Gradient Boosting Classifier dengan loss log loss (binary atau multiclass softmax,
+    satu tree per class pada setiap iterasi).
+
+    Args:
+        n_estimators (int, optional): Jumlah iterasi boosting. Default: 100.
+        learning_rate (float, optional): Faktor pengali nilai leaf setiap tree. Default: 0.1.
+        max_depth (int or None, optional): Kedalaman maksimum setiap tree. Default: 3.
+        sample_leaf_min (int, optional): Jumlah minimum sampel yang diperlukan pada leaf node. Default: 20.
+        max_leaf_nodes (int or None, optional): Jumlah leaf maksimal setiap tree. Default: None.
+        max_bins (int, optional): Jumlah bin maksimal tiap fitur. Default: 255.
+        l2_regularization (float, optional): Regularisasi L2 nilai leaf. Default: 0.0.
+        n_iter_no_change (int or None, optional): Jumlah iterasi tanpa perbaikan loss validasi sebelum training dihentikan. None berarti tanpa early stopping. Default: None.
+        validation_fraction (float, optional): Proporsi data training untuk validasi jika X_val tidak diberikan. Default: 0.1.
+        tol (float, optional): Perbaikan loss validasi minimal. Default: 1e-7.
+        random_state (int or None, optional): Seed pembagian data validasi. Default: None.
+
+    """
+    def __init__(
+        self,
+        n_estimators = 100,
+        learning_rate = 0.1,
+        max_depth = 3,
+        sample_leaf_min = 20,
+        max_leaf_nodes = None,
+        max_bins = 255,
+        l2_regularization = 0.0,
+        n_iter_no_change = None,
+        validation_fraction = 0.1,
+        tol = 1e-7,
+        random_state = None
+    ):
+        super().__init__(
+            n_estimators = n_estimators,
+            learning_rate = learning_rate,
+            max_depth = max_depth,
+            sample_leaf_min = sample_leaf_min,
+            max_leaf_nodes = max_leaf_nodes,
+            max_bins = max_bins,
+            l2_regularization = l2_regularization,
+            n_iter_no_change = n_iter_no_change,
+            validation_fraction = validation_fraction,
+            tol = tol,
+            random_state = random_state
+        )
+
+    def _init_target(self, y):
+        self.classes_ = np.unique(y)
+
+    def _encode_target(self, y):
+        codes = np.searchsorted(self.classes_, y)
+
+        # Binary: satu output (log odds class kedua), multiclass: satu output per class
+        if len(self.classes_) <= 2:
+            return (codes == 1).astype(float)[:, None]
+        return (codes[:, None] == np.arange(len(self.classes_))).astype(float)
+
+    def _init_raw(self, Y, w):
+        # Log odds (binary) atau log prior (multiclass) dari proporsi class
+        p = np.clip(np.average(Y, axis=0, weights=w), 1e-15, 1 - 1e-15)
+        if Y.shape[1] == 1:
+            return np.log(p / (1 - p))
+        return np.log(p)
+
+    def _proba(self, raw):
+        if raw.shape[1] == 1:
+            p = _sigmoid(raw)
+            return np.hstack((1 - p, p))
+        return _softmax(raw)
+
+    def _gradients(self, raw, Y):
+        p = _sigmoid(raw) if raw.shape[1] == 1 else _softmax(raw)
+        return p - Y, np.maximum(p * (1 - p), 1e-16)
+
+    def _loss(self, raw, Y):
+        proba = np.clip(self._proba(raw), 1e-15, 1)
+        if Y.shape[1] == 1:
+            Y = np.hstack((1 - Y, Y))
+        return float(-np.mean(np.sum(Y * np.log(proba), axis=1)))
+
+    def predict_proba(self, X):
+        """
+        Melakukan prediksi probabilitas setiap class.
+
+        Args:
+            X (array-like): Data fitur.
+
+        Returns:
+            numpy.ndarray: Probabilitas berbentuk (n_samples, n_classes), urutan sesuai classes_.
+        """
+        return self._proba(self._raw_predict(X))
+
+    def predict(self, X):
+        """
+        Melakukan prediksi class dengan probabilitas terbesar.
+
+        Args:
+            X (array-like): Data fitur.
+
+        Returns:
+            numpy.ndarray: Class yang diprediksi.
+        """
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
@@ -0,0 +1,7 @@
+from ._batcher import Histogram
+from ._batcher import MicroBatchPredictor
+
+__all__ = [
+    "Histogram",
+    "MicroBatchPredictor"
+]
@@ -0,0 +1,251 @@
+# Layanan prediksi asyncio yang menggabungkan request satu baris menjadi micro-batch
+
+import asyncio
+import time
+
+import numpy as np
+
+'============================================================================================================'
+# Batas atas bucket histogram latency (detik), bucket terakhir berisi sisanya (inf)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# Batas atas bucket histogram ukuran batch
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+'============================================================================================================'
+
+class Histogram:
+    """
+    Histogram dengan bucket tetap untuk mencatat latency atau ukuran batch,
+
+        - buckets   = Batas atas setiap bucket (terurut), ditambah satu bucket inf
+    """
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = np.zeros(len(self.buckets) + 1, dtype=np.int64)
+        self.total = 0.0
+
+    def record(self, values):
+        """
+        Mencatat satu atau beberapa nilai.
+
+        Args:
+            values (float or array-like): Nilai yang dicatat.
+        """
+        values = np.atleast_1d(np.asarray(values, dtype=np.float64))
+        index = np.searchsorted(self.buckets, values, side="left")
+        self.counts += np.bincount(index, minlength=len(self.counts))
+        self.total += float(values.sum())
+
+    @property
+    def count(self):
+        return int(self.counts.sum())
+
+    def quantile(self, q):
+        """
+        Memperkirakan quantile dari batas atas bucket.
+
+        Args:
+            q (float): Quantile di antara 0 dan 1.
+
+        Returns:
+            float: Batas atas bucket yang memuat quantile q (nan jika kosong).
+        """
+        if self.count == 0:
+            return float("nan")
+        index = int(np.searchsorted(np.cumsum(self.counts), q * self.count, side="left"))
+        return self.buckets[index] if index < len(self.buckets) else float("inf")
+
+    def snapshot(self):
+        """Mengembalikan isi histogram dalam bentuk dict."""
+        return {
+            "buckets": list(self.buckets) + [float("inf")],
+            "counts": self.counts.tolist(),
+            "count": self.count,
+            "sum": self.total
+        }
+
+class MicroBatchPredictor:
+    """
+    Layanan prediksi asyncio untuk request satu baris,
+
+        - model             = Model yang sudah di-fit (memiliki method prediksi untuk batch)
+        - max_batch_size    = Jumlah request maksimal dalam satu batch
+        - max_wait          = Waktu tunggu maksimal (detik) sejak request pertama batch diterima
+        - method            = Nama method prediksi model (misal "predict" atau "apply")
+        - executor          = Executor untuk menjalankan prediksi batch (default: None, dijalankan
+                              langsung pada event loop)
+
+    Request dikumpulkan pada queue dan digabung menjadi satu batch hingga max_batch_size
+    request atau max_wait detik, lalu diprediksi dengan satu pemanggilan method model.
+    Hasil setiap baris dikembalikan melalui future milik pemanggil masing-masing.
+
+    Contoh:
+        async with MicroBatchPredictor(model, max_batch_size=64, max_wait=0.002) as service:
+            y = await service.predict(x)
+    """
+    def __init__(self, model, max_batch_size=64, max_wait=0.002, method="predict", executor=None):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size harus lebih besar atau sama dengan 1")
+        if max_wait < 0:
+            raise ValueError("max_wait tidak boleh negatif")
+
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.method = method
+        self.executor = executor
+
+        self.n_requests = 0
+        self.n_batches = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.batch_size = Histogram(BATCH_SIZE_BUCKETS)
+
+        self._predict_batch = getattr(model, method)
+        self._n_fitur = getattr(model, "n_fitur", None)
+        self._queue = None
+        self._worker = None
+
+    @property
+    def queue_depth(self):
+        """Jumlah request yang menunggu di queue."""
+        return 0 if self._queue is None else self._queue.qsize()
+
+    @property
+    def running(self):
+        return self._worker is not None and not self._worker.done()
+
+    async def start(self):
+        """Menjalankan worker yang mengumpulkan dan memprediksi batch."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Menghentikan worker setelah seluruh request pada queue selesai diprediksi."""
+        if not self.running:
+            return
+        await self._queue.put(None)
+        await self._worker
+        self._worker = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.stop()
+
+    async def predict(self, x):
+        """
+        Memprediksi satu baris data.
+
+        Args:
+            x (array-like): Satu baris data fitur.
+
+        Returns:
+            Any: Hasil prediksi baris tersebut.
+        """
+        if not self.running:
+            raise RuntimeError("MicroBatchPredictor belum dijalankan (gunakan start() atau async with)")
+
+        # Validasi dilakukan per request agar satu baris tidak menggagalkan satu batch
+        x = np.asarray(x, dtype=np.float64).ravel()
+        if self._n_fitur is not None and len(x) != self._n_fitur:
+            raise ValueError(f"x harus memiliki {self._n_fitur} fitur, bukan {len(x)}")
+
+        future = asyncio.get_running_loop().create_future()
+        self.n_requests += 1
+        await self._queue.put((x, future, time.perf_counter()))
+
+        return await future
+
+    async def _run(self):
+        """Loop worker: mengambil batch dari queue lalu memprediksinya."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+
+            # Mengumpulkan request hingga batch penuh atau max_wait habis
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    item = self._queue.get_nowait()
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._score(batch)
+
+        # Request yang masih tersisa setelah sinyal berhenti tetap diprediksi
+        remaining = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not None:
+                remaining.append(item)
+        for start in range(0, len(remaining), self.max_batch_size):
+            await self._score(remaining[start:start + self.max_batch_size])
+
+    async def _score(self, batch):
+        """
+        Memprediksi satu batch dan mengisi future setiap request.
+
+        Args:
+            batch (list): Daftar tuple (x, future, waktu request).
+        """
+        # Penggabungan baris juga di dalam try: baris dengan panjang berbeda (model tanpa
+        # n_fitur) hanya menggagalkan batch ini, bukan worker
+        try:
+            X = np.vstack([x for x, _, _ in batch])
+            if self.executor is None:
+                y = self._predict_batch(X)
+            else:
+                y = await asyncio.get_running_loop().run_in_executor(self.executor,
+                                                                     self._predict_batch, X)
+        except Exception as error:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        time_end = time.perf_counter()
+        self.n_batches += 1
+        self.batch_size.record(len(batch))
+        self.latency.record([time_end - time_start for _, _, time_start in batch])
+
+        # Future yang sudah dibatalkan pemanggil dilewati
+        for i, (_, future, _) in enumerate(batch):
+            if not future.done():
+                future.set_result(y[i])
+
+    def stats(self):
+        """
+        Mengembalikan statistik layanan.
+
+        Returns:
+            dict: queue_depth, n_requests, n_batches, latency (histogram detik, p50, p99)
+            dan batch_size (histogram).
+        """
+        return {
+            "queue_depth": self.queue_depth,
+            "n_requests": self.n_requests,
+            "n_batches": self.n_batches,
+            "latency": dict(self.latency.snapshot(),
+                            p50=self.latency.quantile(0.5),
+                            p99=self.latency.quantile(0.99)),
+            "batch_size": self.batch_size.snapshot()
+        }
@@ -1,8 +1,14 @@
 from ._classes import DecisionTreeClassifier
 from ._classes import DecisionTreeRegressor
+from ._dataset import TreeDataset
+from ._stats import FitStats
+from ._streaming import ChunkedData
 
 __all__ = [
     "DecisionTreeClassifier",
-    "DecisionTreeRegressor"
+    "DecisionTreeRegressor",
+    "ChunkedData",
+    "FitStats",
+    "TreeDataset"
 ]
 
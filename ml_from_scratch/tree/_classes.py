@@ -1,53 +1,63 @@
+import copy
+import functools
+import heapq
+import inspect
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from . import _criteria
+from ._compile import CompiledTree
+from ._dataset import TreeDataset
+from ._partial import _PartialHistory
+from ._serialize import read_arrays
+from ._serialize import write_arrays
+from ._sparse import _SparseMatrix
+from ._sparse import _is_sparse
+from ._stats import FitStats
+from ._streaming import ChunkedData
+from ._streaming import _scan
+from ._tree import TREE_LEAF
+from ._tree import FlatTree
+from ._tree import _NodeList
 
 '============================================================================================================'
 CRITERIA_CLF = {
-    "gini": _criteria.Gini,
-    "log_loss": _criteria.Log_Loss,
-    "entropy": _criteria.Entropy
+    "gini": _criteria.GiniCriterion,
+    "log_loss": _criteria.LogLossCriterion,
+    "entropy": _criteria.EntropyCriterion
 }
 
 CRITERIA_REG = {
-    "squared_error": _criteria.MSE,
-    "absolute_error": _criteria.MAE
+    "squared_error": _criteria.MSECriterion,
+    "absolute_error": _criteria.MAECriterion
 }
 
-'============================================================================================================'
+# Node dengan sample lebih sedikit dari ini dicari split-nya secara serial (n_jobs > 1)
+PARALLEL_SPLIT_MIN_SAMPLES = 5000
 
-class Tree:
-    """
-    Fungsi yang digunakan untuk melakukan inisiasi Tree,
-
-        - thresh        = Threshold untuk membagi region
-        - fitur         = Fitur data untuk mendefinisikan root
-        - val           = Nilai dari node
-        - child_left    = Hasil split region children bagian kiri
-        - child_right   = Hasil split region children bagian kanan
-        - impurity      = Nilai impuritas dari data dalam region
-        - leaf          = Apakah node tersebut leaf?
-        - n_samples     = Total sample yang digunakan
-    """
-    def __init__(
-        self,
-        thresh=None,
-        fitur=None,
-        val=None,
-        child_left=None,
-        child_right=None,
-        impurity=None,
-        leaf=None,
-        n_samples=None
-    ):
-        self.thresh = thresh
-        self.fitur = fitur
-        self.val = val
-        self.child_left = child_left
-        self.child_right = child_right
-        self.impurity =  impurity
-        self.leaf = leaf
-        self.n_samples = n_samples
+# Kedalaman di mana subtree mulai dikerjakan oleh worker (n_jobs > 1)
+PARALLEL_SUBTREE_DEPTH = 3
+
+# Jumlah baris maksimal yang diproses sekaligus saat mengakumulasikan histogram node (partial_fit)
+PARTIAL_CHUNK_SIZE = 65536
+
+# Histogram node hanya disimpan oleh partial_fit untuk node dengan jumlah sample minimal
+# PARTIAL_HIST_SAMPLES_PER_BIN * n_bins, subtree node yang lebih kecil di-grow ulang dari history
+PARTIAL_HIST_SAMPLES_PER_BIN = 8
+
+# Proporsi baris minimal pada node agar urutan fitur diambil dari presort TreeDataset
+# (menyaring index terurut O(n) lebih cepat dari argsort O(m log m) untuk node besar)
+PRESORT_MIN_FRACTION = 0.1
+
+# Proporsi baris minimal pada node agar fitur sparse di-sweep dengan blok zero (hanya
+# elemen non-zero kolom yang dibaca), node yang lebih kecil menggunakan binary search
+SPARSE_BLOCK_MIN_FRACTION = 0.1
+
+'============================================================================================================'
 
 def _split(data):
     """
@@ -77,46 +87,122 @@ def _split(data):
     # Membuat split untuk mendapatkan region
     for i in range(n_shape-1):
         nilai_1 = val_unique[i]
-        nilai_1 = val_unique[i+1]
+        nilai_2 = val_unique[i+1]
 
         # Nilai threshold berada di tengah data nilai_1 dan nilai_2    
-        thresh[i] = 0.5*(nilai_1 + nilai_1)
+        thresh[i] = 0.5*(nilai_1 + nilai_2)
     
     return thresh
 
-def _split_data(data, fitur, thresh):
+def _as_array(X):
     """
-    Memisahkan data menjadi dua subset berdasarkan threshold pada fitur yang diberikan.
+    Mengubah input menjadi numpy.ndarray, atau _SparseMatrix untuk input sparse CSR/CSC.
 
     Args:
-        data (numpy.ndarray): Data yang akan dipisahkan.
-        feature (int): Indeks fitur yang digunakan untuk pemisahan.
-        threshold (float): Nilai threshold yang digunakan untuk membagi data.
+        X (array-like or sparse matrix): Data fitur.
 
     Returns:
-        tuple: Tuple berisi dua subset data yang telah dipisahkan.
+        numpy.ndarray or _SparseMatrix: Data fitur tanpa densifikasi.
+    """
+    if isinstance(X, _SparseMatrix):
+        return X
+    if _is_sparse(X):
+        return _SparseMatrix(X)
+    return np.asarray(X)
 
+def _partition(samples, start, end, data, fitur, thresh):
     """
-    # Membagi data berdasarkan threshold
-    data_thresh = data[:, fitur] <= thresh
-    left_data = data[data_thresh]
-    right_data = data[~data_thresh]
+    Mempartisi index sample[start:end] secara in-place berdasarkan threshold pada fitur yang diberikan.
+
+    Index dengan nilai fitur <= threshold dipindahkan ke bagian kiri (urutan tetap dijaga),
+    sehingga child kiri menempati samples[start:mid] dan child kanan samples[mid:end].
 
-    return left_data, right_data
+    Args:
+        samples (numpy.ndarray): Array index sample yang dibagi oleh seluruh node.
+        start (int): Posisi awal region node.
+        end (int): Posisi akhir region node.
+        data (numpy.ndarray): Data fitur (read-only).
+        fitur (int): Indeks fitur yang digunakan untuk pemisahan.
+        thresh (float): Nilai threshold yang digunakan untuk membagi data.
+
+    Returns:
+        int: Posisi mid, batas antara child kiri dan child kanan.
 
-def _calculate_majority_vote(y):
+    """
+    # Membagi index berdasarkan threshold
+    node_samples = samples[start:end]
+    data_thresh = data[node_samples, fitur] <= thresh
+    n_left = np.count_nonzero(data_thresh)
+
+    samples[start:end] = np.concatenate((node_samples[data_thresh],
+                                         node_samples[~data_thresh]))
+
+    return start + n_left
+
+def _bin_thresholds(data, max_bins):
+    """
+    Mencari threshold bin dari sebuah fitur untuk training berbasis histogram.
+
+    Args:
+        data (array-like): Data satu fitur.
+        max_bins (int): Jumlah bin maksimal.
+
+    Returns:
+        numpy.ndarray: Threshold bin yang terurut (maksimal max_bins-1 nilai).
+    """
+    val_unique = np.unique(data)
+
+    # Apabila nilai unik cukup sedikit, threshold sama dengan hasil _split
+    if len(val_unique) <= max_bins:
+        return _split(val_unique)
+
+    # Jika tidak, gunakan quantile sebagai batas bin
+    quantiles = np.linspace(0, 1, max_bins + 1)[1:-1]
+    return np.unique(np.quantile(data, quantiles))
+
+def _bin_data(data, thresholds):
+    """
+    Mengubah data menjadi kode bin berdasarkan threshold tiap fitur.
+
+    Kode bin b memenuhi (kode <= b) jika dan hanya jika (nilai <= thresholds[b]).
+
+    Args:
+        data (numpy.ndarray): Data fitur.
+        thresholds (list): Threshold bin untuk setiap fitur.
+
+    Returns:
+        numpy.ndarray: Kode bin bertipe uint8 atau uint16.
+    """
+    n_bins = max(len(thresh) for thresh in thresholds) + 1
+    dtype = np.uint8 if n_bins <= 256 else np.uint16
+
+    data_binned = np.empty(data.shape, dtype=dtype)
+    for fitur_i, thresh in enumerate(thresholds):
+        data_binned[:, fitur_i] = np.searchsorted(thresh, data[:, fitur_i], side="left")
+
+    return data_binned
+
+def _calculate_majority_vote(y, sample_weight=None, classes=None):
     """
     Menghitung majority vote dari array target (y).
 
     Args:
-        y (array-like): Array target yang berisi label kelas.
+        y (array-like): Array target yang berisi label kelas (atau kode class jika classes diisi).
+        sample_weight (array-like, optional): Bobot setiap sample. Default: None (bobot 1).
+        classes (array-like, optional): Label class untuk setiap kode class. Default: None.
 
     Returns:
         Any: Label kelas hasil majority vote.
 
     """
-    # Melakukan ekstraksi terhadap output
-    vals, counts = np.unique(y, return_counts = True)
+    if classes is not None:
+        # y berupa kode class, vote dihitung langsung dengan bincount
+        counts = np.bincount(y, weights = sample_weight, minlength = len(classes))
+        return classes[np.argmax(counts)]
+
+    # Melakukan ekstraksi terhadap output (jumlah bobot setiap class)
+    vals, inverse = np.unique(y, return_inverse = True)
+    counts = np.bincount(np.ravel(inverse), weights = sample_weight)
 
     # Menghitung majority vote
     max_ind = np.argmax(counts)
@@ -124,19 +210,20 @@ def _calculate_majority_vote(y):
 
     return y_pred
 
-def _calculate_average_vote(y):
+def _calculate_average_vote(y, sample_weight=None):
     """
     Menghitung rata-rata dari array target (y).
 
     Args:
         y (array-like): Array target yang berisi label kelas.
+        sample_weight (array-like, optional): Bobot setiap sample. Default: None (bobot 1).
 
     Returns:
         float: Rata-rata label kelas.
 
     """
-    # Menghitung rata-rata
-    y_pred = np.mean(y)
+    # Menghitung rata-rata (berbobot)
+    y_pred = np.average(y, weights = sample_weight)
     return y_pred
 
 def _to_string(tree, indent="| "):
@@ -167,6 +254,47 @@ def _to_string(tree, indent="| "):
     
     return text_to_print
 
+def _criterion_to_meta(criterion):
+    """
+    Mengubah objek Criterion menjadi dict yang dapat di-serialize ke JSON (nama class
+    dan argumen __init__), untuk disimpan oleh save().
+
+    Args:
+        criterion (Criterion): Objek criteria.
+
+    Returns:
+        dict: Nama class criteria dan argumennya.
+    """
+    name = type(criterion).__name__
+    if getattr(_criteria, name, None) is not type(criterion):
+        raise ValueError(f"criteria {name} tidak dapat disimpan, hanya criteria bawaan yang didukung")
+
+    params = {}
+    for param in inspect.signature(type(criterion).__init__).parameters:
+        if param != "self":
+            if not hasattr(criterion, param):
+                raise ValueError(f"criteria {name} tidak dapat disimpan, argumen {param} tidak tersimpan")
+            value = getattr(criterion, param)
+            params[param] = value.item() if hasattr(value, "item") else value
+
+    return {"criterion": name, "params": params}
+
+def _criterion_from_meta(meta):
+    """
+    Membuat ulang objek Criterion dari hasil _criterion_to_meta.
+
+    Args:
+        meta (dict): Nama class criteria dan argumennya.
+
+    Returns:
+        Criterion: Objek criteria.
+    """
+    criterion_cls = getattr(_criteria, meta["criterion"], None)
+    if not (isinstance(criterion_cls, type) and issubclass(criterion_cls, _criteria.Criterion)):
+        raise ValueError(f"criteria {meta['criterion']} tidak dikenal")
+
+    return criterion_cls(**meta["params"])
+
 class DecisionTreeBase:
     """
     Fungsi yang digunakan untuk melakukan Base Decision Tree untuk Regressor & Classifier,
@@ -177,6 +305,13 @@ class DecisionTreeBase:
         - sample_split_min          = Jumlah sample split minimal untuk split node
         - sample_leaf_min           = Jumlah sample leaf minimal untuk split node
         - alpa                      = Cost function tree pruning
+        - max_bins                  = Jumlah bin maksimal tiap fitur untuk training berbasis histogram
+        - n_jobs                    = Jumlah thread untuk pencarian split dan pengembangan subtree
+        - max_leaf_nodes            = Jumlah leaf maksimal, tree dikembangkan secara best-first
+        - fit_stats                 = Apakah statistik proses fit dicatat pada fit_stats_
+        - max_features              = Jumlah fitur yang dipilih acak untuk dicari split-nya pada setiap node
+        - random_state              = Seed untuk pemilihan fitur acak (max_features)
+        - cache_size                = Jumlah baris maksimal yang leaf-nya disimpan (LRU) untuk apply/predict
 
     """
     def __init__(
@@ -186,7 +321,14 @@ class DecisionTreeBase:
         impurity_reduction_min,
         sample_split_min,
         sample_leaf_min,
-        alpa = 0.0
+        alpa = 0.0,
+        max_bins = None,
+        n_jobs = None,
+        max_leaf_nodes = None,
+        fit_stats = False,
+        max_features = None,
+        random_state = None,
+        cache_size = None
     ):
         self.max_depth = max_depth
         self.criteria = criteria
@@ -194,255 +336,1832 @@ class DecisionTreeBase:
         self.sample_split_min = sample_split_min
         self.sample_leaf_min = sample_leaf_min
         self.alpa = alpa
-
-    def _most_split(self, X, y):
+        self.max_bins = max_bins
+        self.n_jobs = n_jobs
+        self.max_leaf_nodes = max_leaf_nodes
+        self.fit_stats = fit_stats
+        self.max_features = max_features
+        self.random_state = random_state
+        self.cache_size = cache_size
+
+    @property
+    def tree_(self):
+        return self._tree
+
+    @tree_.setter
+    def tree_(self, tree):
+        # Hasil compile(), pruning path dan cache leaf tidak berlaku lagi jika tree berubah
+        self._tree = tree
+        self._compiled = None
+        self._pruning_path = None
+        self._leaf_cache = OrderedDict()
+
+    def _most_split(self, samples, parallel=False, features=None):
         """
         Fungsi yang digunakan untuk mencari fitur dan threshold dengan split paling optimal.
 
+        Setiap fitur diurutkan satu kali, kemudian seluruh threshold di-sweep dari kiri
+        ke kanan menggunakan statistik kumulatif dari criteria sehingga biaya per fitur
+        menjadi O(n log n).
+
         Args:
-            X: Data fitur.
-            y: Data target.
+            samples: Index sample pada node.
+            parallel: Apakah fitur boleh dikerjakan paralel oleh worker.
+            features: Fitur yang dicari split-nya (default: seluruh fitur).
 
         Returns:
             most_feature: Fitur dengan split paling optimal.
             most_thresh: Threshold dengan split paling optimal.
+            most_gain: Penurunan impurity dari split paling optimal.
         """
         # Butuh minimal sample_split_min untuk split node
+        y = self._y[samples]
+        w = self._sample_weight(samples)
         n_shape = len(y)
-        if n_shape < self.sample_split_min:
-            return None, None
-        
+        if n_shape < self.sample_split_min or n_shape < 2:
+            return None, None, 0.0
+
         # Inialisasi Decision Tree
-        parent_data = np.column_stack((X, y))
+        I_parent = self._eval_impurity(y, w)
+
+        # Jumlah kemunculan tiap baris pada node, untuk mengambil urutan dari presort
+        counts = None
+        if self._sorted_index is not None and n_shape >= PRESORT_MIN_FRACTION * len(self._X):
+            counts = np.bincount(samples, minlength=len(self._X))
+
+        # Fitur sparse pada node besar di-sweep dari elemen non-zero ditambah satu blok zero
+        sparse_block = isinstance(self._X, _SparseMatrix) and self._criterion.additive \
+                       and n_shape >= SPARSE_BLOCK_MIN_FRACTION * len(self._X)
+        if sparse_block:
+            counts = np.bincount(samples, minlength=len(self._X))
+            stats_total = self._criterion.sample_stats(y, w).sum(axis=0)
+
+        # Mencari split terbaik tiap fitur (paralel untuk node yang besar)
+        if features is None:
+            features = range(self.n_fitur)
+
+        def most_split_fitur(fitur_i):
+            if sparse_block:
+                return self._most_split_feature_sparse(counts, stats_total, fitur_i, I_parent)
+            return self._most_split_feature(samples, y, w, fitur_i, I_parent, counts)
+
+        if parallel and n_shape >= PARALLEL_SPLIT_MIN_SAMPLES:
+            results = list(self._executor.map(most_split_fitur, features))
+        else:
+            results = [most_split_fitur(fitur_i) for fitur_i in features]
+
+        # Melakukan update terhadap most gain sesuai urutan fitur
         most_gain = 0.0
         most_feature, most_thresh = None, None
-        for fitur_i in range(self.n_fitur):
-            # Mengambil data dari fitur yang terpilih
-            X_i = X[:, fitur_i]
-
-            # Mencari threshold yang mungkin untuk splitting
-            thresh = _split(data = X_i)
-
-            # Melakukan iterasi untuk mencari spliting terbaik
-            for i in range(len(thresh)):
-                # Melakukan split pada root parent
-                child_left, child_right = _split_data(data = parent_data,
-                                                      fitur = fitur_i,
-                                                      thresh = thresh[i])
-                  
-                # Mengambil output dari children
-                y_left = child_left[:, self.n_fitur:]
-                y_right = child_right[:, self.n_fitur:]
-            
-                # Menghitung penurunan impurity
-                kond_1 = len(y_left) >= self.sample_leaf_min
-                kond_2 = len(y_right) >= self.sample_leaf_min
-            
-                # Melakukan update terhadap most gain enggunakan calculate reduction impurity
-                if kond_1 and kond_2:
-                    present_gain = self._calculate_reduction_impurity(y,
-                                                                    y_left,
-                                                                    y_right)
-                    if present_gain > most_gain:
-                        most_gain = present_gain
-                        most_feature = fitur_i 
-                        most_thresh = thresh[i]
-
-            # Return most_feature dan most threshold
+        for fitur_i, (present_gain, present_thresh) in zip(features, results):
+            if present_gain > most_gain:
+                most_gain = present_gain
+                most_feature = fitur_i
+                most_thresh = present_thresh
+
+        # Return most_feature dan most threshold
         if most_gain >= self.impurity_reduction_min:
-            return most_feature, most_thresh
+            return most_feature, most_thresh, most_gain
         
         else:
-            return None, None
+            return None, None, 0.0
+
+    def _most_split_feature(self, samples, y, w, fitur_i, I_parent, counts=None):
+        """
+        Fungsi yang digunakan untuk mencari threshold dengan split paling optimal pada satu fitur.
+
+        Args:
+            samples: Index sample pada node.
+            y: Data target pada node.
+            w: Bobot sample pada node (None berarti bobot 1).
+            fitur_i: Fitur yang dicari split-nya.
+            I_parent: Impurity node.
+            counts: Jumlah kemunculan tiap baris X pada node. Jika diisi, urutan diambil
+                dari presort TreeDataset tanpa argsort (default: None).
+
+        Returns:
+            most_gain: Penurunan impurity terbesar (-inf jika tidak ada split valid).
+            most_thresh: Threshold dengan split paling optimal.
+        """
+        n_shape = len(y)
+        N_t_L = np.arange(1, n_shape)
+        N_t_R = n_shape - N_t_L
+
+        # Mengurutkan data dari fitur yang terpilih satu kali
+        if counts is None:
+            X_i = self._X[samples, fitur_i]
+            order = np.argsort(X_i, kind="stable")
+            X_sorted = X_i[order]
+            y_sorted = y[order]
+        else:
+            # Baris node disaring dari index terurut (baris bootstrap diulang sesuai jumlahnya)
+            sorted_index = self._sorted_index[:, fitur_i]
+            rows = np.repeat(sorted_index, counts[sorted_index])
+            X_sorted = self._X[rows, fitur_i]
+            y_sorted = self._y[rows]
+
+        # Split hanya valid di antara dua nilai fitur yang berbeda
+        kond = (N_t_L >= self.sample_leaf_min) & (N_t_R >= self.sample_leaf_min) \
+               & (X_sorted[1:] > X_sorted[:-1])
+        if not np.any(kond):
+            return -np.inf, None
+
+        # Bobot kedua children untuk seluruh posisi split
+        if w is None:
+            w_sorted = None
+            W_t_L, W_t_R, W_T = N_t_L, N_t_R, n_shape
+        else:
+            w_sorted = w[order] if counts is None else self._w[rows]
+            w_cum = np.cumsum(w_sorted)
+            W_t_L, W_T = w_cum[:-1], w_cum[-1]
+            W_t_R = W_T - W_t_L
+
+        # Menghitung impurity kedua children untuk seluruh posisi split
+        I_children_left, I_children_right = self._criterion.sweep(y_sorted, w_sorted)
+
+        # Menghitung penurunan impurity berbobot: I_parent - sum (W_child / W_T) * I_child,
+        # diskalakan dengan W_T / W (bobot node terhadap seluruh data)
+        present_gain = I_parent \
+                        - (W_t_R / W_T) * I_children_right \
+                        - (W_t_L / W_T) * I_children_left
+        present_gain = np.where(kond, present_gain * (W_T / self.weighted_n_samples), -np.inf)
+
+        i = np.argmax(present_gain)
+        # Dikonversi ke float agar kode bin uint8/uint16 tidak overflow saat dijumlahkan
+        return present_gain[i], 0.5 * (float(X_sorted[i]) + float(X_sorted[i+1]))
+
+    def _most_split_feature_sparse(self, counts, stats_total, fitur_i, I_parent):
+        """
+        Fungsi yang digunakan untuk mencari threshold dengan split paling optimal pada satu fitur sparse.
+
+        Hanya elemen non-zero kolom yang dibaca, seluruh sample bernilai zero pada node
+        diperlakukan sebagai satu blok dengan statistik total node dikurangi statistik
+        elemen non-zero (criteria harus additive).
+
+        Args:
+            counts: Jumlah kemunculan tiap baris X pada node.
+            stats_total: Statistik criteria seluruh sample node.
+            fitur_i: Fitur yang dicari split-nya.
+            I_parent: Impurity node.
+
+        Returns:
+            most_gain: Penurunan impurity terbesar (-inf jika tidak ada split valid).
+            most_thresh: Threshold dengan split paling optimal.
+        """
+        # Elemen non-zero kolom yang berada pada node, terurut berdasarkan nilai
+        rows, values = self._X.sorted_column(fitur_i)
+        repeat = counts[rows]
+        rows, values = np.repeat(rows, repeat), np.repeat(values, repeat)
+        n_shape = int(counts.sum())
+        n_zero = n_shape - len(rows)
+
+        # Urutan posisi: nilai negatif, blok zero, nilai positif
+        stats = self._criterion.sample_stats(self._y[rows], self._sample_weight(rows))
+        n_negative = np.searchsorted(values, 0.0)
+        if n_zero > 0:
+            stats_zero = stats_total - stats.sum(axis=0)
+            stats = np.concatenate((stats[:n_negative], stats_zero[None], stats[n_negative:]))
+            values = np.concatenate((values[:n_negative], [0.0], values[n_negative:]))
+            n_position = np.ones(len(values))
+            n_position[n_negative] = n_zero
+        else:
+            n_position = np.ones(len(values))
+        if len(values) < 2:
+            return -np.inf, None
+
+        # Split hanya valid di antara dua nilai fitur yang berbeda
+        N_t_L = np.cumsum(n_position)[:-1]
+        N_t_R = n_shape - N_t_L
+        kond = (N_t_L >= self.sample_leaf_min) & (N_t_R >= self.sample_leaf_min) \
+               & (values[1:] > values[:-1])
+        if not np.any(kond):
+            return -np.inf, None
+
+        # Statistik kumulatif children untuk seluruh posisi split
+        stats_left = np.cumsum(stats, axis=0)[:-1]
+        stats_right = stats_total - stats_left
+        node_weight = self._criterion.node_weight
+        W_T = node_weight(stats_total)
+        W_t_L = node_weight(stats_left)
+        W_t_R = node_weight(stats_right)
+
+        node_impurity = self._criterion.node_impurity
+        with np.errstate(divide="ignore", invalid="ignore"):
+            present_gain = I_parent \
+                            - (W_t_R / W_T) * node_impurity(stats_right) \
+                            - (W_t_L / W_T) * node_impurity(stats_left)
+        present_gain = np.where(kond, present_gain * (W_T / self.weighted_n_samples), -np.inf)
+
+        i = np.argmax(present_gain)
+        return present_gain[i], 0.5 * (values[i] + values[i+1])
+
+    def _build_histogram(self, samples, parallel=False):
+        """
+        Fungsi yang digunakan untuk membangun histogram statistik criteria tiap fitur.
+
+        Args:
+            samples: Index sample pada node.
+            parallel: Apakah fitur boleh dikerjakan paralel oleh worker.
+
+        Returns:
+            hist: Array (n_fitur, n_bins, n_stats + 1), kolom terakhir berisi jumlah sample.
+        """
+        # Statistik per sample (berbobot) ditambah kolom count
+        stats = self._criterion.sample_stats(self._y[samples], self._sample_weight(samples))
+        stats = np.column_stack((stats, np.ones(len(stats))))
+        n_stats = stats.shape[1]
+
+        hist = np.zeros((self.n_fitur, self._n_bins, n_stats))
+        def build_histogram_fitur(fitur_i):
+            codes = self._X[samples, fitur_i].astype(np.intp)
+            index = (codes[:, None] * n_stats + np.arange(n_stats)).ravel()
+            hist[fitur_i] = np.bincount(index,
+                                        weights = stats.ravel(),
+                                        minlength = self._n_bins * n_stats
+                                        ).reshape(self._n_bins, n_stats)
+
+        if parallel and len(samples) >= PARALLEL_SPLIT_MIN_SAMPLES:
+            list(self._executor.map(build_histogram_fitur, range(self.n_fitur)))
+        else:
+            for fitur_i in range(self.n_fitur):
+                build_histogram_fitur(fitur_i)
+
+        return hist
+
+    def _most_split_hist(self, hist, features=None, present_gain=None):
+        """
+        Fungsi yang digunakan untuk mencari fitur dan bin dengan split paling optimal dari histogram.
+
+        Args:
+            hist: Histogram node dari _build_histogram.
+            features: Fitur yang dicari split-nya (default: seluruh fitur).
+            present_gain: Hasil _hist_gains(hist) jika sudah dihitung (diubah in-place).
+
+        Returns:
+            most_feature: Fitur dengan split paling optimal.
+            most_bin: Kode bin dengan split paling optimal (kiri = kode <= most_bin).
+            most_gain: Penurunan impurity dari split paling optimal.
+        """
+        # Butuh minimal sample_split_min untuk split node
+        n_shape = hist[0, :, -1].sum()
+        if n_shape < self.sample_split_min or n_shape < 2:
+            return None, None, 0.0
+
+        if present_gain is None:
+            present_gain = self._hist_gains(hist)
+        if features is not None and len(features) < self.n_fitur:
+            # Histogram tetap dibangun untuk seluruh fitur (pengurangan sibling),
+            # namun hanya fitur terpilih yang boleh digunakan untuk split
+            present_gain[np.setdiff1d(np.arange(self.n_fitur), features)] = -np.inf
+
+        # Mengambil gain terbesar (fitur pertama, lalu bin terkecil jika sama)
+        most_feature, most_bin = np.unravel_index(np.argmax(present_gain), present_gain.shape)
+        most_gain = present_gain[most_feature, most_bin]
+        if most_gain > 0.0 and most_gain >= self.impurity_reduction_min:
+            return int(most_feature), int(most_bin), most_gain
         
-    def _grow_tree(self, X, y, depth=0):
+        else:
+            return None, None, 0.0
+
+    def _hist_gains(self, hist):
         """
-        Fungsi yang digunakan untuk mengembangkan pohon keputusan secara rekursif.
+        Fungsi yang digunakan untuk menghitung penurunan impurity seluruh split (fitur, bin) dari histogram.
 
         Args:
-            X: Data fitur.
-            y: Data target.
-            depth: Kedalaman saat ini dalam pengembangan pohon.
+            hist: Histogram node dari _build_histogram.
 
         Returns:
-            node: Node pohon keputusan.
-        """
-        # Membuat node untuk leaf atau node internal
-        impurity_node = self._eval_impurity(y)
-        val_node = self._calc_leaf_val(y)
-        node = Tree(
-             val = val_node,
-             impurity = impurity_node,
-             leaf = True,
-             n_samples = len(y)
+            present_gain: Array (n_fitur, n_bins - 1), -inf untuk split yang tidak valid.
+        """
+        # Node kecil hanya menempati sebagian bin. Split pada bin kosong menghasilkan children
+        # yang sama dengan split pada bin terisi sebelumnya, sehingga gain cukup dihitung pada
+        # bin terisi (dipindahkan ke depan, urutan tetap) lalu dikembalikan ke posisi bin-nya
+        occupied = hist[..., -1] > 0
+        n_occupied = int(occupied.sum(axis=1).max())
+        n_bins = hist.shape[1]
+        if n_occupied < 2:
+            # Seluruh sample berada pada satu bin untuk setiap fitur, tidak ada split yang valid
+            return np.full((len(hist), n_bins - 1), -np.inf)
+        if 2 * n_occupied <= n_bins:
+            order = np.argsort(~occupied, axis=1, kind="stable")[:, :n_occupied]
+            gain_occupied = self._hist_gains(np.take_along_axis(hist, order[..., None], axis=1))
+
+            present_gain = np.full((len(hist), n_bins - 1), -np.inf)
+            split_bin = order[:, :-1]
+            valid = split_bin < n_bins - 1
+            present_gain[np.nonzero(valid)[0], split_bin[valid]] = gain_occupied[valid]
+            return present_gain
+
+        # Statistik child kiri dan kanan untuk seluruh fitur dan bin sekaligus
+        N = self.weighted_n_samples
+        stats_total = hist[0].sum(axis=0)
+        stats_left = np.cumsum(hist, axis=1)[:, :-1]
+        stats_right = stats_total - stats_left
+        N_t_L = stats_left[..., -1]
+        N_t_R = stats_right[..., -1]
+        kond = (N_t_L >= max(self.sample_leaf_min, 1)) & (N_t_R >= max(self.sample_leaf_min, 1))
+
+        # Bobot node dan children (sama dengan jumlah sample tanpa sample_weight)
+        node_weight = self._criterion.node_weight
+        W_T = node_weight(stats_total[:-1])
+        W_t_L = node_weight(stats_left[..., :-1])
+        W_t_R = node_weight(stats_right[..., :-1])
+
+        # Menghitung penurunan impurity
+        node_impurity = self._criterion.node_impurity
+        with np.errstate(divide="ignore", invalid="ignore"):
+            I_parent = node_impurity(stats_total[:-1])
+            I_children_left = node_impurity(stats_left[..., :-1])
+            I_children_right = node_impurity(stats_right[..., :-1])
+            present_gain = I_parent \
+                            - (W_t_R / W_T) * I_children_right \
+                            - (W_t_L / W_T) * I_children_left
+
+        return np.where(kond, present_gain * (W_T / N), -np.inf)
+
+    def _add_node(self, nodes, start, end, depth=0):
+        """
+        Fungsi yang digunakan untuk menambahkan node (leaf) dari region self._samples[start:end].
+
+        Returns:
+            node: Index node pada nodes.
+        """
+        if self._stats is not None:
+            self._stats.record_node(depth)
+
+        samples = self._samples[start:end]
+        y = self._y[samples]
+        w = self._sample_weight(samples)
+        return nodes.add_node(
+             value = self._calc_leaf_val(y, w),
+             impurity = self._eval_impurity(y, w),
+             n_samples = end - start,
+             weighted_n_samples = end - start if w is None else float(w.sum())
         )
 
-        # Lakukan split secara rekursif hingga mencapai max_depth
-        if self.max_depth is None:
-             kondisi = True
+    def _sample_weight(self, samples):
+        """Bobot dari index sample, None jika fit tanpa sample_weight."""
+        if self._w is None:
+            return None
+        return self._w[samples]
+
+    def _init_max_features(self):
+        """Menghitung jumlah fitur yang dicari split-nya pada setiap node (max_features_)."""
+        if self.max_features is None:
+            n_features = self.n_fitur
+        elif self.max_features == "sqrt":
+            n_features = int(np.sqrt(self.n_fitur))
+        elif self.max_features == "log2":
+            n_features = int(np.log2(self.n_fitur))
+        elif isinstance(self.max_features, str):
+            raise ValueError(f"max_features {self.max_features} tidak dikenali")
+        elif isinstance(self.max_features, (float, np.floating)):
+            n_features = int(self.max_features * self.n_fitur)
         else:
-             kondisi = depth <  self.max_depth
+            n_features = int(self.max_features)
+        self.max_features_ = min(max(n_features, 1), self.n_fitur)
 
-        if kondisi:
-            # Mencari splitting terbaik
-            fitur_i, thresh_i = self._most_split(X, y)
+        # Seed dasar pemilihan fitur, dibuat acak jika random_state tidak diisi
+        if self.random_state is None:
+            self._seed = np.random.SeedSequence().entropy
+        else:
+            self._seed = self.random_state
+
+    def _sample_features(self, depth, key):
+        """
+        Memilih fitur acak (tanpa pengembalian) untuk dicari split-nya pada sebuah node.
+
+        Random generator dibuat dari (seed, depth, key) sehingga hasilnya tidak
+        bergantung pada urutan node dikerjakan (misal oleh worker n_jobs).
+
+        Args:
+            depth: Kedalaman node.
+            key: Penanda node yang unik pada kedalaman tersebut (posisi region atau index node).
 
+        Returns:
+            features: Index fitur terurut, atau None jika seluruh fitur digunakan.
+        """
+        if self.max_features_ >= self.n_fitur:
+            return None
+
+        rng = np.random.default_rng([self._seed, depth, key])
+        return np.sort(rng.choice(self.n_fitur, self.max_features_, replace=False))
+
+    def _find_split(self, start, end, hist=None, parallel=False, depth=0):
+        """
+        Fungsi yang digunakan untuk mencari split terbaik dari region self._samples[start:end].
+
+        Args:
+            start: Posisi awal region node pada self._samples.
+            end: Posisi akhir region node pada self._samples.
+            hist: Histogram node (hanya untuk training dengan max_bins).
+            parallel: Apakah fitur boleh dikerjakan paralel oleh worker.
+            depth: Kedalaman node (untuk fit_stats).
+
+        Returns:
+            fitur_i: Fitur split (None jika node tidak di-split).
+            thresh_i: Threshold split (kode bin untuk training dengan max_bins).
+            gain: Penurunan impurity dari split.
+            hist: Histogram node (dihitung jika belum ada).
+        """
+        if self._stats is not None:
+            time_start = time.perf_counter()
+
+        samples = self._samples[start:end]
+        features = self._sample_features(depth, start + self._samples_offset)
+        if self.max_bins is None:
+            fitur_i, thresh_i, gain = self._most_split(samples, parallel, features)
+        elif self._criterion.additive:
+            if hist is None:
+                hist = self._build_histogram(samples, parallel)
+            fitur_i, thresh_i, gain = self._most_split_hist(hist, features)
+        else:
+            # Criteria non-additive di-sweep langsung pada kode bin
+            fitur_i, thresh_i, gain = self._most_split(samples, parallel, features)
             if fitur_i is not None:
-                # Split data
-                data = np.column_stack((X, y))
-                left_data, right_data = _split_data(data = data,
-                                                    fitur = fitur_i,
-                                                    thresh = thresh_i)
-                # Ambil data X dan y
-                X_data_left = left_data[:, :self.n_fitur]
-                y_data_left = left_data[:, self.n_fitur:]
-                X_data_right = right_data[:, :self.n_fitur]
-                y_data_right = right_data[:, self.n_fitur:]
-
-                # Menumbuhkan pohon
-                node.fitur = fitur_i
-                node.thresh = thresh_i
-                node.child_left = self._grow_tree(X_data_left, y_data_left, depth+1)
-                node.child_right = self._grow_tree(X_data_right, y_data_right, depth+1)
-                node.leaf = False
-
-        return node
-                
-    def _calculate_reduction_impurity(self, parent_data, child_left, child_right):
-        """
-        Fungsi yang digunakan untuk menghitung penurunan impuritas dengan split tertentu.
-
-        Args:
-            parent_data: Data pada node parent.
-            child_left: Data pada child node kiri.
-            child_right: Data pada child node kanan.
+                thresh_i = int(np.floor(thresh_i))
+
+        if self._stats is not None:
+            # Menghitung jumlah threshold dan pemanggilan criteria dari mode pencarian split
+            n_shape = end - start
+            if n_shape < max(self.sample_split_min, 2):
+                n_thresholds, n_calls = 0, 0
+            elif self.max_bins is not None and self._criterion.additive:
+                n_thresholds, n_calls = self.n_fitur * (self._n_bins - 1), 3
+            else:
+                n_search = self.n_fitur if features is None else len(features)
+                n_thresholds, n_calls = n_search * (n_shape - 1), 1 + n_search
+            self._stats.record_split(depth, n_thresholds, n_calls,
+                                     time.perf_counter() - time_start)
+
+        return fitur_i, thresh_i, gain, hist
+
+    def _split_node(self, start, end, fitur_i, thresh_i, hist=None, parallel=False, depth=0):
+        """
+        Fungsi yang digunakan untuk mempartisi region node dan menyiapkan histogram children.
 
         Returns:
-            impurity_reduction: Penurunan impuritas dengan split tertentu.
-        """
-        # Menghitung jumlah sample
-        N = self.n_samples
-        N_T = len(parent_data)
-        N_t_L = len(child_left)
-        N_t_R = len(child_right)
-
-        # Menghitung nilai impurity
-        I_parent = self._eval_impurity(parent_data)
-        I_children_left = self._eval_impurity(child_left)
-        I_children_right = self._eval_impurity(child_right)
-
-        # Menghitung bobot dari impurity
-        impurity_reduction = I_parent \
-                            - (N_t_R / N_T) * I_children_right \
-                            - (N_t_L / N_T) * I_children_left
-        
-        impurity_reduction *= (N_T/N)
+            mid: Batas antara region child kiri dan child kanan.
+            hist_left: Histogram child kiri (None tanpa max_bins).
+            hist_right: Histogram child kanan (None tanpa max_bins).
+        """
+        if self._stats is not None:
+            time_start = time.perf_counter()
+
+        # Partisi index sample secara in-place
+        mid = _partition(samples = self._samples,
+                         start = start,
+                         end = end,
+                         data = self._X,
+                         fitur = fitur_i,
+                         thresh = thresh_i)
+
+        if self._stats is not None:
+            # Index dibaca dan ditulis ulang, ditambah satu kolom fitur yang dibaca
+            n_bytes = (end - start) * (2 * self._samples.itemsize + self._X.itemsize)
+            self._stats.record_partition(depth, n_bytes, time.perf_counter() - time_start)
+
+        # Histogram child yang lebih kecil dihitung langsung,
+        # histogram sibling didapat dari pengurangan histogram parent
+        hist_left, hist_right = None, None
+        if hist is not None:
+            if mid - start <= end - mid:
+                hist_left = self._build_histogram(self._samples[start:mid], parallel)
+                hist_right = hist - hist_left
+            else:
+                hist_right = self._build_histogram(self._samples[mid:end], parallel)
+                hist_left = hist - hist_right
+
+        return mid, hist_left, hist_right
+
+    def _threshold_value(self, fitur_i, thresh_i):
+        """Mengubah threshold (atau kode bin) menjadi threshold pada satuan asli fitur."""
+        if self.max_bins is not None:
+            return self.bin_thresholds_[fitur_i][thresh_i]
+        return thresh_i
+
+    def _grow_tree(self, nodes, start, end, depth=0, hist=None):
+        """
+        Fungsi yang digunakan untuk mengembangkan pohon keputusan secara depth-first.
+
+        Node direpresentasikan oleh region self._samples[start:end], region tersebut
+        dipartisi in-place untuk children sehingga X dan y tidak pernah disalin.
+        Pengembangan dilakukan secara iteratif dengan stack (tanpa rekursi), sehingga
+        tree yang sangat dalam tidak dibatasi recursion limit Python. Child kiri
+        selalu dikembangkan sebelum child kanan, sehingga node tersimpan dalam
+        urutan preorder.
+
+        Args:
+            nodes: _NodeList tempat node disimpan.
+            start: Posisi awal region node pada self._samples.
+            end: Posisi akhir region node pada self._samples.
+            depth: Kedalaman saat ini dalam pengembangan pohon.
+            hist: Histogram node (hanya untuk training dengan max_bins).
+
+        Returns:
+            node: Index node pohon keputusan pada nodes.
+        """
+        # Worker hanya dipakai per fitur oleh builder utama (bukan dari dalam subtree)
+        parallel = self._executor is not None and nodes is self._nodes
+
+        # Stack berisi (start, end, depth, hist, list child parent, index parent)
+        root = None
+        stack = [(start, end, depth, hist, None, None)]
+        while stack:
+            start, end, depth, hist, children, parent = stack.pop()
+
+            if children is not None and parallel and depth == PARALLEL_SUBTREE_DEPTH:
+                # Subtree dikembangkan oleh worker, child diisi Future (lihat _NodeList.resolve)
+                children[parent] = self._submit_subtree(start, end, depth, hist)
+                continue
+
+            # Membuat node untuk leaf atau node internal
+            node = self._add_node(nodes, start, end, depth)
+            if children is None:
+                root = node
+            else:
+                children[parent] = node
+
+            # Lakukan split hingga mencapai max_depth
+            if self.max_depth is not None and depth >= self.max_depth:
+                continue
+
+            # Mencari splitting terbaik
+            fitur_i, thresh_i, _, hist = self._find_split(start, end, hist, parallel, depth)
+            if fitur_i is None:
+                continue
+
+            mid, hist_left, hist_right = self._split_node(start, end, fitur_i, thresh_i,
+                                                          hist, parallel, depth)
+            nodes.set_split(node = node,
+                            feature = fitur_i,
+                            threshold = self._threshold_value(fitur_i, thresh_i),
+                            left = TREE_LEAF,
+                            right = TREE_LEAF)
 
-        return impurity_reduction
+            # Menumbuhkan pohon, child kanan dimasukkan lebih dulu agar child kiri diproses dahulu
+            stack.append((mid, end, depth+1, hist_right, nodes.right, node))
+            stack.append((start, mid, depth+1, hist_left, nodes.left, node))
+
+        return root
+
+    def _grow_tree_best_first(self, nodes):
+        """
+        Fungsi yang digunakan untuk mengembangkan pohon keputusan secara best-first.
+
+        Node frontier disimpan pada priority queue dan node dengan penurunan impurity
+        terbesar selalu di-split terlebih dahulu hingga jumlah leaf mencapai
+        max_leaf_nodes. Pengembangan dilakukan secara iteratif (tanpa rekursi).
+
+        Args:
+            nodes: _NodeList tempat node disimpan.
+        """
+        parallel = self._executor is not None
+        frontier = []
+
+        def push_node(start, end, depth, hist):
+            # Menambahkan node dan, jika dapat di-split, memasukkannya ke frontier
+            node = self._add_node(nodes, start, end, depth)
+            if self.max_depth is None or depth < self.max_depth:
+                fitur_i, thresh_i, gain, hist = self._find_split(start, end, hist, parallel, depth)
+                if fitur_i is not None:
+                    # Node id unik sehingga urutan heap selalu deterministik
+                    heapq.heappush(frontier, (-gain, node, start, end, depth,
+                                              fitur_i, thresh_i, hist))
+            return node
+
+        push_node(0, self.n_samples, 0, None)
+        n_leaf = 1
+        while frontier and n_leaf < self.max_leaf_nodes:
+            _, node, start, end, depth, fitur_i, thresh_i, hist = heapq.heappop(frontier)
+            mid, hist_left, hist_right = self._split_node(start, end, fitur_i, thresh_i,
+                                                          hist, parallel, depth)
+
+            child_left = push_node(start, mid, depth+1, hist_left)
+            child_right = push_node(mid, end, depth+1, hist_right)
+            nodes.set_split(node = node,
+                            feature = fitur_i,
+                            threshold = self._threshold_value(fitur_i, thresh_i),
+                            left = child_left,
+                            right = child_right)
+            n_leaf += 1
+
+    def _submit_subtree(self, start, end, depth, hist):
+        """
+        Fungsi yang digunakan untuk mengembangkan subtree oleh worker (n_jobs > 1).
+
+        Child pada kedalaman PARALLEL_SUBTREE_DEPTH dikembangkan sebagai subtree
+        independen pada _NodeList sendiri. Region sample antar subtree tidak
+        beririsan sehingga partisi in-place aman dilakukan bersamaan.
+
+        Returns:
+            Future: Menghasilkan _NodeList subtree.
+        """
+        def grow_subtree():
+            subtree = _NodeList()
+            self._grow_tree(subtree, start, end, depth, hist)
+            return subtree
+
+        return self._executor.submit(grow_subtree)
 
     def _tree_pruning(self, tree=None):
         """
         Fungsi yang digunakan untuk melakukan pruning pada pohon keputusan.
 
         Args:
-            tree: Pohon keputusan yang akan dipruning (default: None).
+            tree: Pohon keputusan (FlatTree) yang akan dipruning (default: None).
         """
         if not tree:
             tree = self.tree_
+            self._compiled = None
 
-        if tree.leaf:
-            pass
-        else:
-            self._tree_pruning(tree.child_left)
-            self._tree_pruning(tree.child_right)
+        # Index child selalu lebih besar dari parent, sehingga iterasi terbalik
+        # memproses seluruh children sebelum parent-nya (bottom-up)
+        for node in range(tree.node_count - 1, -1, -1):
+            if tree.is_leaf(node):
+                continue
 
-            if tree.child_right.leaf ==  False and tree.child_left.leaf == False:
-                n_true = tree.child_left.n_samples
-                n_false = tree.child_right.n_samples
+            child_left, child_right = tree.left[node], tree.right[node]
+            if not tree.is_leaf(child_right) and not tree.is_leaf(child_left):
+                n_true = tree.weighted_n_samples[child_left]
+                n_false = tree.weighted_n_samples[child_right]
 
                 p = n_true / (n_true + n_false)
-                delta = tree.impurity - p*tree.child_left.impurity - (1-p)*tree.child_right.impurity
+                delta = tree.impurity[node] - p*tree.impurity[child_left] - (1-p)*tree.impurity[child_right]
                 if delta < self.alpa:
-                    tree.child_left, tree.child_right = None, None
-                    tree.thresh = None
-                    tree.fitur = None
-                    tree.leaf = True
+                    tree.left[node], tree.right[node] = TREE_LEAF, TREE_LEAF
+                    tree.threshold[node] = np.nan
+                    tree.feature[node] = TREE_LEAF
+
+        return tree.compact()
+
+    def _compute_pruning_path(self):
+        """
+        Fungsi yang digunakan untuk menghitung urutan weakest link pruning (cost complexity pruning).
+
+        Risk R(t) (impurity node berbobot proporsi sample), risk subtree R(T_t) dan jumlah
+        leaf |T_t| setiap node dihitung satu kali secara bottom-up, lalu pada setiap langkah
+        node dengan g(t) = (R(t) - R(T_t)) / (|T_t| - 1) terkecil dijadikan leaf dan statistik
+        ancestor-nya diperbarui tanpa menghitung ulang seluruh tree.
+
+        Returns:
+            tuple: (ccp_alphas, impurities, prune_alpha) dengan prune_alpha berisi alpha
+            di mana setiap node menjadi leaf (inf untuk node yang tidak pernah dipruning).
+        """
+        tree = self.tree_
+        n_nodes = tree.node_count
+        left, right = tree.left, tree.right
+        is_split = left != TREE_LEAF
+
+        # Risk setiap node jika dijadikan leaf
+        risk = tree.weighted_n_samples * tree.impurity / self.weighted_n_samples
+
+        # Statistik subtree, index child selalu lebih besar dari parent (bottom-up)
+        subtree_risk = risk.copy()
+        n_leaves = np.ones(n_nodes, dtype=np.intp)
+        n_subtree_nodes = np.ones(n_nodes, dtype=np.intp)
+        parent = np.full(n_nodes, TREE_LEAF, dtype=np.intp)
+        for node in np.flatnonzero(is_split)[::-1]:
+            child_left, child_right = left[node], right[node]
+            subtree_risk[node] = subtree_risk[child_left] + subtree_risk[child_right]
+            n_leaves[node] = n_leaves[child_left] + n_leaves[child_right]
+            n_subtree_nodes[node] = 1 + n_subtree_nodes[child_left] + n_subtree_nodes[child_right]
+            parent[child_left] = parent[child_right] = node
+
+        # Toleransi untuk node dengan g(t) yang sama (selisih floating point)
+        epsilon = 10 * np.finfo(np.float64).eps
+
+        ccp_alphas, impurities = [0.0], [subtree_risk[0]]
+        prune_alpha = np.full(n_nodes, np.inf)
+        active = is_split.copy()
+        while active[0]:
+            nodes = np.flatnonzero(active)
+            g = (risk[nodes] - subtree_risk[nodes]) / (n_leaves[nodes] - 1)
+            alpha = max(g.min(), ccp_alphas[-1])
+
+            for node in nodes[g <= alpha + epsilon]:
+                # Node yang sudah terbuang bersama ancestor-nya dilewati
+                if not active[node]:
+                    continue
+
+                # Tree dalam urutan preorder (compact), subtree node berada pada range berurutan
+                active[node:node + n_subtree_nodes[node]] = False
+                prune_alpha[node] = alpha
+
+                delta_risk = subtree_risk[node] - risk[node]
+                delta_leaves = n_leaves[node] - 1
+                ancestor = node
+                while ancestor != TREE_LEAF:
+                    subtree_risk[ancestor] -= delta_risk
+                    n_leaves[ancestor] -= delta_leaves
+                    ancestor = parent[ancestor]
+
+            # Alpha yang sama dengan langkah sebelumnya digabung menjadi satu langkah
+            if alpha <= ccp_alphas[-1]:
+                impurities[-1] = subtree_risk[0]
+            else:
+                ccp_alphas.append(alpha)
+                impurities.append(subtree_risk[0])
+
+        return np.asarray(ccp_alphas), np.asarray(impurities), prune_alpha
+
+    def cost_complexity_pruning_path(self):
+        """
+        Fungsi yang digunakan untuk menghitung seluruh alpha efektif cost complexity pruning
+        dari tree yang sudah di-fit, tanpa fit ulang.
+
+        Hasil perhitungan disimpan pada model dan dibuat ulang jika tree berubah.
+
+        Returns:
+            dict: ccp_alphas (alpha efektif, naik) dan impurities (total impurity leaf
+            berbobot dari subtree untuk setiap alpha).
+        """
+        if self._pruning_path is None:
+            self._pruning_path = self._compute_pruning_path()
+        ccp_alphas, impurities, _ = self._pruning_path
+
+        return {"ccp_alphas": ccp_alphas.copy(), "impurities": impurities.copy()}
+
+    def prune(self, ccp_alpha):
+        """
+        Fungsi yang digunakan untuk membuat model baru dengan subtree cost complexity
+        terkecil untuk ccp_alpha tertentu, menggunakan pruning path yang sudah dihitung.
+
+        Args:
+            ccp_alpha (float): Parameter kompleksitas, node dengan alpha efektif <= ccp_alpha dijadikan leaf.
+
+        Returns:
+            DecisionTreeBase: Salinan model dengan tree hasil pruning (model asal tidak berubah).
+        """
+        if ccp_alpha < 0:
+            raise ValueError("ccp_alpha tidak boleh negatif")
+        if self._pruning_path is None:
+            self._pruning_path = self._compute_pruning_path()
+        _, _, prune_alpha = self._pruning_path
+
+        # Node yang dipruning dijadikan leaf, subtree di bawahnya dibuang oleh compact()
+        tree = self.tree_
+        pruned = prune_alpha <= ccp_alpha
+        pruned_tree = FlatTree(
+            feature = np.where(pruned, TREE_LEAF, tree.feature),
+            threshold = np.where(pruned, np.nan, tree.threshold),
+            left = np.where(pruned, TREE_LEAF, tree.left),
+            right = np.where(pruned, TREE_LEAF, tree.right),
+            value = tree.value,
+            impurity = tree.impurity,
+            n_samples = tree.n_samples,
+            weighted_n_samples = tree.weighted_n_samples
+        ).compact()
+
+        model = copy.copy(self)
+        model.tree_ = pruned_tree
+        # Tree hasil prune tidak lagi sesuai dengan data partial_fit
+        model._history = None
+
+        return model
+
+    def truncate(self, max_depth=None, sample_split_min=None, sample_leaf_min=None,
+                 impurity_reduction_min=None, max_leaf_nodes=None):
+        """
+        Fungsi yang digunakan untuk membuat model baru dengan stopping criteria yang lebih
+        ketat dari tree yang sudah di-fit, tanpa fit ulang.
+
+        Split pada setiap node tidak bergantung pada stopping criteria tersebut, sehingga
+        node yang tidak memenuhi criteria cukup dijadikan leaf (nilai, impurity dan jumlah
+        sample node sudah tersimpan). Hasilnya sama dengan fit langsung untuk max_depth,
+        sample_split_min, impurity_reduction_min dan max_leaf_nodes (jika model di-fit
+        tanpa max_leaf_nodes dan dengan alpa=0). Untuk sample_leaf_min, node dengan child
+        yang terlalu kecil dijadikan leaf, sedangkan fit langsung dapat memilih split lain.
+
+        Args:
+            max_depth (int, optional): Kedalaman maksimal baru. Default: None (tidak berubah).
+            sample_split_min (int, optional): Jumlah sample minimal untuk split node. Default: None (tidak berubah).
+            sample_leaf_min (int, optional): Jumlah sample minimal pada leaf. Default: None (tidak berubah).
+            impurity_reduction_min (float, optional): Penurunan impurity minimal untuk split. Default: None (tidak berubah).
+            max_leaf_nodes (int, optional): Jumlah leaf maksimal (best-first). Default: None (tidak berubah).
+
+        Returns:
+            DecisionTreeBase: Salinan model dengan tree yang dipotong (model asal tidak berubah).
+        """
+        params = {
+            "max_depth": max_depth,
+            "sample_split_min": sample_split_min,
+            "sample_leaf_min": sample_leaf_min,
+            "impurity_reduction_min": impurity_reduction_min,
+            "max_leaf_nodes": max_leaf_nodes
+        }
+
+        # Tree hanya dapat dipotong, sehingga parameter baru tidak boleh lebih longgar
+        for name, value in params.items():
+            current = getattr(self, name)
+            if value is None:
+                params[name] = current
+            elif name in ("max_depth", "max_leaf_nodes"):
+                if current is not None and value > current:
+                    raise ValueError(f"{name} tidak boleh lebih besar dari nilai saat fit ({current})")
+            elif value < current:
+                raise ValueError(f"{name} tidak boleh lebih kecil dari nilai saat fit ({current})")
+        if params["max_leaf_nodes"] is not None and params["max_leaf_nodes"] < 2:
+            raise ValueError("max_leaf_nodes harus lebih besar atau sama dengan 2")
+
+        tree = self.tree_
+        left, right = tree.left, tree.right
+        is_split = left != TREE_LEAF
+        split_nodes = np.flatnonzero(is_split)
+
+        # Kedalaman node, index child selalu lebih besar dari parent
+        depth = np.zeros(tree.node_count, dtype=np.intp)
+        for node in split_nodes:
+            depth[left[node]] = depth[right[node]] = depth[node] + 1
+
+        # Penurunan impurity tiap split (sama dengan perhitungan saat pencarian split)
+        weight = tree.weighted_n_samples
+        weighted_impurity = weight * tree.impurity
+        gain = np.zeros(tree.node_count)
+        gain[split_nodes] = (weighted_impurity[split_nodes]
+                             - weighted_impurity[left[split_nodes]]
+                             - weighted_impurity[right[split_nodes]]) / self.weighted_n_samples
+
+        keep = is_split & (tree.n_samples >= params["sample_split_min"]) \
+               & (gain >= params["impurity_reduction_min"])
+        keep[split_nodes] &= (tree.n_samples[left[split_nodes]] >= params["sample_leaf_min"]) \
+                             & (tree.n_samples[right[split_nodes]] >= params["sample_leaf_min"])
+        if params["max_depth"] is not None:
+            keep &= depth < params["max_depth"]
+
+        # Memilih ulang split secara best-first dari root (seperti _grow_tree_best_first)
+        if params["max_leaf_nodes"] is not None:
+            best_first = np.zeros(tree.node_count, dtype=bool)
+            frontier = [(-gain[0], 0)] if keep[0] else []
+            n_leaf = 1
+            while frontier and n_leaf < params["max_leaf_nodes"]:
+                _, node = heapq.heappop(frontier)
+                best_first[node] = True
+                n_leaf += 1
+                for child in (left[node], right[node]):
+                    if keep[child]:
+                        heapq.heappush(frontier, (-gain[child], child))
+            keep = best_first
+
+        truncated_tree = FlatTree(
+            feature = np.where(keep, tree.feature, TREE_LEAF),
+            threshold = np.where(keep, tree.threshold, np.nan),
+            left = np.where(keep, left, TREE_LEAF),
+            right = np.where(keep, right, TREE_LEAF),
+            value = tree.value,
+            impurity = tree.impurity,
+            n_samples = tree.n_samples,
+            weighted_n_samples = tree.weighted_n_samples
+        ).compact()
+
+        model = copy.copy(self)
+        for name, value in params.items():
+            setattr(model, name, value)
+        model.tree_ = model._tree_pruning(truncated_tree)
+        # Tree hasil truncate tidak lagi sesuai dengan data partial_fit
+        model._history = None
+
+        return model
 
     def _export_tree(self):
         print("Decision Tree")
         print("-------------")
-        print(_to_string(tree=self.tree_))
+        print(_to_string(tree=self.tree_.to_node()))
                      
-    def _predict_val(self, X, tree=None):
+    def _predict_val(self, X, node=0):
         """
         Fungsi yang digunakan untuk melakukan prediksi nilai target berdasarkan pohon keputusan.
 
         Args:
             X: Data fitur.
-            tree: Pohon keputusan yang digunakan untuk prediksi (default: None).
+            node: Index node awal pada pohon keputusan (default: 0, root).
 
         Returns:
             predicted_val: Nilai target yang diprediksi.
         """
-        # Melakukan pendefinisian terhadap tree
-        if tree is None:
-            tree = self.tree_
-        
-        # Lakukan pengecekan apakah terdapat leaf atau tidak
-        if tree.leaf:
-            # Mengembalikan predicted value yang ada pada leaf
-            return tree.val
-        else:
+        tree = self.tree_
+
+        # Telusuri branch hingga mencapai leaf
+        while not tree.is_leaf(node):
             # Apabila terdapat pada branch, lakukan pemilihan fitur
-            fitur_val = X[:, tree.fitur]
+            fitur_val = X[0, tree.feature[node]]
 
             # Selanjutnya, tentukan branch yang diikuti
-            if fitur_val <= tree.thresh:
-                branch = tree.child_left
+            if fitur_val <= tree.threshold[node]:
+                node = tree.left[node]
             else:
-                branch = tree.child_right
+                node = tree.right[node]
 
-            return self._predict_val(X, branch)
+        # Mengembalikan predicted value yang ada pada leaf
+        return tree.value[node]
         
-    def fit(self, X, y):
+    def fit(self, X, y=None, sample_weight=None):
         """
         Fungsi yang digunakan untuk melatih model Decision Tree.
 
+        X dapat berupa np.memmap (dibaca tanpa disalin ke memory), matriks sparse
+        CSC/CSR (misal scipy.sparse, tanpa densifikasi dan tanpa max_bins), ChunkedData
+        untuk training streaming dengan histogram per chunk (y tidak digunakan), atau
+        TreeDataset yang sudah diproses sebelumnya untuk banyak fit (y tidak digunakan).
+
         Args:
-            X: Data fitur.
+            X: Data fitur, ChunkedData, atau TreeDataset (y tidak digunakan).
+            y: Data target.
+            sample_weight: Bobot setiap sample (misal jumlah duplikat baris). Default: None (bobot 1).
+        """
+        self._fit(X, y, sample_weight=sample_weight)
+
+    def _fit(self, X, y=None, samples=None, bin_thresholds=None, sample_weight=None):
+        """
+        Fungsi yang digunakan untuk melatih model, dengan opsi yang digunakan oleh ensemble.
+
+        Args:
+            X: Data fitur, ChunkedData, atau TreeDataset.
+            y: Data target.
+            samples: Index baris yang digunakan, boleh berulang (bootstrap). Default: seluruh baris.
+            bin_thresholds: Threshold bin jika X sudah berupa kode bin (max_bins).
+            sample_weight: Bobot setiap baris X. Default: None (bobot 1).
+        """
+        if self.max_leaf_nodes is not None and self.max_leaf_nodes < 2:
+            raise ValueError("max_leaf_nodes harus lebih besar atau sama dengan 2")
+
+        if self.max_bins is not None and not 2 <= self.max_bins <= 65536:
+            raise ValueError("max_bins harus berada di antara 2 dan 65536")
+
+        # Statistik proses fit hanya dicatat jika diminta
+        self._stats = FitStats() if self.fit_stats else None
+        time_start = time.perf_counter()
+
+        # fit membuang data yang disimpan oleh partial_fit
+        self._history = None
+        self._grown = None
+        self._node_hist = {}
+
+        if isinstance(X, ChunkedData):
+            if sample_weight is not None:
+                raise ValueError("sample_weight tidak didukung untuk training streaming")
+            self._fit_streaming(X)
+        elif isinstance(X, TreeDataset):
+            self._fit_dataset(X, samples, sample_weight)
+        else:
+            self._fit_array(X, y, samples, bin_thresholds, sample_weight)
+
+        if self._stats is not None:
+            self._stats.fit_time = time.perf_counter() - time_start
+        self.fit_stats_ = self._stats
+        del self._stats
+
+    def _fit_dataset(self, data, samples=None, sample_weight=None):
+        """
+        Fungsi yang digunakan untuk melatih model dari TreeDataset, menggunakan hasil
+        binning, presort dan encoding label yang sudah dihitung.
+
+        Args:
+            data (TreeDataset): Data training.
+            samples: Index baris yang digunakan, boleh berulang. Default: seluruh baris.
+            sample_weight: Bobot setiap baris. Default: sample_weight dari TreeDataset.
+        """
+        if sample_weight is None:
+            sample_weight = data.sample_weight
+
+        X, bin_thresholds, sorted_index = data.X, None, data.sorted_index
+        if self.max_bins is not None:
+            X, bin_thresholds = data.binned(self.max_bins)
+            sorted_index = None
+
+        classes, y = None, data.y
+        if self._encodes_target:
+            classes, y = data.encoded_target()
+
+        self._fit_array(X, y, samples, bin_thresholds, sample_weight,
+                        sorted_index=sorted_index, classes=classes)
+
+    def _fit_array(self, X, y, samples=None, bin_thresholds=None, sample_weight=None,
+                   sorted_index=None, classes=None):
+        """
+        Fungsi yang digunakan untuk melatih model dari array (termasuk np.memmap).
+
+        Args:
+            X: Data fitur (kode bin jika bin_thresholds diisi).
             y: Data target.
+            samples: Index baris yang digunakan, boleh berulang (misal bootstrap).
+                Default: seluruh baris.
+            bin_thresholds: Threshold bin yang sudah dihitung untuk X (max_bins).
+            sample_weight: Bobot setiap baris X. Default: None (bobot 1).
+            sorted_index: Index baris terurut tiap fitur dari TreeDataset. Default: None.
+            classes: Label class jika y sudah berupa kode class. Default: None.
         """
-        # Lakukan konversi array terhadap input
-        X = np.array(X).copy()
-        y = np.array(y).copy()
+        # Lakukan konversi array terhadap input (tanpa copy, data hanya dibaca),
+        # input sparse disimpan dalam format csc tanpa densifikasi
+        X = _as_array(X)
+        if isinstance(X, _SparseMatrix):
+            if self.max_bins is not None:
+                raise ValueError("max_bins tidak didukung untuk input sparse")
+            X = X.tocsc()
+        y = np.asarray(y)
+        if y.ndim != 2 or y.shape[1] == 1:
+            y = np.ravel(y)
+        if classes is None:
+            self._init_criterion(y)
+            y = self._encode_target(y)
+        else:
+            # Label sudah di-encode (TreeDataset), criteria cukup diinisialisasi dengan classes
+            self._init_criterion(classes)
 
         # Melakukan ektraksi terhadap ukuran data
         self.n_samples, self.n_fitur = X.shape
+        self._init_max_features()
+
+        # Melakukan kuantisasi fitur satu kali untuk training berbasis histogram
+        if self.max_bins is not None:
+            if bin_thresholds is None:
+                bin_thresholds = [_bin_thresholds(X[:, fitur_i], self.max_bins)
+                                  for fitur_i in range(self.n_fitur)]
+                X = _bin_data(X, bin_thresholds)
+            self.bin_thresholds_ = bin_thresholds
+            self._n_bins = max(len(thresh) for thresh in self.bin_thresholds_) + 1
+
+        # Satu salinan read-only X dan y, ditambah satu array index sample
+        self._X = X
+        self._y = y
+        self._sorted_index = sorted_index
+        if samples is None:
+            self._samples = np.arange(self.n_samples)
+        else:
+            self._samples = np.array(samples, dtype=np.intp)
+            self.n_samples = len(self._samples)
+
+        # Bobot sample, total bobot menggantikan jumlah sample pada perhitungan gain
+        if sample_weight is None:
+            self._w = None
+            self.weighted_n_samples = self.n_samples
+        else:
+            self._w = np.asarray(sample_weight, dtype=np.float64)
+            if self._w.shape != (len(X),):
+                raise ValueError("sample_weight harus berukuran sama dengan jumlah baris X")
+            if np.any(self._w < 0):
+                raise ValueError("sample_weight tidak boleh negatif")
+            self.weighted_n_samples = float(self._w[self._samples].sum())
 
         # Melakukan pengembangan Tree
-        self.tree_ = self._grow_tree(X, y)
+        n_jobs = os.cpu_count() if self.n_jobs == -1 else (self.n_jobs or 1)
+        self._executor = ThreadPoolExecutor(max_workers=n_jobs) if n_jobs > 1 else None
+        self._nodes = _NodeList()
+        try:
+            if self.max_leaf_nodes is None:
+                self._grow_tree(self._nodes, 0, self.n_samples)
+            else:
+                self._grow_tree_best_first(self._nodes)
+
+            # Menggabungkan subtree dari worker sesuai urutan node
+            self._nodes.resolve(lambda future: future.result())
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+
+        self.tree_ = self._nodes.to_tree()
+        del self._X, self._y, self._w, self._sorted_index, self._samples, self._nodes, self._executor
 
         # Melakukan tree pruning
-        self._tree_pruning()
+        self._timed_pruning()
+
+    def _fit_streaming(self, data):
+        """
+        Fungsi yang digunakan untuk melatih model dari ChunkedData tanpa memuat seluruh data.
+
+        Tree dikembangkan level demi level. Untuk setiap level, seluruh chunk dibaca
+        satu kali, setiap baris diarahkan ke leaf frontier-nya, dan statistik criteria
+        diakumulasikan pada histogram per (node, fitur, bin). Hanya histogram child
+        yang lebih kecil yang diakumulasikan, histogram sibling didapat dari
+        pengurangan histogram parent.
+
+        Args:
+            data: ChunkedData berisi tuple (X, y).
+        """
+        if self.max_leaf_nodes is not None:
+            raise ValueError("max_leaf_nodes tidak didukung untuk training streaming")
+
+        # Membaca data satu kali untuk ukuran data, class dan threshold bin
+        # Class target hanya dikumpulkan untuk klasifikasi (target regresi tidak disimpan)
+        self.n_samples, X_sample, y_unique = _scan(data, classes=self._encodes_target)
+        self.weighted_n_samples = self.n_samples
+        self.n_fitur = X_sample.shape[1]
+        self._init_max_features()
+        self._init_criterion(y_unique)
+        if not self._criterion.additive:
+            raise ValueError(f"criteria {self.criteria} tidak didukung untuk training streaming")
+
+        max_bins = self.max_bins if self.max_bins is not None else 255
+        self.bin_thresholds_ = [_bin_thresholds(X_sample[:, fitur_i], max_bins)
+                                for fitur_i in range(self.n_fitur)]
+        self._n_bins = max(len(thresh) for thresh in self.bin_thresholds_) + 1
+        del X_sample
+
+        # Frontier berisi (node, depth, histogram yang sudah diketahui)
+        nodes = _NodeList()
+        time_start = time.perf_counter()
+        root_hist = self._accumulate_histograms(data, nodes, [None])[0]
+        if self._stats is not None:
+            # Waktu pass data dicatat sebagai waktu pencarian split level tersebut
+            self._stats.record_split(0, 0, 0, time.perf_counter() - time_start)
+            self._stats.record_node(0)
+        root_stats = root_hist[0].sum(axis=0)
+        root = nodes.add_node(value = self._criterion.node_value(root_stats[:-1]),
+                              impurity = float(self._criterion.node_impurity(root_stats[:-1])),
+                              n_samples = int(root_stats[-1]))
+        frontier = [(root, 0, root_hist)]
+
+        while frontier:
+            # Mencari split setiap node frontier dari histogram-nya
+            splits = []
+            for node, depth, hist in frontier:
+                if self.max_depth is not None and depth >= self.max_depth:
+                    continue
+                time_start = time.perf_counter()
+                fitur_i, bin_i, _ = self._most_split_hist(hist, self._sample_features(depth, node))
+                if self._stats is not None:
+                    self._stats.record_split(depth, self.n_fitur * (self._n_bins - 1), 3,
+                                             time.perf_counter() - time_start)
+                if fitur_i is None:
+                    continue
+
+                # Statistik children diambil langsung dari histogram parent
+                stats_left = hist[fitur_i, :bin_i+1].sum(axis=0)
+                stats_right = hist[fitur_i].sum(axis=0) - stats_left
+                children = []
+                for stats in (stats_left, stats_right):
+                    if self._stats is not None:
+                        self._stats.record_node(depth+1)
+                    children.append(nodes.add_node(
+                        value = self._criterion.node_value(stats[:-1]),
+                        impurity = float(self._criterion.node_impurity(stats[:-1])),
+                        n_samples = int(stats[-1])
+                    ))
+                nodes.set_split(node = node,
+                                feature = fitur_i,
+                                threshold = self.bin_thresholds_[fitur_i][bin_i],
+                                left = children[0],
+                                right = children[1])
+                smaller = 0 if stats_left[-1] <= stats_right[-1] else 1
+                splits.append((children, depth, hist, smaller))
+
+            if not splits:
+                break
+
+            # Satu pass data untuk histogram child yang lebih kecil
+            time_start = time.perf_counter()
+            slot_nodes = [children[smaller] for children, _, _, smaller in splits]
+            slot_hists = self._accumulate_histograms(data, nodes, slot_nodes)
+            if self._stats is not None:
+                self._stats.record_split(splits[0][1] + 1, 0, 0, time.perf_counter() - time_start)
+
+            frontier = []
+            for (children, depth, hist, smaller), hist_smaller in zip(splits, slot_hists):
+                hist_children = [None, None]
+                hist_children[smaller] = hist_smaller
+                hist_children[1 - smaller] = hist - hist_smaller
+                frontier.append((children[0], depth+1, hist_children[0]))
+                frontier.append((children[1], depth+1, hist_children[1]))
+
+        self.tree_ = nodes.to_tree()
+
+        # Melakukan tree pruning
+        self._timed_pruning()
+
+    # Apakah target di-encode menjadi kode class (lihat _encode_target)
+    _encodes_target = False
+
+    # Posisi self._samples[0] pada region seluruh data, agar fitur acak (max_features)
+    # subtree yang di-grow ulang oleh partial_fit sama dengan fit dari seluruh data
+    _samples_offset = 0
+
+    def _encode_target(self, y):
+        """Mengubah target menjadi representasi yang digunakan criteria (default: tanpa perubahan)."""
+        return y
+
+    def _timed_pruning(self):
+        """Melakukan tree pruning dan mencatat waktunya pada fit_stats."""
+        time_start = time.perf_counter()
+        self.tree_ = self._tree_pruning()
+        if self._stats is not None:
+            self._stats.pruning_time = time.perf_counter() - time_start
+
+    def _accumulate_histograms(self, data, nodes, slot_nodes):
+        """
+        Fungsi yang digunakan untuk mengakumulasikan histogram beberapa node dalam satu pass data.
+
+        Args:
+            data: ChunkedData berisi tuple (X, y).
+            nodes: _NodeList berisi tree yang sedang dikembangkan.
+            slot_nodes: Node yang diakumulasikan, None berarti seluruh baris (root).
+
+        Returns:
+            list: Histogram (n_fitur, n_bins, n_stats + 1) untuk setiap node.
+        """
+        tree = nodes.to_tree() if len(nodes.feature) > 0 else None
+        n_slot = len(slot_nodes)
+        slot = np.full(max(len(nodes.feature), 1), -1, dtype=np.intp)
+        for slot_i, node in enumerate(slot_nodes):
+            slot[0 if node is None else node] = slot_i
+
+        n_stats = self._criterion.n_stats + 1
+        shape = (n_slot, self.n_fitur, self._n_bins, n_stats)
+        hist = np.zeros(np.prod(shape))
+        for X_chunk, y_chunk in data:
+            X_chunk = np.asarray(X_chunk)
+
+            # Mengarahkan setiap baris ke node tujuannya
+            if tree is None:
+                slot_chunk = np.zeros(len(X_chunk), dtype=np.intp)
+            else:
+                slot_chunk = slot[tree.apply(X_chunk)]
+            in_slot = slot_chunk >= 0
+            if not np.any(in_slot):
+                continue
+            slot_chunk = slot_chunk[in_slot]
+            codes = _bin_data(X_chunk[in_slot], self.bin_thresholds_).astype(np.intp)
+            stats = self._criterion.sample_stats(self._encode_target(np.ravel(y_chunk)[in_slot]))
+            stats = np.column_stack((stats, np.ones(len(stats))))
+
+            # Index histogram untuk setiap (baris, fitur, statistik)
+            base = (slot_chunk[:, None] * self.n_fitur + np.arange(self.n_fitur)) * self._n_bins + codes
+            index = (base[:, :, None] * n_stats + np.arange(n_stats)).ravel()
+            weights = np.broadcast_to(stats[:, None, :], (len(stats), self.n_fitur, n_stats)).ravel()
+            hist += np.bincount(index, weights=weights, minlength=len(hist))
+
+        return list(hist.reshape(shape))
+
+    def partial_fit(self, X, y, sample_weight=None, tol=0.0):
+        """
+        Fungsi yang digunakan untuk memperbarui model dengan batch data baru tanpa fit ulang.
+
+        Lihat _partial_fit.
+
+        Args:
+            X: Data fitur batch baru.
+            y: Data target batch baru.
+            sample_weight: Bobot setiap sample. Default: None (bobot 1).
+            tol: Toleransi relatif perubahan gain split sebelum subtree di-grow ulang. Default: 0.0.
+        """
+        self._partial_fit(X, y, sample_weight, tol)
+
+    def _partial_fit(self, X, y, sample_weight=None, tol=0.0, classes=None):
+        """
+        Fungsi yang digunakan untuk memperbarui tree dengan batch data baru.
+
+        Batch baru dikuantisasi dengan threshold bin dari batch pertama, diarahkan ke tree
+        yang ada dan disimpan pada history. Histogram hanya disimpan untuk node besar
+        (n_samples >= PARTIAL_HIST_SAMPLES_PER_BIN * n_bins) dan diperbarui secara aditif
+        dari baris batch baru, histogram node kecil dihitung dari baris history-nya saat
+        dibutuhkan. Split setiap node yang dilewati batch dievaluasi ulang dan subtree-nya
+        hanya di-grow ulang (dari history) jika split terbaiknya berubah lebih dari tol, atau
+        leaf yang sekarang dapat di-split. Dengan tol=0 hasilnya sama dengan fit dari seluruh
+        batch dengan threshold bin yang sama. Dengan max_features < n_fitur, fitur acak node
+        yang dievaluasi dan subtree yang di-grow ulang ditarik dengan kunci posisi region
+        yang sama dengan fit, tetapi node yang tidak dilewati batch tetap memakai fitur acak
+        dari posisi region lamanya sehingga hasilnya dapat berbeda dari fit.
+
+        Model harus dilatih dengan partial_fit sejak batch pertama, karena tree dari fit
+        (atau load, prune dan truncate) tidak menyimpan data training.
+
+        Memory dan biaya update:
+            - History tidak dibatasi, setiap baris membutuhkan n_fitur * itemsize kode bin
+              + itemsize target + 8 byte (index baris pada leaf-nya), ditambah 8 byte dengan
+              sample_weight.
+            - Histogram node besar masing-masing berukuran n_fitur * n_bins * (n_stats + 1)
+              * 8 byte. Setiap level tree memiliki paling banyak
+              n_samples / (PARTIAL_HIST_SAMPLES_PER_BIN * n_bins) node besar, sehingga total
+              histogram paling banyak depth * n_samples * n_fitur * (n_stats + 1) * 8
+              / PARTIAL_HIST_SAMPLES_PER_BIN byte.
+            - Setiap update membutuhkan O(batch * depth * n_fitur) untuk histogram node besar,
+              O(batch log batch) untuk mengelompokkan baris batch per leaf, evaluasi split
+              setiap node yang dilewati batch (histogram node kecil dari baris-nya), grow ulang
+              subtree yang berubah (sebanding dengan jumlah baris pada subtree tersebut) dan
+              O(n_nodes) untuk pembukuan node. History tidak pernah diurutkan ulang seluruhnya.
+
+        Args:
+            X: Data fitur batch baru.
+            y: Data target batch baru.
+            sample_weight: Bobot setiap sample. Default: None (bobot 1).
+            tol: Subtree di-grow ulang jika gain split terbaik melebihi gain split saat ini
+                lebih dari tol * gain split terbaik. Default: 0.0.
+            classes: Seluruh label class (hanya untuk batch pertama klasifikasi). Default: None.
+        """
+        if self.max_bins is None:
+            raise ValueError("partial_fit membutuhkan max_bins (training berbasis histogram)")
+        if self.max_leaf_nodes is not None:
+            raise ValueError("max_leaf_nodes tidak didukung untuk partial_fit")
+
+        X = np.asarray(X)
+        y = np.asarray(y)
+        if y.ndim != 2 or y.shape[1] == 1:
+            y = np.ravel(y)
+        if getattr(self, "_history", None) is None:
+            if getattr(self, "_tree", None) is not None:
+                raise ValueError("tree tidak dibuat dengan partial_fit (misal dari fit, load, prune "
+                                 "atau truncate) sehingga tidak dapat diperbarui, gunakan "
+                                 "partial_fit sejak batch pertama")
+            self._init_partial(X, y, classes)
+        if X.ndim != 2 or X.shape[1] != self.n_fitur:
+            raise ValueError(f"X harus berupa array 2 dimensi dengan {self.n_fitur} fitur")
+
+        # Kuantisasi dan encoding batch baru
+        codes = _bin_data(X, self.bin_thresholds_)
+        y_encoded = self._encode_target(y)
+        if self._encodes_target:
+            known = self.classes_[np.minimum(y_encoded, len(self.classes_) - 1)] == y
+            if not np.all(known):
+                raise ValueError(f"y berisi class yang tidak ada pada classes: {np.unique(y[~known])}")
+        w = None
+        if sample_weight is not None:
+            w = np.asarray(sample_weight, dtype=np.float64)
+            if w.shape != (len(X),):
+                raise ValueError("sample_weight harus berukuran sama dengan jumlah baris X")
+            if np.any(w < 0):
+                raise ValueError("sample_weight tidak boleh negatif")
+        stats = self._criterion.sample_stats(y_encoded, w)
+        stats = np.column_stack((stats, np.ones(len(stats))))
+
+        self.n_samples += len(X)
+        self.weighted_n_samples += len(X) if w is None else float(w.sum())
+        self._stats = None
+
+        # Batch pertama dimulai dari tree berisi root saja
+        if self._grown is None:
+            stats_total = stats.sum(axis=0)
+            self._grown = FlatTree(feature=[TREE_LEAF], threshold=[np.nan],
+                                   left=[TREE_LEAF], right=[TREE_LEAF],
+                                   value=[self._criterion.node_value(stats_total[:-1])],
+                                   impurity=[0.0], n_samples=[0], weighted_n_samples=[0.0])
+
+        # Mengarahkan batch baru ke tree dan memperbarui histogram node besar yang dilewati
+        indptr, path = self._code_tree(self._grown).decision_path(codes)
+        path_rows = np.repeat(np.arange(len(X)), np.diff(indptr))
+        touched = np.unique(path)
+        stored = np.array([node for node in touched if node in self._node_hist], dtype=np.intp)
+        if len(stored) > 0:
+            local = np.full(self._grown.node_count, -1, dtype=np.intp)
+            local[stored] = np.arange(len(stored))
+            pair_local = local[path]
+            in_stored = pair_local >= 0
+            rows = path_rows[in_stored]
+            hist = np.zeros((len(stored),) + self._node_hist[stored[0]].shape)
+            self._add_node_histograms(hist, pair_local[in_stored], codes[rows], stats[rows])
+            for node, hist_node in zip(stored, hist):
+                self._node_hist[node] += hist_node
+            self._update_nodes(stored)
+        self._history.append(codes, y_encoded, w, path[indptr[1:] - 1])
+
+        # Baris history hanya dibaca dari leaf subtree yang dibutuhkan
+        # (histogram node kecil dan grow ulang)
+        history = self._history
+        self._X, self._y, self._w = history.codes, history.y, history.w
+        self._executor = None
+        self._sorted_index = None
+        try:
+            # Posisi region setiap node jika seluruh history dipartisi seperti pada fit
+            # (leaf dalam urutan preorder): region node adalah [start[node], start[node + size])
+            region_start = np.zeros(self._grown.node_count + 1, dtype=np.intp)
+            np.cumsum(history.leaf_counts(self._grown.node_count), out=region_start[1:])
+
+            # Grow ulang subtree yang split terbaiknya berubah
+            regrow = self._partial_regrow_nodes(touched, region_start, tol)
+            if regrow:
+                self._regrow_subtrees(regrow, region_start)
+            self._store_histograms()
+        finally:
+            del self._X, self._y, self._w, self._executor, self._sorted_index
+
+        self.tree_ = self._tree_pruning(self._grown.compact())
+        self.fit_stats_ = None
+        del self._stats
+
+    def _init_partial(self, X, y, classes=None):
+        """
+        Fungsi yang digunakan untuk menyiapkan criteria, threshold bin dan data yang disimpan
+        dari batch pertama partial_fit.
+        """
+        if X.ndim != 2:
+            raise ValueError("X harus berupa array 2 dimensi")
+        self.n_fitur = X.shape[1]
+        self._init_max_features()
+        self._init_criterion(y if classes is None else np.asarray(classes))
+        if not self._criterion.additive:
+            raise ValueError(f"criteria {self.criteria} tidak didukung untuk partial_fit")
+
+        self.bin_thresholds_ = [_bin_thresholds(X[:, fitur_i], self.max_bins)
+                                for fitur_i in range(self.n_fitur)]
+        self._n_bins = max(len(thresh) for thresh in self.bin_thresholds_) + 1
+
+        # Data yang disimpan: history seluruh baris dan histogram node besar
+        self.n_samples = 0
+        self.weighted_n_samples = 0.0
+        self._history = _PartialHistory()
+        self._grown = None
+        self._node_hist = {}
+
+    def _code_tree(self, tree):
+        """Membuat salinan tree dengan threshold berupa kode bin (untuk mengarahkan kode bin)."""
+        threshold = np.full(tree.node_count, np.nan)
+        is_split = tree.left != TREE_LEAF
+        for fitur_i in np.unique(tree.feature[is_split]):
+            nodes = is_split & (tree.feature == fitur_i)
+            threshold[nodes] = np.searchsorted(self.bin_thresholds_[fitur_i], tree.threshold[nodes])
+
+        return FlatTree(tree.feature, threshold, tree.left, tree.right, tree.value,
+                        tree.impurity, tree.n_samples, tree.weighted_n_samples)
+
+    def _add_node_histograms(self, node_hist, nodes, codes, stats):
+        """
+        Fungsi yang digunakan untuk menambahkan statistik pasangan (node, baris) ke histogram node.
+
+        Args:
+            node_hist: Histogram (n_nodes, n_fitur, n_bins, n_stats + 1), diubah in-place.
+            nodes: Index histogram (0, ..., n_nodes - 1) untuk setiap pasangan.
+            codes: Kode bin baris untuk setiap pasangan.
+            stats: Statistik criteria (ditambah kolom count) baris untuk setiap pasangan.
+        """
+        n_nodes, _, n_bins, n_stats = node_hist.shape
+        for start in range(0, len(nodes), PARTIAL_CHUNK_SIZE):
+            chunk = slice(start, start + PARTIAL_CHUNK_SIZE)
+            weights = stats[chunk].ravel()
+            for fitur_i in range(self.n_fitur):
+                base = nodes[chunk] * n_bins + codes[chunk, fitur_i]
+                index = (base[:, None] * n_stats + np.arange(n_stats)).ravel()
+                node_hist[:, fitur_i] += np.bincount(index,
+                                                     weights = weights,
+                                                     minlength = n_nodes * n_bins * n_stats
+                                                     ).reshape(n_nodes, n_bins, n_stats)
+
+    def _update_nodes(self, nodes, node_hist=None):
+        """Memperbarui nilai, impurity dan jumlah sample node dari histogram-nya."""
+        tree = self._grown
+        if node_hist is None:
+            node_hist = self._node_hist
+        for node in nodes:
+            stats = node_hist[node][0].sum(axis=0)
+            tree.value[node] = self._criterion.node_value(stats[:-1])
+            tree.impurity[node] = self._criterion.node_impurity(stats[:-1])
+            tree.n_samples[node] = int(round(stats[-1]))
+            tree.weighted_n_samples[node] = self._criterion.node_weight(stats[:-1])
+
+    def _node_depth_size(self, tree):
+        """Menghitung kedalaman dan jumlah node subtree setiap node (tree dalam urutan preorder)."""
+        split_nodes = np.flatnonzero(tree.left != TREE_LEAF)
+        depth = np.zeros(tree.node_count, dtype=np.intp)
+        for node in split_nodes:
+            depth[tree.left[node]] = depth[tree.right[node]] = depth[node] + 1
+
+        size = np.ones(tree.node_count, dtype=np.intp)
+        for node in split_nodes[::-1]:
+            size[node] += size[tree.left[node]] + size[tree.right[node]]
+
+        return depth, size
+
+    def _subtree_rows(self, node, size, take=False):
+        """
+        Fungsi yang digunakan untuk mengambil index baris history pada subtree node.
+
+        Args:
+            node: Root subtree.
+            size: Jumlah node subtree (tree dalam urutan preorder).
+            take: Jika True, baris dilepas dari leaf-nya (untuk grow ulang).
+
+        Returns:
+            numpy.ndarray: Index baris, dikelompokkan per leaf dalam urutan preorder.
+        """
+        leaves = node + np.flatnonzero(self._grown.left[node:node + size] == TREE_LEAF)
+        if take:
+            return self._history.take(leaves)
+        return self._history.rows(leaves)
+
+    def _partial_regrow_nodes(self, touched, region_start, tol):
+        """
+        Fungsi yang digunakan untuk memilih node yang subtree-nya harus di-grow ulang.
+
+        Args:
+            touched: Node yang dilewati batch baru.
+            region_start: Posisi awal region setiap node (lihat _partial_fit).
+            tol: Toleransi relatif perubahan gain split.
+
+        Returns:
+            list: Node teratas yang subtree-nya di-grow ulang (urut preorder).
+        """
+        tree = self._grown
+        depth, size = self._node_depth_size(tree)
+        candidates = touched
+
+        # Total bobot bertambah sehingga gain node lain mengecil, split yang tidak lagi
+        # memenuhi impurity_reduction_min juga diperiksa
+        if self.impurity_reduction_min > 0:
+            split_nodes = np.flatnonzero(tree.left != TREE_LEAF)
+            weighted_impurity = tree.weighted_n_samples * tree.impurity
+            gain = (weighted_impurity[split_nodes]
+                    - weighted_impurity[tree.left[split_nodes]]
+                    - weighted_impurity[tree.right[split_nodes]]) / self.weighted_n_samples
+            weak = split_nodes[gain < self.impurity_reduction_min]
+            candidates = np.union1d(candidates, weak)
+
+        regrow = []
+        subtree_end = 0
+        for node in candidates:
+            # Node di dalam subtree yang sudah akan di-grow ulang dilewati
+            if node < subtree_end:
+                continue
+
+            hist = self._node_hist.get(node)
+            if hist is None:
+                # Node kecil: histogram dihitung dari baris history pada subtree-nya
+                # (nilai node juga dihitung ulang karena tidak diperbarui dari histogram)
+                hist = self._build_histogram(self._subtree_rows(node, size[node]))
+                self._update_nodes([node], {node: hist})
+
+            if self.max_depth is not None and depth[node] >= self.max_depth:
+                continue
+
+            # Gain split saat ini diambil sebelum _most_split_hist mengubah present_gain
+            present_gain = self._hist_gains(hist)
+            if not tree.is_leaf(node):
+                current_fitur = tree.feature[node]
+                current_bin = np.searchsorted(self.bin_thresholds_[current_fitur], tree.threshold[node])
+                current_gain = present_gain[current_fitur, current_bin]
+
+            features = self._sample_features(depth[node], region_start[node])
+            fitur_i, _, most_gain = self._most_split_hist(hist, features, present_gain)
+            if tree.is_leaf(node) or fitur_i is None:
+                changed = tree.is_leaf(node) != (fitur_i is None)
+            else:
+                changed = most_gain - current_gain > tol * most_gain
+
+            if changed:
+                regrow.append(int(node))
+                subtree_end = node + size[node]
+
+        return regrow
+
+    def _regrow_subtrees(self, regrow, region_start):
+        """
+        Fungsi yang digunakan untuk mengembangkan ulang subtree dari baris history.
+
+        Args:
+            regrow: Node teratas yang subtree-nya di-grow ulang (urut preorder).
+            region_start: Posisi awal region setiap node (lihat _partial_fit).
+        """
+        tree = self._grown
+        history = self._history
+        depth, size = self._node_depth_size(tree)
+
+        nodes = _NodeList()
+        nodes.feature = tree.feature.tolist()
+        nodes.threshold = tree.threshold.tolist()
+        nodes.left = tree.left.tolist()
+        nodes.right = tree.right.tolist()
+        nodes.value = list(tree.value)
+        nodes.impurity = tree.impurity.tolist()
+        nodes.n_samples = tree.n_samples.tolist()
+        nodes.weighted_n_samples = tree.weighted_n_samples.tolist()
+
+        regions = []
+        for node in regrow:
+            # Baris subtree dilepas dari leaf lama dan dipartisi in-place oleh _grow_tree
+            self._samples = self._subtree_rows(node, size[node], take=True)
+            self._samples_offset = region_start[node]
+            subtree = _NodeList()
+            try:
+                self._grow_tree(subtree, 0, len(self._samples), depth[node],
+                                self._node_hist.get(node))
+            finally:
+                regions.append(self._samples)
+                del self._samples, self._samples_offset
+
+            # Root subtree menggantikan node, children-nya di-graft ke bagian akhir
+            root = nodes.graft(subtree)
+            for field in ("feature", "threshold", "left", "right"):
+                getattr(nodes, field)[node] = getattr(nodes, field)[root]
+
+        self._grown, new_index = nodes.to_tree().compact(return_index=True)
+
+        # Histogram dan baris leaf di luar subtree (dan root subtree) hanya berganti index
+        self._node_hist = {int(new_index[node]): hist for node, hist in self._node_hist.items()
+                           if new_index[node] != TREE_LEAF}
+        history.remap(new_index)
+
+        # Baris pada subtree diarahkan ulang dari root subtree ke leaf barunya
+        regions = [np.sort(region) for region in regions]
+        rows = np.concatenate(regions)
+        start = np.repeat(new_index[np.asarray(regrow, dtype=np.intp)],
+                          [len(region) for region in regions])
+        history.assign(rows, self._code_tree(self._grown)._descend(history.codes, rows, start))
+
+    def _store_histograms(self):
+        """Menyimpan histogram node besar yang belum memiliki histogram (dari baris history)."""
+        min_samples = PARTIAL_HIST_SAMPLES_PER_BIN * self._n_bins
+        missing = [int(node) for node in np.flatnonzero(self._grown.n_samples >= min_samples)
+                   if node not in self._node_hist]
+        if missing:
+            _, size = self._node_depth_size(self._grown)
+            for node in missing:
+                self._node_hist[node] = self._build_histogram(self._subtree_rows(node, size[node]))
+
+    def compile(self):
+        """
+        Fungsi yang digunakan untuk mengompilasi tree menjadi fungsi Python/NumPy khusus.
+
+        Hasil kompilasi disimpan pada model dan dibuat ulang jika tree berubah
+        (fit ulang atau pruning).
+
+        Returns:
+            CompiledTree: Berisi predict_row(x) untuk satu baris (if/else bersarang)
+            dan predict(X) untuk batch.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledTree(self.tree_)
+
+        return self._compiled
+
+    def save(self, path):
+        """
+        Fungsi yang digunakan untuk menyimpan model yang sudah di-fit ke file biner.
+
+        File berisi header (versi format, class model, hyperparameter) dan array node
+        FlatTree yang disimpan berurutan, sehingga dapat dibaca kembali dengan load()
+        tanpa membangun ulang object Python untuk setiap node.
+
+        Args:
+            path (str): Path file tujuan.
+        """
+        # Hyperparameter diambil dari argumen __init__ class model
+        params = {}
+        for name in inspect.signature(type(self).__init__).parameters:
+            if name != "self":
+                value = getattr(self, name)
+                # Objek criteria (misal NewtonCriterion) disimpan sebagai nama class dan argumennya
+                if isinstance(value, _criteria.Criterion):
+                    value = _criterion_to_meta(value)
+                params[name] = value.item() if hasattr(value, "item") else value
+
+        meta = {
+            "class": type(self).__name__,
+            "params": params,
+            "n_samples": int(self.n_samples),
+            "weighted_n_samples": float(self.weighted_n_samples),
+            "n_fitur": int(self.n_fitur)
+        }
+        # Label class disimpan beserta dtype-nya sehingga label non-string kembali bertipe sama
+        if getattr(self, "classes_", None) is not None:
+            classes = np.asarray(self.classes_)
+            meta["classes"] = {
+                "values": classes.tolist(),
+                "dtype": None if classes.dtype.hasobject else classes.dtype.str
+            }
+        tree = self.tree_
+        write_arrays(path, meta, {
+            "feature": tree.feature,
+            "threshold": tree.threshold,
+            "left": tree.left,
+            "right": tree.right,
+            "value": tree.value,
+            "impurity": tree.impurity,
+            "n_samples": tree.n_samples,
+            "weighted_n_samples": tree.weighted_n_samples
+        })
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Fungsi yang digunakan untuk membaca model yang disimpan dengan save().
+
+        Dengan mmap=True array node tidak disalin ke memory, melainkan dibaca langsung
+        dari page cache, sehingga banyak proses dapat berbagi satu salinan model.
+
+        Args:
+            path (str): Path file model.
+            mmap (bool, optional): Baca array node dengan np.memmap (read-only). Default: True.
+
+        Returns:
+            DecisionTreeBase: Model yang siap digunakan untuk prediksi.
+        """
+        meta, arrays = read_arrays(path, mmap=mmap)
+
+        # Class model dicari dari subclass yang sesuai dengan class pemanggil
+        model_cls = None
+        stack = [cls]
+        while stack:
+            candidate = stack.pop()
+            if candidate.__name__ == meta["class"]:
+                model_cls = candidate
+                break
+            stack.extend(candidate.__subclasses__())
+        if model_cls is None:
+            raise ValueError(f"{path} berisi model {meta['class']}, bukan {cls.__name__}")
+
+        params = dict(meta["params"])
+        if isinstance(params.get("criteria"), dict):
+            params["criteria"] = _criterion_from_meta(params["criteria"])
+
+        model = model_cls(**params)
+        model.n_samples = meta["n_samples"]
+        model.weighted_n_samples = meta["weighted_n_samples"]
+        model.n_fitur = meta["n_fitur"]
+        model.fit_stats_ = None
+        if "classes" in meta:
+            classes = meta["classes"]
+            model.classes_ = np.asarray(classes["values"], dtype=classes["dtype"])
+        model.tree_ = FlatTree(**arrays)
+
+        return model
 
     def predict(self, X):
         """
         Fungsi yang digunakan untuk melakukan prediksi nilai target menggunakan model Decision Tree.
 
         Args:
-            X: Data fitur.
+            X: Data fitur (array atau matriks sparse CSR/CSC).
 
         Returns:
-            y: Nilai target yang diprediksi.
+            y: Nilai target yang diprediksi (numpy.ndarray).
         """
         
-        # Melakukan konversi terhadap input data
-        X = np.array(X).copy()
+        # Melakukan konversi terhadap input data (input sparse tidak didensifikasi)
+        X = _as_array(X)
 
-        # Melakukan prediksi
-        y = [self._predict_val(sample.reshape(1, -1)) for sample in X]
+        # Melakukan prediksi untuk seluruh baris sekaligus
+        y = self.tree_.value[self.apply(X)]
 
         return y
+
+    def apply(self, X):
+        """
+        Fungsi yang digunakan untuk mencari index leaf dari setiap baris X.
+
+        Args:
+            X: Data fitur (array atau matriks sparse CSR/CSC).
+
+        Returns:
+            numpy.ndarray: Index node leaf (pada tree_) untuk setiap baris.
+        """
+        # Input sparse dibaca langsung per elemen (tanpa cache leaf)
+        X = _as_array(X)
+        if not self.cache_size or isinstance(X, _SparseMatrix):
+            return self.tree_.apply(X)
+
+        return self._apply_cached(X)
+
+    def _apply_cached(self, X):
+        """
+        Mencari index leaf dengan cache LRU yang di-key dengan isi baris.
+
+        Baris yang sama dalam satu batch hanya ditelusuri sekali, dan baris yang sudah
+        ada di cache tidak ditelusuri ulang.
+
+        Args:
+            X (numpy.ndarray): Data fitur berbentuk (n_samples, n_fitur).
+
+        Returns:
+            numpy.ndarray: Index leaf untuk setiap baris.
+        """
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        if len(X) == 0:
+            return np.empty(0, dtype=np.intp)
+
+        # Setiap baris dipandang sebagai satu nilai byte sehingga dapat di-unique dan di-hash
+        keys = X.view(np.dtype((np.void, X.itemsize * X.shape[1]))).ravel()
+        unique_keys, first_row, inverse = np.unique(keys, return_index=True, return_inverse=True)
+
+        cache = self._leaf_cache
+        leaves = np.empty(len(unique_keys), dtype=np.intp)
+        missing = []
+        for i, key in enumerate(unique_keys):
+            leaf = cache.get(key.tobytes())
+            if leaf is None:
+                missing.append(i)
+            else:
+                cache.move_to_end(key.tobytes())
+                leaves[i] = leaf
+
+        # Hanya baris yang belum ada di cache yang ditelusuri
+        if missing:
+            leaves[missing] = self.tree_.apply(X[first_row[missing]])
+            for i in missing:
+                cache[unique_keys[i].tobytes()] = leaves[i]
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+        return leaves[np.ravel(inverse)]
+
+    def decision_path(self, X):
+        """
+        Fungsi yang digunakan untuk mencari node yang dilewati setiap baris X.
+
+        Args:
+            X: Data fitur.
+
+        Returns:
+            tuple: (indptr, indices) matriks indikator node dalam format CSR, node yang
+            dilewati baris i adalah indices[indptr[i]:indptr[i + 1]] (urut dari root).
+            Dapat diubah menjadi scipy.sparse.csr_matrix((np.ones(len(indices)), indices, indptr)).
+        """
+        return self.tree_.decision_path(_as_array(X))
     
 class DecisionTreeClassifier(DecisionTreeBase):
     """
@@ -455,6 +2174,13 @@ class DecisionTreeClassifier(DecisionTreeBase):
         sample_leaf_min (int, optional): Jumlah minimum sampel yang diperlukan pada leaf node. Default: 1.
         impurity_reduction_min (float, optional): Jumlah minimum pengurangan impurity yang diperlukan untuk melakukan split. Default: 0.0.
         alpha (float, optional): Parameter alpha untuk regularisasi dalam perhitungan impurity. Default: 0.0.
+        max_bins (int or None, optional): Jumlah bin maksimal tiap fitur. Jika diisi, fitur dikuantisasi satu kali menjadi kode bin dan split dicari dari histogram. None berarti tanpa binning. Default: None.
+        n_jobs (int or None, optional): Jumlah thread untuk pencarian split per fitur pada node besar dan pengembangan subtree. -1 berarti seluruh core. Hasil identik dengan n_jobs=1. Default: None.
+        max_leaf_nodes (int or None, optional): Jumlah leaf maksimal. Jika diisi, tree dikembangkan secara best-first (node dengan penurunan impurity terbesar di-split terlebih dahulu). None berarti tidak ada batasan. Default: None.
+        fit_stats (bool, optional): Jika True, statistik proses fit per kedalaman (jumlah node, threshold yang dievaluasi, pemanggilan criteria, byte partisi, waktu pencarian split, partisi dan pruning) disimpan pada atribut fit_stats_. Default: False.
+        max_features (int, float, str or None, optional): Jumlah fitur yang dipilih acak untuk dicari split-nya pada setiap node, berupa jumlah (int), proporsi (float), "sqrt" atau "log2". None berarti seluruh fitur. Default: None.
+        random_state (int or None, optional): Seed untuk pemilihan fitur acak (max_features). Default: None.
+        cache_size (int or None, optional): Jumlah baris maksimal yang index leaf-nya disimpan dalam cache LRU, sehingga baris yang sama tidak ditelusuri ulang pada apply/predict berikutnya. None berarti tanpa cache. Default: None.
 
     """
     def __init__(
@@ -464,7 +2190,14 @@ class DecisionTreeClassifier(DecisionTreeBase):
         sample_split_min = 2,
         sample_leaf_min = 1,
         impurity_reduction_min = 0.0,
-        alpa = 0.0
+        alpa = 0.0,
+        max_bins = None,
+        n_jobs = None,
+        max_leaf_nodes = None,
+        fit_stats = False,
+        max_features = None,
+        random_state = None,
+        cache_size = None
     ):
         super().__init__(
             criteria = criteria,
@@ -472,35 +2205,79 @@ class DecisionTreeClassifier(DecisionTreeBase):
             sample_leaf_min = sample_leaf_min,
             sample_split_min = sample_split_min,
             impurity_reduction_min = impurity_reduction_min,
-            alpa = alpa
+            alpa = alpa,
+            max_bins = max_bins,
+            n_jobs = n_jobs,
+            max_leaf_nodes = max_leaf_nodes,
+            fit_stats = fit_stats,
+            max_features = max_features,
+            random_state = random_state,
+            cache_size = cache_size
         )
         
-    def fit(self, X, y):
+    def _init_criterion(self, y):
+        # Melakukan inisialisasi criteria dengan class yang ada pada y,
+        # criteria dan majority vote bekerja pada kode class (lihat _encode_target)
+        self.classes_ = np.unique(y)
+        self._criterion = CRITERIA_CLF[self.criteria](classes=self.classes_, encoded=True)
+        self._eval_impurity = self._criterion.evaluate
+        self._calc_leaf_val = functools.partial(_calculate_majority_vote, classes=self.classes_)
+
+    _encodes_target = True
+
+    def _encode_target(self, y):
+        # Label di-encode satu kali menjadi kode class 0, ..., n_classes-1
+        return np.searchsorted(self.classes_, y)
+
+    def fit(self, X, y=None, sample_weight=None):
         """
         Melakukan pelatihan model Decision Tree Classifier.
 
         Args:
-            X (array-like): Data fitur pelatihan.
+            X (array-like, sparse matrix or ChunkedData): Data fitur pelatihan.
             y (array-like): Data target pelatihan.
+            sample_weight (array-like, optional): Bobot setiap sample. Baris duplikat dapat diganti satu baris dengan bobot sejumlah duplikatnya. Default: None.
 
         """
-        # Melakukan inisialisasi solver
-        self._eval_impurity = CRITERIA_CLF[self.criteria]
-        self._calc_leaf_val = _calculate_majority_vote
+        super(DecisionTreeClassifier, self).fit(X, y, sample_weight)
+
+    def partial_fit(self, X, y, classes=None, sample_weight=None, tol=0.0):
+        """
+        Memperbarui model Decision Tree Classifier dengan batch data baru (membutuhkan max_bins).
+
+        Batch pertama menginisialisasi model dan menentukan threshold bin dan class. Batch
+        berikutnya hanya memperbarui statistik node dan meng-grow ulang subtree yang
+        split terbaiknya berubah. Model yang dilatih dengan fit (atau hasil load, prune dan
+        truncate) tidak dapat diperbarui dan menghasilkan ValueError.
 
-        super(DecisionTreeClassifier, self).fit(X, y)
+        Args:
+            X (array-like): Data fitur batch baru.
+            y (array-like): Data target batch baru.
+            classes (array-like, optional): Seluruh label class, wajib pada batch pertama jika tidak seluruh class ada di batch tersebut. Default: None.
+            sample_weight (array-like, optional): Bobot setiap sample. Default: None.
+            tol (float, optional): Subtree di-grow ulang jika gain split terbaik melebihi gain split saat ini lebih dari tol * gain split terbaik. Default: 0.0.
+
+        """
+        self._partial_fit(X, y, sample_weight, tol, classes)
 
 class DecisionTreeRegressor(DecisionTreeBase):
     """
     Decision Tree Regressor untuk memodelkan masalah regresi.
 
     Args:
-        criteria (str, optional): Kriteria yang digunakan untuk pemilihan atribut pemisah. Default: "squared_error".
+        criteria (str or Criterion, optional): Kriteria yang digunakan untuk pemilihan atribut pemisah. Objek Criteria (misal NewtonCriterion dengan y berisi kolom gradient dan hessian) juga dapat digunakan. Default: "squared_error".
         max_depth (int or None, optional): Kedalaman maksimum dari pohon keputusan. None berarti tidak ada batasan kedalaman. Default: None.
         sample_split_min (int, optional): Jumlah minimum sampel yang diperlukan untuk melakukan split pada node. Default: 2.
         sample_leaf_min (int, optional): Jumlah minimum sampel yang diperlukan pada leaf node. Default: 1.
         impurity_reduction_min (float, optional): Jumlah minimum pengurangan impurity yang diperlukan untuk melakukan split. Default: 0.0.
         alpha (float, optional): Parameter alpha untuk regularisasi dalam perhitungan impurity. Default: 0.0.
+        max_bins (int or None, optional): Jumlah bin maksimal tiap fitur. Jika diisi, fitur dikuantisasi satu kali menjadi kode bin dan split dicari dari histogram. None berarti tanpa binning. Default: None.
+        n_jobs (int or None, optional): Jumlah thread untuk pencarian split per fitur pada node besar dan pengembangan subtree. -1 berarti seluruh core. Hasil identik dengan n_jobs=1. Default: None.
+        max_leaf_nodes (int or None, optional): Jumlah leaf maksimal. Jika diisi, tree dikembangkan secara best-first (node dengan penurunan impurity terbesar di-split terlebih dahulu). None berarti tidak ada batasan. Default: None.
+        fit_stats (bool, optional): Jika True, statistik proses fit per kedalaman (jumlah node, threshold yang dievaluasi, pemanggilan criteria, byte partisi, waktu pencarian split, partisi dan pruning) disimpan pada atribut fit_stats_. Default: False.
+        max_features (int, float, str or None, optional): Jumlah fitur yang dipilih acak untuk dicari split-nya pada setiap node, berupa jumlah (int), proporsi (float), "sqrt" atau "log2". None berarti seluruh fitur. Default: None.
+        random_state (int or None, optional): Seed untuk pemilihan fitur acak (max_features). Default: None.
+        cache_size (int or None, optional): Jumlah baris maksimal yang index leaf-nya disimpan dalam cache LRU, sehingga baris yang sama tidak ditelusuri ulang pada apply/predict berikutnya. None berarti tanpa cache. Default: None.
 
     """
     def __init__(
@@ -510,7 +2287,14 @@ class DecisionTreeRegressor(DecisionTreeBase):
         sample_split_min = 2,
         sample_leaf_min = 1,
         impurity_reduction_min = 0.0,
-        alpa = 0.0
+        alpa = 0.0,
+        max_bins = None,
+        n_jobs = None,
+        max_leaf_nodes = None,
+        fit_stats = False,
+        max_features = None,
+        random_state = None,
+        cache_size = None
     ):
         super().__init__(
             criteria = criteria,
@@ -518,20 +2302,60 @@ class DecisionTreeRegressor(DecisionTreeBase):
             sample_leaf_min = sample_leaf_min,
             sample_split_min = sample_split_min,
             impurity_reduction_min = impurity_reduction_min,
-            alpa = alpa
+            alpa = alpa,
+            max_bins = max_bins,
+            n_jobs = n_jobs,
+            max_leaf_nodes = max_leaf_nodes,
+            fit_stats = fit_stats,
+            max_features = max_features,
+            random_state = random_state,
+            cache_size = cache_size
         )
 
-    def fit(self, X, y):
+    def _init_criterion(self, y):
+        if isinstance(self.criteria, _criteria.Criterion):
+            # Criteria kustom (misal NewtonCriterion untuk gradient boosting),
+            # nilai leaf dihitung dari statistik criteria tersebut
+            self._criterion = self.criteria
+            self._eval_impurity = self._criterion.evaluate
+            self._calc_leaf_val = self._criterion.leaf_value
+            return
+
+        # Melakukan inisialisasi criteria
+        self._criterion = CRITERIA_REG[self.criteria]()
+        self._eval_impurity = self._criterion.evaluate
+        if isinstance(self._criterion, _criteria.MAECriterion):
+            # Impurity MAE dihitung terhadap median, sehingga leaf juga bernilai median
+            self._calc_leaf_val = self._criterion.leaf_value
+        else:
+            self._calc_leaf_val = _calculate_average_vote
+
+    def fit(self, X, y=None, sample_weight=None):
         """
         Melakukan pelatihan model Decision Tree Regressor.
 
         Args:
-            X (array-like): Data fitur pelatihan.
+            X (array-like, sparse matrix or ChunkedData): Data fitur pelatihan.
             y (array-like): Data target pelatihan.
+            sample_weight (array-like, optional): Bobot setiap sample. Baris duplikat dapat diganti satu baris dengan bobot sejumlah duplikatnya. Default: None.
 
         """
-        # Melakukan inisialisasi solver
-        self._eval_impurity = CRITERIA_REG[self.criteria]
-        self._calc_leaf_val = _calculate_average_vote
+        super(DecisionTreeRegressor, self).fit(X, y, sample_weight)
 
-        super(DecisionTreeRegressor, self).fit(X, y)
\ No newline at end of file
+    def partial_fit(self, X, y, sample_weight=None, tol=0.0):
+        """
+        Memperbarui model Decision Tree Regressor dengan batch data baru (membutuhkan max_bins).
+
+        Batch pertama menginisialisasi model dan menentukan threshold bin. Batch berikutnya
+        hanya memperbarui statistik node dan meng-grow ulang subtree yang split terbaiknya berubah.
+        Model yang dilatih dengan fit (atau hasil load, prune dan truncate) tidak dapat
+        diperbarui dan menghasilkan ValueError.
+
+        Args:
+            X (array-like): Data fitur batch baru.
+            y (array-like): Data target batch baru.
+            sample_weight (array-like, optional): Bobot setiap sample. Default: None.
+            tol (float, optional): Subtree di-grow ulang jika gain split terbaik melebihi gain split saat ini lebih dari tol * gain split terbaik. Default: 0.0.
+
+        """
+        self._partial_fit(X, y, sample_weight, tol)
@@ -0,0 +1,99 @@
+# Kompilasi FlatTree menjadi fungsi Python/NumPy khusus
+
+import numpy as np
+
+# Python membatasi kedalaman indentasi (sekitar 100 level), sehingga subtree
+# yang lebih dalam dari batas ini dipindahkan ke fungsi terpisah
+MAX_NESTED_DEPTH = 64
+
+class CompiledTree:
+    """
+    Hasil kompilasi dari sebuah FlatTree,
+
+        - predict_row    = Fungsi prediksi satu baris (if/else bersarang)
+        - source_row     = Source code predict_row
+
+    Hanya prediksi satu baris yang dikompilasi. Untuk batch, kode khusus per node
+    (mask per node) membutuhkan O(node x baris), sehingga predict(X) menurunkan
+    seluruh baris level demi level melalui FlatTree.apply.
+
+    Saat di-pickle hanya source code dan tree yang disimpan, predict_row dibuat
+    ulang dengan exec saat di-load.
+    """
+    def __init__(self, tree):
+        self.tree = tree
+        self.source_row = _generate_row_source(tree)
+        self._build()
+
+    def _build(self):
+        """Menjalankan source code dan mengambil fungsi hasil kompilasi."""
+        namespace = {
+            "inf": np.inf,
+            "_V": list(self.tree.value)
+        }
+        exec(compile(self.source_row, "<compiled tree>", "exec"), namespace)
+
+        self.predict_row = namespace["predict_row"]
+
+    def predict(self, X):
+        """
+        Memprediksi seluruh baris X sekaligus.
+
+        Args:
+            X (numpy.ndarray): Data fitur berbentuk (n_samples, n_fitur).
+
+        Returns:
+            numpy.ndarray: Nilai prediksi setiap baris.
+        """
+        return self.tree.value[self.tree.apply(np.asarray(X))]
+
+    def __getstate__(self):
+        # Fungsi hasil exec tidak dapat di-pickle, sehingga hanya source code yang disimpan
+        state = self.__dict__.copy()
+        del state["predict_row"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._build()
+
+def _generate_row_source(tree):
+    """
+    Membuat source code fungsi predict_row(x) berupa if/else bersarang.
+
+    Args:
+        tree (FlatTree): Tree yang dikompilasi.
+
+    Returns:
+        str: Source code.
+    """
+    functions = []
+    pending = [("predict_row", 0)]
+    while pending:
+        name, root = pending.pop()
+        lines = [f"def {name}(x):"]
+
+        # Menulis node secara preorder menggunakan stack (node, indentasi, label else)
+        stack = [(root, 1, None)]
+        while stack:
+            node, indent, label = stack.pop()
+            pad = "    " * indent
+            if label is not None:
+                lines.append("    " * (indent - 1) + label)
+
+            if tree.is_leaf(node):
+                lines.append(f"{pad}return _V[{node}]")
+            elif indent > MAX_NESTED_DEPTH:
+                # Subtree yang terlalu dalam dipindahkan ke fungsi terpisah
+                lines.append(f"{pad}return _node_{node}(x)")
+                pending.append((f"_node_{node}", node))
+            else:
+                fitur = tree.feature[node]
+                thresh = repr(float(tree.threshold[node]))
+                lines.append(f"{pad}if x[{fitur}] <= {thresh}:")
+                stack.append((tree.right[node], indent + 1, "else:"))
+                stack.append((tree.left[node], indent + 1, None))
+
+        functions.append("\n".join(lines))
+
+    return "\n\n".join(functions) + "\n"
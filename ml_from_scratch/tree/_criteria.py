@@ -1,142 +1,466 @@
 # Menentukan criteria dalam menghitung Information Gain
 
+import bisect
+import heapq
+
 import numpy as np
 
+# BASE
+class Criterion:
+    """
+    Base class criteria yang bekerja di atas sufficient statistics.
+
+    Objek criteria menyimpan statistik dari satu kumpulan sample dan dapat
+    di-update secara incremental,
+
+        - reset            = Mengosongkan statistik
+        - update           = Menambahkan sample ke statistik
+        - reverse_update   = Mengeluarkan sample dari statistik
+        - impurity         = Impurity dari statistik saat ini
+
+    Seluruh method menerima sample_weight opsional (None berarti bobot 1 untuk
+    setiap sample), statistik menjadi jumlah berbobot.
+
+    Selain itu terdapat method stateless evaluate (impurity dari sebuah array y)
+    dan sweep (impurity child kiri & kanan untuk seluruh posisi split dari y yang
+    sudah diurutkan) yang aman digunakan bersamaan oleh beberapa thread.
+
+    Criteria dengan additive = True memiliki statistik per sample (sample_stats)
+    yang dapat dijumlahkan, sehingga dapat digunakan untuk split berbasis histogram.
+    """
+    additive = True
+
+    def reset(self):
+        self.stats = np.zeros(self.n_stats)
+
+    def update(self, y, sample_weight=None):
+        self.stats = self.stats + self.sample_stats(y, sample_weight).sum(axis=0)
+
+    def reverse_update(self, y, sample_weight=None):
+        self.stats = self.stats - self.sample_stats(y, sample_weight).sum(axis=0)
+
+    def impurity(self):
+        return float(self.node_impurity(self.stats))
+
+    def evaluate(self, y, sample_weight=None):
+        """
+        Menghitung impurity dari array target (y) tanpa mengubah state objek.
+
+        Args:
+            y (array-like): Array target.
+            sample_weight (array-like, optional): Bobot setiap sample.
+
+        Returns:
+            float: Impurity dari node.
+
+        """
+        return float(self.node_impurity(self.sample_stats(y, sample_weight).sum(axis=0)))
+
+    def sweep(self, y, sample_weight=None):
+        """
+        Menghitung impurity child kiri dan kanan untuk setiap posisi split.
+
+        Args:
+            y (array-like): Array target yang sudah diurutkan berdasarkan nilai fitur.
+            sample_weight (array-like, optional): Bobot setiap sample (urutan sama dengan y).
+
+        Returns:
+            tuple: Impurity child kiri (y[:i]) dan kanan (y[i:]) untuk i = 1, ..., n-1.
+
+        """
+        # Statistik kumulatif dari kiri ke kanan
+        stats = self.sample_stats(y, sample_weight)
+        stats_left = np.cumsum(stats, axis=0)
+        stats_total = stats_left[-1]
+        stats_left = stats_left[:-1]
+        stats_right = stats_total - stats_left
+
+        return self.node_impurity(stats_left), self.node_impurity(stats_right)
+
+    def leaf_value(self, y, sample_weight=None):
+        """
+        Menghitung nilai prediksi leaf dari array target (y).
+
+        Args:
+            y (array-like): Array target.
+            sample_weight (array-like, optional): Bobot setiap sample.
+
+        Returns:
+            Nilai prediksi leaf.
+
+        """
+        return self.node_value(self.sample_stats(y, sample_weight).sum(axis=0))
+
 # CLASSIFICATION
+class ClassificationCriterion(Criterion):
+    """
+    Criteria klasifikasi dengan statistik berupa vektor count tiap class.
 
-def Gini(y):
+        - classes   = Label class yang sudah diurutkan
+        - encoded   = Apakah y sudah berupa kode class (0, ..., n_classes-1)
     """
-    Menghitung Gini impurity dari array target (y).
+    def __init__(self, classes, encoded=False):
+        self.classes = np.asarray(classes)
+        self.encoded = encoded
+        self.n_stats = len(self.classes)
+        self.reset()
+
+    def _encode(self, y):
+        # Label di-encode menjadi kode class, kecuali jika sudah di-encode
+        if self.encoded:
+            return np.ravel(y)
+        return np.searchsorted(self.classes, np.ravel(y))
+
+    def sample_stats(self, y, sample_weight=None):
+        # Melakukan encoding class menjadi vektor one-hot (berbobot)
+        y_encoded = self._encode(y)
+        one_hot = np.zeros((len(y_encoded), self.n_stats))
+        one_hot[np.arange(len(y_encoded)), y_encoded] = 1 if sample_weight is None else sample_weight
+
+        return one_hot
+
+    def evaluate(self, y, sample_weight=None):
+        # Vektor count class langsung dari bincount (tanpa one-hot)
+        counts = np.bincount(self._encode(y), weights=sample_weight, minlength=self.n_stats)
+        return float(self.node_impurity(counts.astype(float)))
+
+    def node_value(self, counts):
+        """Majority class dari vektor count class."""
+        return self.classes[np.argmax(counts)]
+
+    @staticmethod
+    def node_weight(counts):
+        """Jumlah bobot sample dari vektor count class (dapat berupa batch)."""
+        return counts.sum(axis=-1)
+
+class GiniCriterion(ClassificationCriterion):
+    @staticmethod
+    def node_impurity(counts):
+        """Gini impurity dari vektor count class (dapat berupa batch)."""
+        N_m = counts.sum(axis=-1, keepdims=True)
+        p_m = counts / N_m
+        return np.sum(p_m * (1 - p_m), axis=-1)
+
+class LogLossCriterion(ClassificationCriterion):
+    @staticmethod
+    def node_impurity(counts):
+        """Misclassification impurity dari vektor count class (dapat berupa batch)."""
+        N_m = counts.sum(axis=-1)
+        return 1 - counts.max(axis=-1) / N_m
+
+class EntropyCriterion(ClassificationCriterion):
+    @staticmethod
+    def node_impurity(counts):
+        """Entropy impurity dari vektor count class (dapat berupa batch)."""
+        N_m = counts.sum(axis=-1, keepdims=True)
+        p_m = counts / N_m
+        log_p = np.log(p_m, out=np.zeros_like(p_m), where=p_m > 0)
+        return -np.sum(p_m * log_p, axis=-1)
 
-    Args:
-        y (array-like): Array target yang berisi label kelas.
+# REGRESSION
+class MSECriterion(Criterion):
+    """
+    Criteria Mean Squared Error dengan statistik [n, sum, sum of squares].
+    """
+    n_stats = 3
 
-    Returns:
-        float: Gini impurity dari node.
+    def __init__(self):
+        self.reset()
+
+    def sample_stats(self, y, sample_weight=None):
+        y = np.ravel(y).astype(float)
+        w = np.ones_like(y) if sample_weight is None else np.asarray(sample_weight, dtype=float)
+        return np.column_stack((w, w * y, w * y ** 2))
+
+    @staticmethod
+    def node_value(stats):
+        """Rata-rata y dari statistik [n, sum, sum of squares]."""
+        return stats[1] / stats[0]
+
+    @staticmethod
+    def node_weight(stats):
+        """Jumlah bobot sample dari statistik (dapat berupa batch)."""
+        return stats[..., 0]
+
+    @staticmethod
+    def node_impurity(stats):
+        """MSE dari statistik [n, sum, sum of squares] (dapat berupa batch)."""
+        n, s, sq = stats[..., 0], stats[..., 1], stats[..., 2]
 
+        # Var = E[y^2] - E[y]^2, dibatasi agar tidak negatif karena floating point
+        return np.maximum(sq / n - (s / n) ** 2, 0.0)
+
+    def evaluate(self, y, sample_weight=None):
+        # Centering y agar sum of squares stabil secara numerik
+        y = np.ravel(y).astype(float)
+        return super().evaluate(y - np.average(y, weights=sample_weight), sample_weight)
+
+    def sweep(self, y, sample_weight=None):
+        y = np.ravel(y).astype(float)
+        return super().sweep(y - np.average(y, weights=sample_weight), sample_weight)
+
+class NewtonCriterion(Criterion):
+    """
+    Criteria second-order (Newton) untuk gradient boosting dengan statistik
+    [n, sum gradient, sum hessian].
+
+    Target berupa array (n_samples, 2) berisi gradient dan hessian dari loss.
+    Impurity node adalah -G^2 / (H + l2_regularization) dibagi jumlah sample,
+    sehingga penurunan impurity berbobot jumlah sample (seperti pada split
+    search) sama dengan gain Newton G_L^2/H_L + G_R^2/H_R - G^2/H.
+
+        - l2_regularization   = Regularisasi L2 nilai leaf
     """
-    # Melakukan ekstraksi pada class
+    n_stats = 3
+
+    def __init__(self, l2_regularization=0.0):
+        self.l2_regularization = l2_regularization
+        self.reset()
+
+    def sample_stats(self, y, sample_weight=None):
+        y = np.asarray(y, dtype=float).reshape(-1, 2)
+        w = np.ones(len(y)) if sample_weight is None else np.asarray(sample_weight, dtype=float)
+        return np.column_stack((w, w[:, None] * y))
 
-    K, counts = np.unique(y, return_counts =True)
-    counts_unique = dict(zip(K, counts))
-    N_m = len(y)
+    def node_value(self, stats):
+        """Nilai leaf Newton -G / (H + l2_regularization)."""
+        return -stats[1] / (stats[2] + self.l2_regularization)
 
-    # Melakukan kalkulasi proporsi dari observasi class k
-    p_m = {}
-    for k in K:
-        p_m[k] = counts_unique[k] / N_m
+    @staticmethod
+    def node_weight(stats):
+        """Jumlah bobot sample dari statistik (dapat berupa batch)."""
+        return stats[..., 0]
 
-    # Menghitung impurity dari node
-    impurity_node = 0
-    for k in K:
-        impurity_node += p_m[k] * (1-p_m[k])
-    
-    return impurity_node
+    def node_impurity(self, stats):
+        """-G^2 / (H + l2_regularization) / n dari statistik (dapat berupa batch)."""
+        n, g, h = stats[..., 0], stats[..., 1], stats[..., 2]
+        return -g ** 2 / (h + self.l2_regularization) / n
 
-def Log_Loss(y):
+class MAECriterion(Criterion):
     """
-    Menghitung Log Loss impurity dari array target (y).
+    Criteria Mean Absolute Error terhadap median node.
+
+    Statistik berupa running-median structure: list nilai y yang selalu terurut
+    (beserta bobotnya) sehingga median dapat diambil dari posisi tengah.
+    """
+    additive = False
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.values = []
+        self.weights = []
+
+    def update(self, y, sample_weight=None):
+        y = np.ravel(y).astype(float)
+        w = np.ones_like(y) if sample_weight is None else np.ravel(sample_weight)
+        for val, weight in zip(y, w):
+            i = bisect.bisect_right(self.values, val)
+            self.values.insert(i, val)
+            self.weights.insert(i, weight)
+
+    def reverse_update(self, y, sample_weight=None):
+        y = np.ravel(y).astype(float)
+        w = np.ones_like(y) if sample_weight is None else np.ravel(sample_weight)
+        for val, weight in zip(y, w):
+            # Mencari nilai yang sama dengan bobot yang sama
+            i = bisect.bisect_left(self.values, val)
+            while self.weights[i] != weight:
+                i += 1
+            del self.values[i]
+            del self.weights[i]
+
+    def impurity(self):
+        return self.node_impurity(np.asarray(self.values), np.asarray(self.weights))
+
+    @staticmethod
+    def median(y_sorted, w_sorted=None):
+        """Median (berbobot) dari array y yang sudah terurut dan tidak kosong."""
+        n = len(y_sorted)
+        if w_sorted is None:
+            return 0.5 * (y_sorted[(n-1) // 2] + y_sorted[n // 2])
+
+        # Weighted median: rata-rata nilai terkecil dengan bobot kumulatif >= W/2
+        # dan nilai terkecil dengan bobot kumulatif > W/2 (sama dengan median biasa
+        # jika seluruh bobot 1)
+        w_cum = np.cumsum(w_sorted)
+        half = w_cum[-1] / 2
+        lower = np.searchsorted(w_cum, half, side="left")
+        upper = min(np.searchsorted(w_cum, half, side="right"), n - 1)
+        return 0.5 * (y_sorted[lower] + y_sorted[upper])
+
+    @staticmethod
+    def node_impurity(y_sorted, w_sorted=None):
+        """MAE terhadap median (berbobot) dari array y yang sudah terurut."""
+        # Node tanpa sample atau dengan total bobot nol memiliki impurity 0 (sama dengan sweep)
+        if len(y_sorted) == 0:
+            return 0.0
+        if w_sorted is None:
+            median = MAECriterion.median(y_sorted)
+            return float(np.mean(np.abs(y_sorted - median)))
+
+        w_total = np.sum(w_sorted)
+        if w_total <= 0:
+            return 0.0
+        median = MAECriterion.median(y_sorted, w_sorted)
+        return float(np.sum(w_sorted * np.abs(y_sorted - median)) / w_total)
+
+    def leaf_value(self, y, sample_weight=None):
+        """Nilai leaf adalah median (berbobot), titik yang meminimalkan MAE node."""
+        y = np.ravel(y).astype(float)
+        if sample_weight is None:
+            return float(self.median(np.sort(y)))
+
+        order = np.argsort(y, kind="stable")
+        return float(self.median(y[order], np.asarray(sample_weight, dtype=float)[order]))
+
+    def evaluate(self, y, sample_weight=None):
+        y = np.ravel(y).astype(float)
+        if sample_weight is None:
+            return self.node_impurity(np.sort(y))
+
+        order = np.argsort(y, kind="stable")
+        return self.node_impurity(y[order], np.asarray(sample_weight, dtype=float)[order])
+
+    def sweep(self, y, sample_weight=None):
+        # Centering y agar running sum stabil secara numerik (MAE tidak berubah)
+        y = np.ravel(y).astype(float)
+        y = y - y.mean()
+        w = np.ones(len(y)) if sample_weight is None else np.asarray(sample_weight, dtype=float)
+
+        # Child kiri adalah prefix y[:i], child kanan adalah prefix dari y terbalik
+        mae_left = _prefix_mae(y, w)[:-1]
+        mae_right = _prefix_mae(y[::-1], w[::-1])[-2::-1]
+
+        return mae_left, mae_right
+
+def _prefix_mae(y, w):
+    """
+    Menghitung MAE terhadap median (berbobot) untuk setiap prefix y[:i+1] dalam O(n log n).
+
+    Sample disimpan pada dua heap: heap bawah (max-heap) berisi prefix terkecil
+    dengan bobot >= W/2 dan heap atas (min-heap) berisi sisanya. Median diambil
+    dari puncak kedua heap, sedangkan jumlah bobot dan jumlah w*y setiap heap
+    disimpan sehingga jumlah deviasi absolut dapat dihitung tanpa iterasi ulang.
+
+    Args:
+        y (numpy.ndarray): Array target.
+        w (numpy.ndarray): Bobot setiap sample.
+
+    Returns:
+        numpy.ndarray: MAE untuk prefix dengan panjang 1, ..., n.
+    """
+    heappush, heappop = heapq.heappush, heapq.heappop
+    mae = np.zeros(len(y))
+    low, high = [], []
+    w_low, w_high, s_low, s_high = 0.0, 0.0, 0.0, 0.0
+    for i, (val, weight) in enumerate(zip(y.tolist(), w.tolist())):
+        if low and val <= -low[0][0]:
+            heappush(low, (-val, i, weight))
+            w_low += weight
+            s_low += weight * val
+        else:
+            heappush(high, (val, i, weight))
+            w_high += weight
+            s_high += weight * val
+
+        # Menyeimbangkan heap: heap bawah adalah prefix terkecil dengan bobot >= W/2
+        half = 0.5 * (w_low + w_high)
+        while w_low < half:
+            val_move, j, weight_move = heappop(high)
+            heappush(low, (-val_move, j, weight_move))
+            w_low += weight_move
+            w_high -= weight_move
+            s_low += weight_move * val_move
+            s_high -= weight_move * val_move
+        while low and w_low - low[0][2] >= half:
+            neg_val, j, weight_move = heappop(low)
+            heappush(high, (-neg_val, j, weight_move))
+            w_low -= weight_move
+            w_high += weight_move
+            s_low += weight_move * neg_val
+            s_high -= weight_move * neg_val
+
+        if half <= 0:
+            continue
+
+        # Median = rata-rata nilai dengan bobot kumulatif >= W/2 dan > W/2
+        lower = -low[0][0]
+        upper = lower if w_low > half or not high else high[0][0]
+        median = 0.5 * (lower + upper)
+        deviation = median * w_low - s_low + s_high - median * w_high
+        mae[i] = max(deviation, 0.0) / (2 * half)
+
+    return mae
+
+# FUNCTIONAL
+def Gini(y, sample_weight=None):
+    """
+    Menghitung Gini impurity dari array target (y).
 
     Args:
         y (array-like): Array target yang berisi label kelas.
+        sample_weight (array-like, optional): Bobot setiap sample. Default: None (bobot 1).
 
     Returns:
-        float: Log Loss impurity dari node.
+        float: Gini impurity dari node.
 
     """
-    # Melakukan ekstraksi pada class
+    return GiniCriterion(np.unique(y)).evaluate(y, sample_weight)
 
-    K, counts = np.unique(y, return_counts =True)
-    counts_unique = dict(zip(K, counts))
-    N_m = len(y)
+def Log_Loss(y, sample_weight=None):
+    """
+    Menghitung Log Loss impurity dari array target (y).
 
-    # Melakukan kalkulasi proporsi dari observasi class k
-    p_m = {}
-    for k in K:
-        p_m[k] = counts_unique[k] / N_m
+    Args:
+        y (array-like): Array target yang berisi label kelas.
+        sample_weight (array-like, optional): Bobot setiap sample. Default: None (bobot 1).
 
-    # Menghitung majority class pada node m
-    max_ind = np.argmax(counts)
-    max_class = K[max_ind] 
+    Returns:
+        float: Log Loss impurity dari node.
 
-    # Menghitung impurity dari node
-    impurity_node = 1 - p_m[max_class]
-    
-    return impurity_node
+    """
+    return LogLossCriterion(np.unique(y)).evaluate(y, sample_weight)
 
-def Entropy(y):
+def Entropy(y, sample_weight=None):
     """
     Menghitung Entropy impurity dari array target (y).
 
     Args:
         y (array-like): Array target yang berisi label kelas.
+        sample_weight (array-like, optional): Bobot setiap sample. Default: None (bobot 1).
 
     Returns:
         float: Entropy impurity dari node.
 
     """
-    # Melakukan ekstraksi pada class
-
-    K, counts = np.unique(y, return_counts =True)
-    counts_unique = dict(zip(K, counts))
-    N_m = len(y)
+    return EntropyCriterion(np.unique(y)).evaluate(y, sample_weight)
 
-    # Melakukan kalkulasi proporsi dari observasi class k
-    p_m = {}
-    for k in K:
-        p_m[k] = counts_unique[k] / N_m
-
-    # Menghitung impurity dari node
-    impurity_node = 0
-    for k in K:
-        impurity_node += p_m[k] * np.log(p_m[k])
-
-    return impurity_node
-
-# REGRESSION
-def MSE(y):
+def MSE(y, sample_weight=None):
     """
     Menghitung Mean Squared Error (MSE) dari array target (y) untuk masalah regresi.
 
     Args:
         y (array-like): Array target yang berisi nilai-nilai target.
+        sample_weight (array-like, optional): Bobot setiap sample. Default: None (bobot 1).
 
     Returns:
         float: MSE dari node.
 
     """
-    # Menghitung jumlah data y
-    n = len(y)
-
-    # Mengurangi nilai y dengan rata-rata dari y 
-    r = y - np.mean(y)
+    return MSECriterion().evaluate(y, sample_weight)
 
-    # Kuadratkan nilai r
-    r = r ** 2
-
-    # Menjumlahkan nilai dari y
-    r = np.sum(r)
-        
-    return r / n 
-
-def MAE(y):
+def MAE(y, sample_weight=None):
     """
     Menghitung Mean Absolute Error (MAE) dari array target (y) untuk masalah regresi.
 
     Args:
         y (array-like): Array target yang berisi nilai-nilai target.
+        sample_weight (array-like, optional): Bobot setiap sample. Default: None (bobot 1).
 
     Returns:
         float: MAE dari node.
 
     """
-    # Menghitung jumlah data y
-    n = len(y)
-
-    # Mengurangi nilai y dengan rata-rata dari y dan absolutkan
-    r = abs(y - np.mean(y))
-
-    # Menjumlahkan nilai dari y
-    r = np.sum(r)
-        
-    return r / n 
\ No newline at end of file
+    return MAECriterion().evaluate(y, sample_weight)
@@ -0,0 +1,116 @@
+# Dataset training yang sudah diproses dan dapat digunakan ulang untuk banyak fit
+
+import threading
+
+import numpy as np
+
+class TreeDataset:
+    """
+    Data training (X, y) yang divalidasi, dikonversi dan diproses satu kali, sehingga
+    dapat digunakan ulang untuk banyak fit (misal pencarian hyperparameter),
+
+        - X             = Data fitur berbentuk (n_samples, n_fitur), dikonversi menjadi float64
+        - y             = Data target
+        - sample_weight = Bobot setiap sample, digunakan jika fit tidak diberi sample_weight
+        - presort       = Apakah index baris yang terurut untuk setiap fitur dihitung
+        - max_bins      = Jumlah bin maksimal yang langsung dihitung (hasil binning untuk
+                          max_bins lain dihitung saat dibutuhkan dan disimpan)
+
+    Seluruh array bersifat read-only dan hasil yang dihitung saat dibutuhkan dilindungi
+    lock, sehingga satu TreeDataset aman digunakan bersama oleh beberapa thread. Untuk
+    beberapa proses, TreeDataset dapat di-pickle beserta hasil yang sudah dihitung.
+    """
+    def __init__(self, X, y, sample_weight=None, presort=True, max_bins=None):
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        y = np.asarray(y)
+        if X.ndim != 2:
+            raise ValueError("X harus berupa array 2 dimensi")
+        if y.ndim != 2 or y.shape[1] == 1:
+            y = np.ravel(y)
+        if len(y) != len(X):
+            raise ValueError("X dan y harus memiliki jumlah baris yang sama")
+
+        if sample_weight is not None:
+            sample_weight = np.asarray(sample_weight, dtype=np.float64)
+            if sample_weight.shape != (len(X),):
+                raise ValueError("sample_weight harus berukuran sama dengan jumlah baris X")
+            if np.any(sample_weight < 0):
+                raise ValueError("sample_weight tidak boleh negatif")
+
+        self.X = _read_only(X)
+        self.y = _read_only(y)
+        self.sample_weight = None if sample_weight is None else _read_only(sample_weight)
+
+        # Index baris terurut tiap fitur, kolom fitur_i berisi argsort dari X[:, fitur_i]
+        self.sorted_index = None
+        if presort:
+            index_dtype = np.int32 if len(X) < 2**31 else np.intp
+            self.sorted_index = _read_only(np.argsort(X, axis=0, kind="stable").astype(index_dtype))
+
+        self._lock = threading.Lock()
+        self._binned = {}
+        self._encoded_target = None
+        if max_bins is not None:
+            self.binned(max_bins)
+
+    @property
+    def shape(self):
+        return self.X.shape
+
+    def __len__(self):
+        return len(self.X)
+
+    def binned(self, max_bins):
+        """
+        Mengambil hasil kuantisasi X untuk training berbasis histogram.
+
+        Args:
+            max_bins (int): Jumlah bin maksimal tiap fitur.
+
+        Returns:
+            tuple: (X_binned, bin_thresholds).
+        """
+        # Import di dalam fungsi untuk menghindari circular import dengan _classes
+        from ._classes import _bin_data
+        from ._classes import _bin_thresholds
+
+        with self._lock:
+            if max_bins not in self._binned:
+                bin_thresholds = [_bin_thresholds(self.X[:, fitur_i], max_bins)
+                                  for fitur_i in range(self.X.shape[1])]
+                X_binned = _read_only(_bin_data(self.X, bin_thresholds))
+                self._binned[max_bins] = (X_binned, bin_thresholds)
+
+            return self._binned[max_bins]
+
+    def encoded_target(self):
+        """
+        Mengambil label class y dan kode class setiap sample (label di-encode satu kali).
+
+        Returns:
+            tuple: (classes, y_encoded) dengan classes[y_encoded] == y.
+        """
+        with self._lock:
+            if self._encoded_target is None:
+                classes, y_encoded = np.unique(self.y, return_inverse=True)
+                self._encoded_target = (_read_only(classes), _read_only(np.ravel(y_encoded)))
+
+            return self._encoded_target
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        for name in ("X", "y", "sample_weight", "sorted_index"):
+            if state[name] is not None:
+                setattr(self, name, _read_only(state[name]))
+
+def _read_only(array):
+    """Membuat view read-only dari array (array asal tidak berubah)."""
+    view = array.view()
+    view.flags.writeable = False
+    return view
@@ -0,0 +1,166 @@
+# Data yang disimpan oleh partial_fit untuk mengembangkan ulang subtree
+
+import numpy as np
+
+from ._tree import TREE_LEAF
+
+class _PartialHistory:
+    """
+    Kode bin, target dan bobot setiap baris yang pernah diberikan ke partial_fit,
+    beserta index baris yang dikelompokkan per leaf tree saat ini:
+
+        - codes     = Kode bin baris (n, n_fitur)
+        - y         = Target baris (sudah di-encode untuk klasifikasi)
+        - w         = Bobot baris (None jika seluruh batch tanpa sample_weight)
+
+    Data baris disimpan pada buffer yang diperbesar dua kali lipat saat penuh, sehingga
+    menambahkan batch membutuhkan O(batch) (amortized). Index baris setiap leaf disimpan
+    sebagai daftar potongan array yang hanya ditambah (batch baru) atau diambil dan
+    dibagi ulang (subtree yang di-grow ulang), sehingga update hanya menyentuh leaf
+    yang terdampak. History tidak dibatasi: setiap baris membutuhkan n_fitur * itemsize
+    kode bin + itemsize target + 8 byte (index baris), ditambah 8 byte jika ada batch
+    dengan sample_weight.
+    """
+    def __init__(self):
+        self.n = 0
+        self._codes = None
+        self._y = None
+        self._w = None
+        self._leaf_rows = {}
+
+    @property
+    def codes(self):
+        return self._codes[:self.n]
+
+    @property
+    def y(self):
+        return self._y[:self.n]
+
+    @property
+    def w(self):
+        return None if self._w is None else self._w[:self.n]
+
+    def __len__(self):
+        return self.n
+
+    def append(self, codes, y, w, leaf):
+        """
+        Menambahkan satu batch ke history.
+
+        Args:
+            codes (numpy.ndarray): Kode bin batch.
+            y (numpy.ndarray): Target batch.
+            w (numpy.ndarray or None): Bobot batch.
+            leaf (numpy.ndarray): Leaf setiap baris batch.
+        """
+        start, end = self.n, self.n + len(codes)
+        if self._codes is None:
+            self._codes = np.empty((0,) + codes.shape[1:], dtype=codes.dtype)
+            self._y = np.empty((0,) + y.shape[1:], dtype=y.dtype)
+        if end > len(self._codes):
+            capacity = max(end, 2 * len(self._codes))
+            self._codes = _resize(self._codes, capacity, start)
+            self._y = _resize(self._y, capacity, start)
+            if self._w is not None:
+                self._w = _resize(self._w, capacity, start)
+
+        # Bobot baru disimpan sejak batch pertama dengan sample_weight (bobot 1 untuk sebelumnya)
+        if w is not None and self._w is None:
+            self._w = np.ones(len(self._codes))
+        self._codes[start:end] = codes
+        self._y[start:end] = y
+        if self._w is not None:
+            self._w[start:end] = 1.0 if w is None else w
+        self.n = end
+
+        self.assign(np.arange(start, end), leaf)
+
+    def assign(self, rows, leaf):
+        """
+        Menambahkan baris ke leaf masing-masing.
+
+        Args:
+            rows (numpy.ndarray): Index baris (terurut naik).
+            leaf (numpy.ndarray): Leaf setiap baris.
+        """
+        if len(rows) == 0:
+            return
+
+        # Pengurutan stabil menjaga index baris tetap terurut naik di dalam setiap leaf
+        order = np.argsort(leaf, kind="stable")
+        leaf_sorted = leaf[order]
+        bounds = np.flatnonzero(np.diff(leaf_sorted)) + 1
+        for node, leaf_rows in zip(leaf_sorted[np.r_[0, bounds]], np.split(rows[order], bounds)):
+            self._leaf_rows.setdefault(int(node), []).append(leaf_rows)
+
+    def rows(self, leaves):
+        """
+        Mengambil index baris dari beberapa leaf.
+
+        Args:
+            leaves (iterable): Leaf (urutan hasil sama dengan urutan leaves).
+
+        Returns:
+            numpy.ndarray: Index baris, terurut naik di dalam setiap leaf.
+        """
+        parts = []
+        for node in leaves:
+            chunks = self._leaf_rows.get(int(node))
+            if chunks is None:
+                continue
+            if len(chunks) > 1:
+                # Potongan digabung satu kali agar pembacaan berikutnya tidak menyalin ulang
+                chunks[:] = [np.concatenate(chunks)]
+            parts.append(chunks[0])
+
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.intp)
+
+    def take(self, leaves):
+        """Mengambil dan menghapus index baris dari beberapa leaf (lihat rows)."""
+        rows = self.rows(leaves)
+        for node in leaves:
+            self._leaf_rows.pop(int(node), None)
+        return rows
+
+    def leaf_counts(self, n_nodes):
+        """
+        Menghitung jumlah baris setiap node leaf.
+
+        Args:
+            n_nodes (int): Jumlah node tree.
+
+        Returns:
+            numpy.ndarray: Jumlah baris setiap node (0 untuk node internal).
+        """
+        counts = np.zeros(n_nodes, dtype=np.intp)
+        for node, chunks in self._leaf_rows.items():
+            counts[node] = sum(len(chunk) for chunk in chunks)
+        return counts
+
+    def remap(self, new_index):
+        """
+        Mengganti index leaf setelah tree di-compact.
+
+        Args:
+            new_index (numpy.ndarray): Index baru setiap node lama (TREE_LEAF jika dihapus).
+        """
+        remapped = {}
+        for node, chunks in self._leaf_rows.items():
+            if new_index[node] == TREE_LEAF:
+                raise ValueError(f"leaf {node} masih berisi baris tetapi dihapus dari tree")
+            remapped[int(new_index[node])] = chunks
+        self._leaf_rows = remapped
+
+    def __getstate__(self):
+        # Hanya bagian buffer yang terisi yang disimpan
+        state = self.__dict__.copy()
+        for name in ("_codes", "_y", "_w"):
+            if state[name] is not None:
+                state[name] = state[name][:self.n].copy()
+        return state
+
+def _resize(array, capacity, n):
+    """Membuat buffer baru berkapasitas capacity yang berisi n elemen pertama array."""
+    resized = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+    resized[:n] = array[:n]
+    return resized
@@ -0,0 +1,100 @@
+# Format biner model Decision Tree (header + array node yang berurutan)
+#
+# Struktur file:
+#     MAGIC (8 byte) | versi (uint32) | panjang header (uint32) | header JSON
+#     | padding | array 1 | padding | array 2 | ...
+#
+# Header berisi metadata model dan daftar array (nama, dtype, shape, offset).
+# Setiap array diletakkan pada offset kelipatan ALIGNMENT sehingga dapat
+# dibaca langsung dengan np.memmap tanpa disalin.
+
+import json
+import struct
+
+import numpy as np
+
+MAGIC = b"MLFSTREE"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+_PREFIX = struct.Struct("<8sII")
+
+def _align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+def write_arrays(path, meta, arrays):
+    """
+    Menyimpan metadata dan array ke dalam satu file biner.
+
+    Args:
+        path (str): Path file tujuan.
+        meta (dict): Metadata yang dapat di-serialize ke JSON.
+        arrays (dict): Pasangan nama dan numpy.ndarray.
+    """
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    for name, array in arrays.items():
+        if array.dtype.hasobject:
+            raise ValueError(f"array {name} bertipe object tidak dapat disimpan")
+
+    # Offset array dihitung dari panjang header, header dibuat ulang hingga stabil
+    layout = []
+    data_start = 0
+    while True:
+        layout, offset = [], data_start
+        for name, array in arrays.items():
+            offset = _align(offset)
+            layout.append({
+                "name": name,
+                "dtype": array.dtype.newbyteorder("<").str,
+                "shape": list(array.shape),
+                "offset": offset
+            })
+            offset += array.nbytes
+        header = json.dumps({"meta": meta, "arrays": layout}).encode("utf-8")
+        new_start = _align(_PREFIX.size + len(header))
+        if new_start == data_start:
+            break
+        data_start = new_start
+
+    with open(path, "wb") as file:
+        file.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header)))
+        file.write(header)
+        for entry, array in zip(layout, arrays.values()):
+            file.write(b"\0" * (entry["offset"] - file.tell()))
+            file.write(array.astype(entry["dtype"], copy=False).tobytes())
+
+def read_arrays(path, mmap=True):
+    """
+    Membaca metadata dan array dari file biner.
+
+    Args:
+        path (str): Path file.
+        mmap (bool, optional): Jika True, array dibaca dengan np.memmap (read-only,
+            halaman file dibagi bersama antar proses). Jika False, array dimuat ke memory.
+
+    Returns:
+        tuple: (meta, arrays).
+    """
+    with open(path, "rb") as file:
+        prefix = file.read(_PREFIX.size)
+        if len(prefix) != _PREFIX.size:
+            raise ValueError(f"{path} bukan file model Decision Tree")
+        magic, version, header_size = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError(f"{path} bukan file model Decision Tree")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"versi format {version} tidak didukung (maksimal {FORMAT_VERSION})")
+        header = json.loads(file.read(header_size).decode("utf-8"))
+
+        arrays = {}
+        for entry in header["arrays"]:
+            dtype, shape = np.dtype(entry["dtype"]), tuple(entry["shape"])
+            if mmap and int(np.prod(shape)) > 0:
+                arrays[entry["name"]] = np.memmap(path, dtype=dtype, mode="r",
+                                                  offset=entry["offset"], shape=shape)
+            else:
+                file.seek(entry["offset"])
+                count = int(np.prod(shape))
+                arrays[entry["name"]] = np.fromfile(file, dtype=dtype, count=count).reshape(shape)
+
+    return header["meta"], arrays
@@ -0,0 +1,124 @@
+# Input sparse (CSR/CSC) tanpa densifikasi
+#
+# Matriks sparse dikenali dari atributnya (format, indptr, indices, data, shape) sehingga
+# matriks scipy.sparse dapat digunakan tanpa menjadikan scipy dependency.
+
+import numpy as np
+
+SPARSE_FORMATS = ("csr", "csc")
+
+def _is_sparse(X):
+    """Apakah X berupa matriks sparse CSR/CSC (misal scipy.sparse.csr_matrix)."""
+    return getattr(X, "format", None) in SPARSE_FORMATS \
+           and all(hasattr(X, name) for name in ("indptr", "indices", "data", "shape"))
+
+class _SparseMatrix:
+    """
+    Matriks sparse read-only dengan akses elemen X[rows, cols] tanpa densifikasi,
+
+        - format    = "csr" (baris demi baris) atau "csc" (kolom demi kolom)
+        - indptr    = Batas elemen setiap baris (csr) atau kolom (csc)
+        - indices   = Index kolom (csr) atau baris (csc) setiap elemen, terurut dalam baris/kolom
+        - data      = Nilai setiap elemen non-zero
+        - shape     = (n_rows, n_cols)
+
+    Setiap elemen memiliki key major * n_minor + minor yang terurut, sehingga nilai
+    X[rows, cols] dicari dengan binary search (elemen yang tidak tersimpan bernilai 0).
+    """
+    def __init__(self, X):
+        self.format = X.format
+        self.shape = tuple(int(size) for size in X.shape)
+        indptr = np.asarray(X.indptr, dtype=np.int64)
+        indices = np.asarray(X.indices, dtype=np.int64)
+        data = np.asarray(X.data, dtype=np.float64)
+
+        n_major = len(indptr) - 1
+        major = np.repeat(np.arange(n_major, dtype=np.int64), np.diff(indptr))
+        keys = major * self._n_minor + indices
+
+        # Index dalam baris/kolom belum tentu terurut (format non-canonical)
+        if np.any(keys[1:] < keys[:-1]):
+            order = np.argsort(keys, kind="stable")
+            keys, indices, data = keys[order], indices[order], data[order]
+
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self._keys = keys
+        self._value_order = None
+
+    @property
+    def _n_minor(self):
+        return self.shape[1] if self.format == "csr" else self.shape[0]
+
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+    @property
+    def itemsize(self):
+        return self.data.itemsize
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        rows, cols = key
+        rows, cols = np.broadcast_arrays(np.asarray(rows, dtype=np.int64),
+                                         np.asarray(cols, dtype=np.int64))
+        if self.format == "csr":
+            query = rows * self.shape[1] + cols
+        else:
+            query = cols * self.shape[0] + rows
+
+        # Binary search key elemen, elemen yang tidak ditemukan bernilai 0
+        position = np.searchsorted(self._keys, query)
+        position = np.minimum(position, max(self.nnz - 1, 0))
+        if self.nnz == 0:
+            return np.zeros(query.shape)
+        found = self._keys[position] == query
+
+        return np.where(found, self.data[position], 0.0)
+
+    def tocsc(self):
+        """Mengubah matriks menjadi format csc (tanpa densifikasi)."""
+        if self.format == "csc":
+            return self
+
+        # Elemen diurutkan ulang berdasarkan (kolom, baris)
+        rows = np.repeat(np.arange(self.shape[0], dtype=np.int64), np.diff(self.indptr))
+        order = np.lexsort((rows, self.indices))
+        counts = np.bincount(self.indices, minlength=self.shape[1])
+
+        csc = _SparseMatrix.__new__(_SparseMatrix)
+        csc.format = "csc"
+        csc.shape = self.shape
+        csc.indptr = np.concatenate(([0], np.cumsum(counts)))
+        csc.indices = rows[order]
+        csc.data = self.data[order]
+        csc._keys = self.indices[order] * self.shape[0] + csc.indices
+        csc._value_order = None
+
+        return csc
+
+    def sorted_column(self, fitur_i):
+        """
+        Mengambil elemen non-zero satu kolom (format csc) yang terurut berdasarkan nilai.
+
+        Args:
+            fitur_i (int): Index kolom.
+
+        Returns:
+            tuple: (rows, values) baris dan nilai elemen non-zero, urut naik berdasarkan nilai.
+        """
+        # Urutan nilai dalam setiap kolom dihitung satu kali untuk seluruh kolom
+        if self._value_order is None:
+            columns = np.repeat(np.arange(self.shape[1]), np.diff(self.indptr))
+            self._value_order = np.lexsort((self.data, columns))
+
+        order = self._value_order[self.indptr[fitur_i]:self.indptr[fitur_i + 1]]
+        return self.indices[order], self.data[order]
@@ -0,0 +1,72 @@
+# Instrumentasi proses fit Decision Tree
+
+import threading
+
+class FitStats:
+    """
+    Statistik proses fit yang dicatat per kedalaman tree,
+
+        - nodes              = Jumlah node yang dibuat
+        - thresholds         = Jumlah kandidat threshold yang dievaluasi saat pencarian split
+        - criterion_calls    = Jumlah pemanggilan criteria (evaluate, sweep, node_impurity)
+        - partition_bytes    = Jumlah byte yang dibaca/ditulis saat partisi index sample
+        - split_time         = Waktu pencarian split (detik)
+        - partition_time     = Waktu partisi index sample (detik)
+
+    Ditambah fit_time dan pruning_time untuk keseluruhan fit. Pencatatan aman
+    dilakukan dari beberapa thread (n_jobs > 1).
+    """
+    FIELDS = ("nodes", "thresholds", "criterion_calls", "partition_bytes",
+              "split_time", "partition_time")
+
+    def __init__(self):
+        self.depths = []
+        self.fit_time = 0.0
+        self.pruning_time = 0.0
+        self._lock = threading.Lock()
+
+    def _add(self, depth, **values):
+        with self._lock:
+            while len(self.depths) <= depth:
+                self.depths.append(dict.fromkeys(self.FIELDS, 0))
+            for key, value in values.items():
+                # Scalar NumPy diubah menjadi tipe Python agar dapat di-serialize (JSON)
+                self.depths[depth][key] += value.item() if hasattr(value, "item") else value
+
+    def record_node(self, depth, n_criterion_calls=1):
+        self._add(depth, nodes=1, criterion_calls=n_criterion_calls)
+
+    def record_split(self, depth, n_thresholds, n_criterion_calls, seconds):
+        self._add(depth, thresholds=n_thresholds, criterion_calls=n_criterion_calls,
+                  split_time=seconds)
+
+    def record_partition(self, depth, n_bytes, seconds):
+        self._add(depth, partition_bytes=n_bytes, partition_time=seconds)
+
+    def to_dict(self):
+        """
+        Mengubah statistik menjadi dictionary (misal untuk dikirim ke dashboard).
+
+        Returns:
+            dict: fit_time, pruning_time, total dan statistik per kedalaman.
+        """
+        total = dict.fromkeys(self.FIELDS, 0)
+        for stats in self.depths:
+            for key in self.FIELDS:
+                total[key] += stats[key]
+
+        return {
+            "fit_time": self.fit_time,
+            "pruning_time": self.pruning_time,
+            "total": total,
+            "depths": [dict(stats, depth=depth) for depth, stats in enumerate(self.depths)]
+        }
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
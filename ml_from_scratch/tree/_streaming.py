@@ -0,0 +1,114 @@
+# Sumber data chunked untuk training out-of-core
+
+import itertools
+
+import numpy as np
+
+# Jumlah baris sample yang digunakan untuk menentukan threshold bin
+STREAMING_SAMPLE_SIZE = 100000
+
+class ChunkedData:
+    """
+    Sumber data chunked yang dapat diiterasi berulang kali, setiap chunk berupa tuple (X, y).
+
+    Training streaming membaca seluruh chunk satu kali untuk setiap level tree,
+    sehingga chunks harus dapat diiterasi ulang,
+
+        - chunks   = Sequence berisi tuple (X, y), atau fungsi tanpa argumen yang
+                     mengembalikan iterator baru berisi tuple (X, y)
+    """
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def __iter__(self):
+        if callable(self.chunks):
+            return iter(self.chunks())
+        return iter(self.chunks)
+
+    @classmethod
+    def from_npy(cls, X_paths, y_paths):
+        """
+        Membuat sumber data dari shard .npy yang dibaca dengan memory-map.
+
+        Args:
+            X_paths (list): Path file .npy data fitur untuk tiap shard.
+            y_paths (list): Path file .npy data target untuk tiap shard.
+
+        Returns:
+            ChunkedData: Sumber data chunked.
+        """
+        def read_chunks():
+            for X_path, y_path in zip(X_paths, y_paths):
+                yield np.load(X_path, mmap_mode="r"), np.load(y_path, mmap_mode="r")
+
+        return cls(read_chunks)
+
+    @classmethod
+    def from_csv(cls, path, target_column=-1, chunk_size=100000, delimiter=",", skip_header=0):
+        """
+        Membuat sumber data dari file CSV numerik yang dibaca per chunk baris.
+
+        Args:
+            path (str): Path file CSV.
+            target_column (int, optional): Index kolom target. Default: -1.
+            chunk_size (int, optional): Jumlah baris tiap chunk. Default: 100000.
+            delimiter (str, optional): Pemisah kolom. Default: ",".
+            skip_header (int, optional): Jumlah baris header yang dilewati. Default: 0.
+
+        Returns:
+            ChunkedData: Sumber data chunked.
+        """
+        def read_chunks():
+            with open(path) as file:
+                lines = itertools.islice(file, skip_header, None)
+                while True:
+                    chunk = list(itertools.islice(lines, chunk_size))
+                    if not chunk:
+                        break
+                    data = np.loadtxt(chunk, delimiter=delimiter, ndmin=2)
+                    yield np.delete(data, target_column, axis=1), data[:, target_column]
+
+        return cls(read_chunks)
+
+def _scan(data, classes=False, sample_size=STREAMING_SAMPLE_SIZE, seed=0):
+    """
+    Membaca seluruh chunk satu kali untuk mengambil ukuran data, class target
+    dan sample baris (bottom-k random key) untuk menentukan threshold bin.
+
+    Args:
+        data (ChunkedData): Sumber data chunked.
+        classes (bool, optional): Kumpulkan class target (hanya untuk klasifikasi,
+            target regresi tidak disimpan). Default: False.
+        sample_size (int, optional): Jumlah baris sample maksimal.
+        seed (int, optional): Seed random key sample.
+
+    Returns:
+        tuple: (n_samples, X_sample, y_unique), y_unique None jika classes=False.
+    """
+    rng = np.random.default_rng(seed)
+    n_samples = 0
+    X_sample, key_sample = None, None
+    y_unique = None
+    for X_chunk, y_chunk in data:
+        X_chunk = np.asarray(X_chunk)
+        n_samples += len(X_chunk)
+
+        # Menyimpan class target yang ditemukan
+        if classes:
+            chunk_unique = np.unique(np.ravel(y_chunk))
+            y_unique = chunk_unique if y_unique is None else np.union1d(y_unique, chunk_unique)
+
+        # Mempertahankan sample_size baris dengan random key terkecil
+        key_chunk = rng.random(len(X_chunk))
+        if X_sample is None:
+            X_sample, key_sample = X_chunk[:0].astype(float), key_chunk[:0]
+        X_sample = np.concatenate((X_sample, X_chunk))
+        key_sample = np.concatenate((key_sample, key_chunk))
+        if len(key_sample) > sample_size:
+            keep = np.argpartition(key_sample, sample_size)[:sample_size]
+            X_sample, key_sample = X_sample[keep], key_sample[keep]
+
+    if n_samples == 0:
+        raise ValueError("ChunkedData tidak berisi data")
+
+    return n_samples, X_sample, y_unique
@@ -0,0 +1,316 @@
+# Representasi Decision Tree dalam bentuk array (struct-of-arrays)
+
+import numpy as np
+
+TREE_LEAF = -1
+
+class Tree:
+    """
+    Fungsi yang digunakan untuk melakukan inisiasi Tree,
+
+        - thresh        = Threshold untuk membagi region
+        - fitur         = Fitur data untuk mendefinisikan root
+        - val           = Nilai dari node
+        - child_left    = Hasil split region children bagian kiri
+        - child_right   = Hasil split region children bagian kanan
+        - impurity      = Nilai impuritas dari data dalam region
+        - leaf          = Apakah node tersebut leaf?
+        - n_samples     = Total sample yang digunakan
+
+    Model yang sudah di-fit disimpan sebagai FlatTree, Tree hanya digunakan
+    sebagai view (lihat FlatTree.to_node).
+    """
+    __slots__ = ("thresh", "fitur", "val", "child_left", "child_right",
+                 "impurity", "leaf", "n_samples")
+
+    def __init__(
+        self,
+        thresh=None,
+        fitur=None,
+        val=None,
+        child_left=None,
+        child_right=None,
+        impurity=None,
+        leaf=None,
+        n_samples=None
+    ):
+        self.thresh = thresh
+        self.fitur = fitur
+        self.val = val
+        self.child_left = child_left
+        self.child_right = child_right
+        self.impurity =  impurity
+        self.leaf = leaf
+        self.n_samples = n_samples
+
+class FlatTree:
+    """
+    Decision Tree yang disimpan sebagai array paralel, satu elemen per node,
+
+        - feature       = Fitur yang digunakan untuk split (-1 untuk leaf)
+        - threshold     = Threshold split (nan untuk leaf)
+        - left          = Index child kiri (TREE_LEAF untuk leaf)
+        - right         = Index child kanan (TREE_LEAF untuk leaf)
+        - value         = Nilai prediksi node
+        - impurity      = Nilai impuritas node
+        - n_samples     = Total sample pada node
+        - weighted_n_samples = Total bobot sample pada node (default sama dengan n_samples)
+
+    Root berada pada index 0 dan index child selalu lebih besar dari parent.
+    """
+    def __init__(self, feature, threshold, left, right, value, impurity, n_samples,
+                 weighted_n_samples=None):
+        self.feature = np.asarray(feature, dtype=np.intp)
+        self.threshold = np.asarray(threshold, dtype=np.float64)
+        self.left = np.asarray(left, dtype=np.intp)
+        self.right = np.asarray(right, dtype=np.intp)
+        self.value = np.asarray(value)
+        self.impurity = np.asarray(impurity, dtype=np.float64)
+        self.n_samples = np.asarray(n_samples, dtype=np.intp)
+        if weighted_n_samples is None:
+            weighted_n_samples = self.n_samples
+        self.weighted_n_samples = np.asarray(weighted_n_samples, dtype=np.float64)
+
+    @property
+    def node_count(self):
+        return len(self.feature)
+
+    def is_leaf(self, node):
+        return self.left[node] == TREE_LEAF
+
+    def apply(self, X):
+        """
+        Mencari leaf untuk seluruh baris X sekaligus.
+
+        Seluruh baris diturunkan bersama-sama: pada setiap level, vektor index node
+        dari baris yang belum mencapai leaf dimajukan ke child kiri atau kanan.
+
+        Args:
+            X (numpy.ndarray): Data fitur berbentuk (n_samples, n_fitur).
+
+        Returns:
+            numpy.ndarray: Index leaf untuk setiap baris.
+        """
+        node = np.zeros(len(X), dtype=np.intp)
+        return self._descend(X, np.arange(len(X)), node)
+
+    def _descend(self, X, rows, node):
+        """
+        Menurunkan pasangan (baris X, node awal) hingga mencapai leaf.
+
+        Args:
+            X (numpy.ndarray): Data fitur berbentuk (n_samples, n_fitur).
+            rows (numpy.ndarray): Index baris X untuk setiap pasangan.
+            node (numpy.ndarray): Index node awal untuk setiap pasangan (diubah in-place).
+
+        Returns:
+            numpy.ndarray: Index leaf untuk setiap pasangan.
+        """
+        active = np.flatnonzero(self.left[node] != TREE_LEAF)
+
+        while len(active) > 0:
+            # Memajukan node dari seluruh baris aktif satu level
+            node_active = node[active]
+            fitur_val = X[rows[active], self.feature[node_active]]
+            node_active = np.where(fitur_val <= self.threshold[node_active],
+                                   self.left[node_active],
+                                   self.right[node_active])
+            node[active] = node_active
+
+            # Baris yang sudah mencapai leaf tidak diproses lagi
+            active = active[self.left[node_active] != TREE_LEAF]
+
+        return node
+
+    def decision_path(self, X, node=None):
+        """
+        Mencari node yang dilewati setiap baris X, seluruh baris diturunkan bersama-sama.
+
+        Args:
+            X (numpy.ndarray): Data fitur berbentuk (n_samples, n_fitur).
+            node (numpy.ndarray, optional): Node awal setiap baris. Default: None (root).
+
+        Returns:
+            tuple: (indptr, indices) matriks indikator node dalam format CSR.
+        """
+        rows = np.arange(len(X))
+        if node is None:
+            node = np.zeros(len(X), dtype=np.intp)
+        else:
+            node = np.array(node, dtype=np.intp)
+        path_rows, path_nodes = [rows], [node.copy()]
+
+        active = np.flatnonzero(self.left[node] != TREE_LEAF)
+        while len(active) > 0:
+            node_active = node[active]
+            fitur_val = X[active, self.feature[node_active]]
+            node_active = np.where(fitur_val <= self.threshold[node_active],
+                                   self.left[node_active],
+                                   self.right[node_active])
+            node[active] = node_active
+            path_rows.append(active)
+            path_nodes.append(node_active)
+
+            active = active[self.left[node_active] != TREE_LEAF]
+
+        # Index child selalu lebih besar dari parent, sehingga urutan (baris, node)
+        # sama dengan urutan node dari root ke leaf
+        path_rows = np.concatenate(path_rows)
+        path_nodes = np.concatenate(path_nodes)
+        order = np.lexsort((path_nodes, path_rows))
+        indptr = np.zeros(len(X) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(path_rows, minlength=len(X)), out=indptr[1:])
+
+        return indptr, path_nodes[order]
+
+    def compact(self, return_index=False):
+        """
+        Membuang node yang tidak lagi terhubung ke root (misal setelah pruning)
+        dan menyusun ulang index node dalam urutan preorder.
+
+        Args:
+            return_index (bool, optional): Jika True, index baru setiap node lama juga
+                dikembalikan (TREE_LEAF untuk node yang dibuang). Default: False.
+
+        Returns:
+            FlatTree: Tree baru dengan node yang terhubung saja.
+        """
+        # Mengumpulkan node dalam urutan preorder
+        order = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            if self.left[node] != TREE_LEAF:
+                stack.append(self.right[node])
+                stack.append(self.left[node])
+        order = np.asarray(order, dtype=np.intp)
+
+        # Memetakan index lama ke index baru
+        new_index = np.full(self.node_count, TREE_LEAF, dtype=np.intp)
+        new_index[order] = np.arange(len(order))
+        left = self.left[order]
+        right = self.right[order]
+        is_split = left != TREE_LEAF
+
+        tree = FlatTree(
+            feature = self.feature[order],
+            threshold = self.threshold[order],
+            left = np.where(is_split, new_index[left], TREE_LEAF),
+            right = np.where(is_split, new_index[right], TREE_LEAF),
+            value = self.value[order],
+            impurity = self.impurity[order],
+            n_samples = self.n_samples[order],
+            weighted_n_samples = self.weighted_n_samples[order]
+        )
+        if return_index:
+            return tree, new_index
+
+        return tree
+
+    def to_node(self, node=0):
+        """
+        Membuat view Tree (linked object) dari sebuah node.
+
+        Args:
+            node (int, optional): Index node yang dijadikan root. Default: 0.
+
+        Returns:
+            Tree: Root dari view Tree.
+        """
+        view = Tree(
+            val = self.value[node],
+            impurity = self.impurity[node],
+            leaf = self.is_leaf(node),
+            n_samples = self.n_samples[node]
+        )
+        if not view.leaf:
+            view.fitur = self.feature[node]
+            view.thresh = self.threshold[node]
+            view.child_left = self.to_node(self.left[node])
+            view.child_right = self.to_node(self.right[node])
+
+        return view
+
+class _NodeList:
+    """
+    Penampung node selama pengembangan tree, diubah menjadi FlatTree setelah selesai.
+    """
+    def __init__(self):
+        self.feature = []
+        self.threshold = []
+        self.left = []
+        self.right = []
+        self.value = []
+        self.impurity = []
+        self.n_samples = []
+        self.weighted_n_samples = []
+
+    def add_node(self, value, impurity, n_samples, weighted_n_samples=None):
+        """Menambahkan node leaf dan mengembalikan index node."""
+        self.feature.append(TREE_LEAF)
+        self.threshold.append(np.nan)
+        self.left.append(TREE_LEAF)
+        self.right.append(TREE_LEAF)
+        self.value.append(value)
+        self.impurity.append(impurity)
+        self.n_samples.append(n_samples)
+        self.weighted_n_samples.append(n_samples if weighted_n_samples is None else weighted_n_samples)
+
+        return len(self.feature) - 1
+
+    def set_split(self, node, feature, threshold, left, right):
+        """Mengubah node leaf menjadi node split."""
+        self.feature[node] = feature
+        self.threshold[node] = threshold
+        self.left[node] = left
+        self.right[node] = right
+
+    def graft(self, subtree):
+        """
+        Menyalin seluruh node dari _NodeList lain ke bagian akhir list ini.
+
+        Args:
+            subtree (_NodeList): Subtree dengan root pada index 0.
+
+        Returns:
+            int: Index root subtree pada list ini.
+        """
+        offset = len(self.feature)
+        self.feature.extend(subtree.feature)
+        self.threshold.extend(subtree.threshold)
+        self.left.extend(child + offset if child != TREE_LEAF else TREE_LEAF
+                         for child in subtree.left)
+        self.right.extend(child + offset if child != TREE_LEAF else TREE_LEAF
+                          for child in subtree.right)
+        self.value.extend(subtree.value)
+        self.impurity.extend(subtree.impurity)
+        self.n_samples.extend(subtree.n_samples)
+        self.weighted_n_samples.extend(subtree.weighted_n_samples)
+
+        return offset
+
+    def resolve(self, get_subtree):
+        """
+        Mengganti child yang masih berupa placeholder (misal Future dari worker)
+        dengan subtree yang di-graft, sesuai urutan node.
+
+        Args:
+            get_subtree (callable): Fungsi yang mengubah placeholder menjadi _NodeList.
+        """
+        for node in range(len(self.feature)):
+            for children in (self.left, self.right):
+                if not isinstance(children[node], (int, np.integer)):
+                    children[node] = self.graft(get_subtree(children[node]))
+
+    def to_tree(self):
+        return FlatTree(
+            feature = self.feature,
+            threshold = self.threshold,
+            left = self.left,
+            right = self.right,
+            value = self.value,
+            impurity = self.impurity,
+            n_samples = self.n_samples,
+            weighted_n_samples = self.weighted_n_samples
+        )
@@ -0,0 +1,21 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+@pytest.fixture
+def regression_data():
+    """Data regresi sintetis (X, y) dengan target bergantung pada dua fitur pertama."""
+    rng = np.random.default_rng(0)
+    X = rng.random((600, 4))
+    y = X[:, 0] + X[:, 1] ** 2 + 0.1 * rng.standard_normal(len(X))
+    return X, y
+
+@pytest.fixture
+def classification_data(regression_data):
+    """Data klasifikasi sintetis (X, y) dengan label string."""
+    X, y = regression_data
+    return X, np.where(y > np.median(y), "hi", "lo")
@@ -0,0 +1,91 @@
+import numpy as np
+
+from ml_from_scratch.tree import DecisionTreeRegressor
+from ml_from_scratch.tree._tree import TREE_LEAF
+
+def _fit(X, y, **params):
+    model = DecisionTreeRegressor(max_depth=5, **params)
+    model.fit(X, y)
+    return model
+
+def test_decision_path_csr(regression_data):
+    X, y = regression_data
+    model = _fit(X, y)
+    tree = model.tree_
+    indptr, indices = model.decision_path(X)
+    leaves = model.apply(X)
+
+    assert indptr.shape == (len(X) + 1,)
+    assert indptr[0] == 0 and indptr[-1] == len(indices)
+    depth, _ = model._node_depth_size(tree)
+    np.testing.assert_array_equal(np.diff(indptr), depth[leaves] + 1)
+
+    # Setiap path dimulai dari root, mengikuti split baris tersebut dan berakhir pada leaf-nya
+    for i in range(len(X)):
+        path = indices[indptr[i]:indptr[i + 1]]
+        assert path[0] == 0 and path[-1] == leaves[i]
+        assert tree.left[leaves[i]] == TREE_LEAF
+        for parent, child in zip(path[:-1], path[1:]):
+            go_left = X[i, tree.feature[parent]] <= tree.threshold[parent]
+            assert child == (tree.left[parent] if go_left else tree.right[parent])
+
+    np.testing.assert_array_equal(model.predict(X), tree.value[leaves].ravel())
+
+class _CountingApply:
+    """Membungkus FlatTree.apply untuk mencatat jumlah baris yang ditelusuri."""
+    def __init__(self, tree):
+        self.apply = tree.apply
+        self.rows = []
+
+    def __call__(self, X):
+        self.rows.append(len(X))
+        return self.apply(X)
+
+def _count_traversals(model):
+    counter = _CountingApply(model.tree_)
+    model.tree_.apply = counter
+    return counter
+
+def test_leaf_cache_hits(regression_data):
+    X, y = regression_data
+    model = _fit(X, y, cache_size=1000)
+    expected = _fit(X, y).apply(X)
+    counter = _count_traversals(model)
+
+    # Baris duplikat dalam satu batch hanya ditelusuri sekali
+    rows = np.concatenate([X[:50], X[:50]])
+    np.testing.assert_array_equal(model.apply(rows), np.concatenate([expected[:50]] * 2))
+    assert counter.rows == [50]
+
+    # Batch berikutnya hanya menelusuri baris yang belum ada di cache
+    np.testing.assert_array_equal(model.apply(X[:80]), expected[:80])
+    np.testing.assert_array_equal(model.predict(X[:80]), model.tree_.value[expected[:80]].ravel())
+    assert counter.rows == [50, 30]
+    assert len(model._leaf_cache) == 80
+
+def test_leaf_cache_lru_eviction(regression_data):
+    X, y = regression_data
+    model = _fit(X, y, cache_size=3)
+    counter = _count_traversals(model)
+
+    for i in range(3):
+        model.apply(X[i:i + 1])
+    model.apply(X[:1])                      # Baris 0 menjadi yang terakhir dipakai
+    model.apply(X[3:4])                     # Baris 1 (paling lama) dibuang
+    assert counter.rows == [1, 1, 1, 1]
+    assert len(model._leaf_cache) == 3
+
+    model.apply(X[[0, 2, 3]])
+    assert counter.rows == [1, 1, 1, 1]
+    model.apply(X[1:2])
+    assert counter.rows == [1, 1, 1, 1, 1]
+
+def test_leaf_cache_cleared_when_tree_changes(regression_data):
+    X, y = regression_data
+    model = _fit(X, y, cache_size=100)
+    model.apply(X[:10])
+    assert len(model._leaf_cache) == 10
+
+    pruned = model.prune(model.cost_complexity_pruning_path()["ccp_alphas"][-2])
+    assert len(pruned._leaf_cache) == 0
+    np.testing.assert_array_equal(pruned.apply(X), pruned.tree_.apply(X))
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from ml_from_scratch.tree import DecisionTreeClassifier
+from ml_from_scratch.tree import DecisionTreeRegressor
+from ml_from_scratch.tree._tree import TREE_LEAF
+
+def test_deep_tree_without_recursion_limit():
+    # Label berselang-seling: setiap split hanya memisahkan satu baris (kedalaman ~n)
+    n = 3000
+    X = np.arange(n, dtype=float)[:, None]
+    y = np.arange(n) % 2
+    model = DecisionTreeClassifier()
+    model.fit(X, y)
+
+    assert model.tree_.node_count == 2 * n - 1
+    np.testing.assert_array_equal(model.predict(X), y)
+
+def _splits(tree):
+    """Himpunan split (fitur, threshold, n_samples) dari node internal tree."""
+    internal = tree.left != TREE_LEAF
+    return set(zip(tree.feature[internal].tolist(), tree.threshold[internal].tolist(),
+                   tree.n_samples[internal].tolist()))
+
+def test_max_leaf_nodes_budget_and_best_first_order(regression_data):
+    X, y = regression_data
+    previous = set()
+    for max_leaf_nodes in range(2, 12):
+        model = DecisionTreeRegressor(max_leaf_nodes=max_leaf_nodes)
+        model.fit(X, y)
+        tree = model.tree_
+        assert int((tree.left == TREE_LEAF).sum()) == max_leaf_nodes
+
+        # Best-first: tree dengan satu leaf lebih banyak hanya menambah satu split
+        splits = _splits(tree)
+        assert previous <= splits and len(splits) == len(previous) + 1
+        previous = splits
+
+    stump = DecisionTreeRegressor(max_depth=1)
+    stump.fit(X, y)
+    model = DecisionTreeRegressor(max_leaf_nodes=2)
+    model.fit(X, y)
+    np.testing.assert_array_equal(model.predict(X), stump.predict(X))
+
+def _assert_same_tree(tree, expected):
+    for name in ("feature", "threshold", "left", "right", "n_samples", "value"):
+        np.testing.assert_array_equal(getattr(tree, name), getattr(expected, name))
+
+@pytest.mark.parametrize("params", [
+    dict(max_depth=8),
+    dict(max_depth=8, max_bins=32, max_features=3, random_state=0),
+])
+def test_n_jobs_matches_serial(params):
+    # Cukup besar agar split dicari paralel (PARALLEL_SPLIT_MIN_SAMPLES) dan subtree
+    # dikerjakan oleh worker (PARALLEL_SUBTREE_DEPTH)
+    rng = np.random.default_rng(1)
+    X = rng.random((12000, 5))
+    y = X[:, 0] + np.sin(6 * X[:, 1]) + 0.1 * rng.standard_normal(len(X))
+    for model_class, target in ((DecisionTreeRegressor, y), (DecisionTreeClassifier, y > 1.0)):
+        serial = model_class(**params)
+        serial.fit(X, target)
+        threaded = model_class(n_jobs=4, **params)
+        threaded.fit(X, target)
+
+        _assert_same_tree(threaded.tree_, serial.tree_)
+        np.testing.assert_array_equal(threaded.predict(X), serial.predict(X))
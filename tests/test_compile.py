@@ -0,0 +1,60 @@
+import pickle
+
+import numpy as np
+
+from ml_from_scratch.tree import DecisionTreeClassifier
+from ml_from_scratch.tree import DecisionTreeRegressor
+
+def test_compiled_regressor_matches_predict(regression_data):
+    X, y = regression_data
+    model = DecisionTreeRegressor(max_depth=8)
+    model.fit(X, y)
+    compiled = model.compile()
+
+    expected = model.predict(X)
+    np.testing.assert_array_equal(compiled.predict(X), expected)
+    np.testing.assert_array_equal([compiled.predict_row(x) for x in X], expected)
+
+def test_compiled_classifier_matches_predict(classification_data):
+    X, y = classification_data
+    model = DecisionTreeClassifier(max_depth=8)
+    model.fit(X, y)
+    compiled = model.compile()
+
+    expected = model.predict(X)
+    np.testing.assert_array_equal(compiled.predict(X), expected)
+    np.testing.assert_array_equal([compiled.predict_row(x) for x in X], expected)
+
+def test_compile_refreshed_after_refit(regression_data):
+    X, y = regression_data
+    model = DecisionTreeRegressor(max_depth=3)
+    model.fit(X, y)
+    first = model.compile()
+    assert model.compile() is first
+
+    model.fit(X, -y)
+    np.testing.assert_array_equal(model.compile().predict(X), model.predict(X))
+
+def test_compiled_model_pickle_round_trip(classification_data):
+    X, y = classification_data
+    model = DecisionTreeClassifier(max_depth=6)
+    model.fit(X, y)
+    compiled = model.compile()
+
+    loaded = pickle.loads(pickle.dumps(model))
+    np.testing.assert_array_equal(loaded.compile().predict(X), compiled.predict(X))
+    np.testing.assert_array_equal([loaded.compile().predict_row(x) for x in X[:20]],
+                                  model.predict(X[:20]))
+
+def test_compiled_predict_nan_and_single_leaf(regression_data):
+    X, y = regression_data
+    model = DecisionTreeRegressor(max_depth=6)
+    model.fit(X, y)
+    X_nan = X[:50].copy()
+    X_nan[::3, 0] = np.nan
+    np.testing.assert_array_equal(model.compile().predict(X_nan), model.predict(X_nan))
+
+    stump = DecisionTreeRegressor(max_depth=0)
+    stump.fit(X, y)
+    np.testing.assert_array_equal(stump.compile().predict(X), stump.predict(X))
+    assert stump.compile().predict_row(X[0]) == stump.predict(X[:1])[0]
@@ -0,0 +1,90 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from ml_from_scratch.tree import DecisionTreeRegressor
+from ml_from_scratch.tree import _criteria
+
+CRITERIA = [
+    lambda y: _criteria.GiniCriterion(np.unique(y)),
+    lambda y: _criteria.EntropyCriterion(np.unique(y)),
+    lambda y: _criteria.LogLossCriterion(np.unique(y)),
+    lambda y: _criteria.MSECriterion(),
+    lambda y: _criteria.MAECriterion()
+]
+
+def make_target(criterion_i, rng, n=40):
+    if criterion_i < 3:
+        return rng.integers(0, 3, n)
+    return rng.standard_normal(n)
+
+@pytest.mark.parametrize("criterion_i", range(len(CRITERIA)))
+@pytest.mark.parametrize("weighted", [False, True])
+def test_sweep_matches_evaluate(criterion_i, weighted):
+    rng = np.random.default_rng(criterion_i)
+    y = make_target(criterion_i, rng)
+    w = rng.random(len(y)) + 0.1 if weighted else None
+    criterion = CRITERIA[criterion_i](y)
+
+    left, right = criterion.sweep(y, w)
+    for i in range(1, len(y)):
+        w_left = None if w is None else w[:i]
+        w_right = None if w is None else w[i:]
+        assert left[i - 1] == pytest.approx(criterion.evaluate(y[:i], w_left), abs=1e-9)
+        assert right[i - 1] == pytest.approx(criterion.evaluate(y[i:], w_right), abs=1e-9)
+
+@pytest.mark.parametrize("criterion_i", range(len(CRITERIA)))
+def test_incremental_update_matches_evaluate(criterion_i):
+    rng = np.random.default_rng(criterion_i)
+    y = make_target(criterion_i, rng)
+    criterion = CRITERIA[criterion_i](y)
+
+    criterion.reset()
+    criterion.update(y)
+    criterion.reverse_update(y[:10])
+    assert criterion.impurity() == pytest.approx(criterion.evaluate(y[10:]), abs=1e-9)
+
+def test_unit_weights_match_unweighted():
+    rng = np.random.default_rng(0)
+    y = rng.standard_normal(30)
+    for criterion in (_criteria.MSECriterion(), _criteria.MAECriterion()):
+        assert criterion.evaluate(y, np.ones(len(y))) == pytest.approx(criterion.evaluate(y))
+
+def test_mae_zero_weight():
+    criterion = _criteria.MAECriterion()
+    y = np.array([1.0, 2.0, 5.0])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert criterion.evaluate(y, np.zeros(3)) == 0.0
+        assert criterion.node_impurity(np.array([])) == 0.0
+        assert criterion.evaluate(np.array([]), np.array([])) == 0.0
+
+def test_absolute_error_binned_high_codes():
+    rng = np.random.default_rng(0)
+    X = rng.random((500, 3))
+    y = X[:, 0] + rng.normal(0, 0.1, 500)
+    model = DecisionTreeRegressor(max_depth=4, max_bins=255, criteria="absolute_error")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        model.fit(X, y)
+    assert (model.tree_.n_samples > 0).all()
+
+def test_absolute_error_leaves_predict_weighted_median():
+    rng = np.random.default_rng(0)
+    X = rng.random((300, 2))
+    y = rng.exponential(size=300)
+    w = rng.random(300)
+    model = DecisionTreeRegressor(max_depth=2, criteria="absolute_error")
+    model.fit(X, y, sample_weight=w)
+
+    criterion = _criteria.MAECriterion()
+    leaf = model.apply(X)
+    for node in np.unique(leaf):
+        rows = leaf == node
+        y_node, w_node = y[rows], w[rows]
+        assert model.tree_.value[node] == criterion.leaf_value(y_node, w_node)
+        # Median berbobot meminimalkan MAE node
+        order = np.argsort(y_node)
+        assert criterion.node_impurity(y_node[order], w_node[order]) <= \
+            np.sum(w_node * np.abs(y_node - np.average(y_node, weights=w_node))) / w_node.sum() + 1e-12
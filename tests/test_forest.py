@@ -0,0 +1,78 @@
+import types
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from ml_from_scratch.ensemble import RandomForestClassifier
+from ml_from_scratch.ensemble import RandomForestRegressor
+from ml_from_scratch.ensemble import _forest
+
+def _assert_same_forest(forest, expected):
+    assert len(forest.estimators_) == len(expected.estimators_)
+    for tree, expected_tree in zip(forest.estimators_, expected.estimators_):
+        for name in ("feature", "threshold", "left", "right", "value"):
+            np.testing.assert_array_equal(getattr(tree.tree_, name),
+                                          getattr(expected_tree.tree_, name))
+
+@pytest.mark.parametrize("max_bins", [None, 16])
+def test_forest_deterministic_across_n_jobs(regression_data, max_bins):
+    X, y = regression_data
+    params = dict(n_estimators=5, max_depth=5, max_bins=max_bins, random_state=7)
+    serial = RandomForestRegressor(**params)
+    serial.fit(X, y)
+    processes = RandomForestRegressor(n_jobs=2, **params)
+    processes.fit(X, y)
+
+    _assert_same_forest(processes, serial)
+    np.testing.assert_array_equal(processes.predict(X), serial.predict(X))
+
+    # Seed lain menghasilkan bootstrap dan fitur yang berbeda
+    other = RandomForestRegressor(**dict(params, random_state=8))
+    other.fit(X, y)
+    assert not np.array_equal(other.predict(X), serial.predict(X))
+
+def test_forest_classifier_deterministic_across_n_jobs(classification_data):
+    X, y = classification_data
+    params = dict(n_estimators=4, max_depth=4, random_state=0)
+    serial = RandomForestClassifier(**params)
+    serial.fit(X, y)
+    processes = RandomForestClassifier(n_jobs=2, **params)
+    processes.fit(X, y)
+
+    _assert_same_forest(processes, serial)
+    np.testing.assert_array_equal(processes.predict_proba(X), serial.predict_proba(X))
+    np.testing.assert_array_equal(processes.predict(X), serial.predict(X))
+
+@pytest.fixture
+def recorded_shared_memory(monkeypatch):
+    """Mencatat nama shared memory yang dibuat oleh proses utama."""
+    created = []
+
+    def record(*args, **kwargs):
+        shm = shared_memory.SharedMemory(*args, **kwargs)
+        if kwargs.get("create"):
+            created.append(shm.name)
+        return shm
+
+    monkeypatch.setattr(_forest, "shared_memory", types.SimpleNamespace(SharedMemory=record))
+    return created
+
+def _assert_unlinked(names):
+    assert names
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+def test_forest_shared_memory_released(regression_data, recorded_shared_memory):
+    X, y = regression_data
+    forest = RandomForestRegressor(n_estimators=3, max_depth=3, n_jobs=2, random_state=0)
+    forest.fit(X, y)
+    _assert_unlinked(recorded_shared_memory)
+
+def test_forest_shared_memory_released_on_error(regression_data, recorded_shared_memory):
+    X, y = regression_data
+    forest = RandomForestRegressor(n_estimators=3, criteria="unknown", n_jobs=2, random_state=0)
+    with pytest.raises(KeyError):
+        forest.fit(X, y)
+    _assert_unlinked(recorded_shared_memory)
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from ml_from_scratch.ensemble import GradientBoostingClassifier
+from ml_from_scratch.ensemble import GradientBoostingRegressor
+
+def test_regressor_training_loss_decreases(regression_data):
+    # Loss validasi pada data training: setiap leaf bergeser ke arah rata-rata residualnya
+    X, y = regression_data
+    model = GradientBoostingRegressor(n_estimators=30, max_depth=3)
+    model.fit(X, y, X_val=X, y_val=y)
+
+    loss = np.array(model.validation_loss_)
+    assert len(loss) == model.n_iter_ == 30
+    assert np.all(np.diff(loss) <= 1e-12)
+    assert loss[-1] < 0.5 * np.var(y)
+    assert np.isclose(np.mean((model.predict(X) - y) ** 2), loss[-1])
+
+@pytest.mark.parametrize("n_classes", [2, 3])
+def test_classifier_training_loss_decreases(regression_data, n_classes):
+    X, y = regression_data
+    labels = np.digitize(y, np.quantile(y, np.linspace(0, 1, n_classes + 1)[1:-1]))
+    model = GradientBoostingClassifier(n_estimators=30, max_depth=3)
+    model.fit(X, labels, X_val=X, y_val=labels)
+
+    loss = np.array(model.validation_loss_)
+    assert loss[-1] < 0.5 * loss[0]
+    assert np.mean(np.diff(loss) < 0) > 0.9
+    proba = model.predict_proba(X)
+    assert proba.shape == (len(X), n_classes)
+    np.testing.assert_allclose(proba.sum(axis=1), 1.0)
+
+def test_early_stopping_keeps_best_iteration():
+    rng = np.random.default_rng(0)
+    X = rng.random((400, 3))
+    y = X[:, 0] + rng.standard_normal(len(X))
+    n_iter_no_change = 5
+    model = GradientBoostingRegressor(n_estimators=500, learning_rate=0.5,
+                                      n_iter_no_change=n_iter_no_change, random_state=0)
+    model.fit(X, y)
+
+    loss = model.validation_loss_
+    best = int(np.argmin(loss))
+    assert model.n_iter_ == len(model.estimators_) == best + 1 < 500
+    assert len(loss) == best + 1 + n_iter_no_change
+
+    # Prediksi hanya menggunakan tree sampai iterasi terbaik
+    raw = model.init_raw_[0] + model.learning_rate * sum(trees[0].predict(X)
+                                                         for trees in model.estimators_)
+    np.testing.assert_allclose(model.predict(X), raw)
+
+def test_early_stopping_with_explicit_validation(regression_data):
+    X, y = regression_data
+    model = GradientBoostingRegressor(n_estimators=200, learning_rate=0.3, n_iter_no_change=3)
+    model.fit(X[:400], y[:400], X_val=X[400:], y_val=y[400:])
+
+    # Seluruh data training dipakai (tidak ada validation_fraction yang dipisahkan)
+    assert model.n_samples == 400
+    assert model.n_iter_ == int(np.argmin(model.validation_loss_)) + 1
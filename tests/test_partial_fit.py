@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from ml_from_scratch.tree import DecisionTreeClassifier
+from ml_from_scratch.tree import DecisionTreeRegressor
+from ml_from_scratch.tree._classes import _bin_data
+
+def fit_binned(model, X, y, bin_thresholds, sample_weight=None):
+    """Fit dari seluruh data dengan threshold bin yang sama dengan partial_fit."""
+    model._fit(_bin_data(X, bin_thresholds), y, bin_thresholds=bin_thresholds,
+               sample_weight=sample_weight)
+    return model
+
+def test_partial_fit_matches_fit_regressor(regression_data):
+    X, y = regression_data
+    params = dict(max_depth=5, max_bins=32)
+    model = DecisionTreeRegressor(**params)
+    for start in range(0, len(X), 200):
+        model.partial_fit(X[start:start + 200], y[start:start + 200])
+
+    expected = fit_binned(DecisionTreeRegressor(**params), X, y, model.bin_thresholds_)
+    assert model.tree_.node_count == expected.tree_.node_count
+    np.testing.assert_allclose(model.predict(X), expected.predict(X), atol=1e-12)
+    assert model.n_samples == len(X)
+
+def test_partial_fit_matches_fit_weighted_classifier(classification_data):
+    X, y = classification_data
+    w = np.random.default_rng(0).random(len(X))
+    params = dict(max_depth=4, max_bins=16)
+    model = DecisionTreeClassifier(**params)
+    for start in range(0, len(X), 150):
+        batch = slice(start, start + 150)
+        model.partial_fit(X[batch], y[batch], classes=["hi", "lo"], sample_weight=w[batch])
+
+    expected = fit_binned(DecisionTreeClassifier(**params), X, y, model.bin_thresholds_, w)
+    np.testing.assert_array_equal(model.predict(X), expected.predict(X))
+    np.testing.assert_array_equal(model.classes_, ["hi", "lo"])
+
+def test_partial_fit_history_grouped_by_leaf(regression_data):
+    # Index baris history setiap leaf sama dengan hasil routing seluruh history ke tree
+    X, y = regression_data
+    model = DecisionTreeRegressor(max_depth=6, max_bins=32, max_features=2, random_state=3)
+    for start in range(0, len(X), 50):
+        model.partial_fit(X[start:start + 50], y[start:start + 50])
+
+    history = model._history
+    leaf = model._code_tree(model._grown).apply(history.codes)
+    counts = history.leaf_counts(model._grown.node_count)
+    np.testing.assert_array_equal(counts, np.bincount(leaf, minlength=len(counts)))
+    for node in np.unique(leaf):
+        np.testing.assert_array_equal(history.rows([node]), np.flatnonzero(leaf == node))
+
+def test_partial_fit_requires_max_bins(regression_data):
+    X, y = regression_data
+    with pytest.raises(ValueError):
+        DecisionTreeRegressor().partial_fit(X, y)
+
+def test_partial_fit_unknown_class(classification_data):
+    X, y = classification_data
+    model = DecisionTreeClassifier(max_bins=8)
+    model.partial_fit(X, y)
+    with pytest.raises(ValueError):
+        model.partial_fit(X[:5], np.array(["new"] * 5))
+
+def test_partial_fit_after_fit_rejected(regression_data):
+    X, y = regression_data
+    model = DecisionTreeRegressor(max_depth=4, max_bins=16)
+    model.fit(X, y)
+    with pytest.raises(ValueError):
+        model.partial_fit(X[:50], y[:50])
+
+def test_partial_fit_after_prune_rejected(regression_data):
+    X, y = regression_data
+    model = DecisionTreeRegressor(max_depth=4, max_bins=16)
+    model.partial_fit(X, y)
+    pruned = model.prune(model.cost_complexity_pruning_path()["ccp_alphas"][1])
+    with pytest.raises(ValueError):
+        pruned.partial_fit(X[:50], y[:50])
+    model.partial_fit(X[:50], y[:50])
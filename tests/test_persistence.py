@@ -0,0 +1,103 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from ml_from_scratch.tree import DecisionTreeClassifier
+from ml_from_scratch.tree import DecisionTreeRegressor
+from ml_from_scratch.tree._criteria import MSECriterion
+from ml_from_scratch.tree._criteria import NewtonCriterion
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_regressor(tmp_path, regression_data, mmap):
+    X, y = regression_data
+    model = DecisionTreeRegressor(max_depth=6)
+    model.fit(X, y)
+
+    path = str(tmp_path / "model.bin")
+    model.save(path)
+    loaded = DecisionTreeRegressor.load(path, mmap=mmap)
+
+    np.testing.assert_array_equal(loaded.predict(X), model.predict(X))
+    np.testing.assert_array_equal(loaded.apply(X), model.apply(X))
+    assert loaded.max_depth == 6
+
+def test_save_load_classifier(tmp_path, classification_data):
+    X, y = classification_data
+    model = DecisionTreeClassifier(max_depth=5, max_bins=32)
+    model.fit(X, y)
+
+    path = str(tmp_path / "model.bin")
+    model.save(path)
+    loaded = DecisionTreeClassifier.load(path)
+
+    np.testing.assert_array_equal(loaded.predict(X), model.predict(X))
+
+def test_load_wrong_class(tmp_path, regression_data):
+    X, y = regression_data
+    model = DecisionTreeRegressor(max_depth=2)
+    model.fit(X, y)
+
+    path = str(tmp_path / "model.bin")
+    model.save(path)
+    with pytest.raises(ValueError):
+        DecisionTreeClassifier.load(path)
+
+def test_pickle_round_trip(classification_data):
+    X, y = classification_data
+    model = DecisionTreeClassifier(max_depth=5)
+    model.fit(X, y)
+
+    restored = pickle.loads(pickle.dumps(model))
+    np.testing.assert_array_equal(restored.predict(X), model.predict(X))
+
+def test_save_load_classes(tmp_path, classification_data):
+    X, _ = classification_data
+    y = np.where(X[:, 0] > 0.5, 3, 7)
+    model = DecisionTreeClassifier(max_depth=3)
+    model.fit(X, y)
+
+    path = str(tmp_path / "model.bin")
+    model.save(path)
+    loaded = DecisionTreeClassifier.load(path)
+
+    np.testing.assert_array_equal(loaded.classes_, model.classes_)
+    assert loaded.classes_.dtype == model.classes_.dtype
+
+def test_save_load_criterion_object(tmp_path, regression_data):
+    X, y = regression_data
+    grad_hess = np.column_stack((-y, np.ones(len(y))))
+    model = DecisionTreeRegressor(max_depth=4, criteria=NewtonCriterion(l2_regularization=1.0))
+    model.fit(X, grad_hess)
+
+    path = str(tmp_path / "model.bin")
+    model.save(path)
+    loaded = DecisionTreeRegressor.load(path)
+
+    assert isinstance(loaded.criteria, NewtonCriterion)
+    assert loaded.criteria.l2_regularization == 1.0
+    np.testing.assert_array_equal(loaded.predict(X), model.predict(X))
+
+def test_save_custom_criterion_rejected(tmp_path, regression_data):
+    X, y = regression_data
+
+    class CustomCriterion(MSECriterion):
+        pass
+
+    model = DecisionTreeRegressor(max_depth=2, criteria=CustomCriterion())
+    model.fit(X, y)
+    with pytest.raises(ValueError):
+        model.save(str(tmp_path / "model.bin"))
+
+def test_save_load_weighted_n_samples(tmp_path, regression_data):
+    X, y = regression_data
+    w = np.random.default_rng(0).random(len(X))
+    model = DecisionTreeRegressor(max_depth=3)
+    model.fit(X, y, sample_weight=w)
+
+    path = str(tmp_path / "model.bin")
+    model.save(path)
+    loaded = DecisionTreeRegressor.load(path, mmap=False)
+
+    assert loaded.weighted_n_samples == model.weighted_n_samples
+    np.testing.assert_array_equal(loaded.tree_.weighted_n_samples, model.tree_.weighted_n_samples)
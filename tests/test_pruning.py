@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from ml_from_scratch.tree import DecisionTreeClassifier
+from ml_from_scratch.tree import DecisionTreeRegressor
+from ml_from_scratch.tree._tree import TREE_LEAF
+
+def _weakest_link_path(model):
+    """Weakest link pruning langsung dari definisinya (g(t) seluruh node dihitung ulang setiap langkah)."""
+    tree = model.tree_
+    risk = tree.weighted_n_samples * tree.impurity / model.weighted_n_samples
+    leaf = set(np.flatnonzero(tree.left == TREE_LEAF).tolist())
+
+    def subtree(node):
+        # (risk subtree, jumlah leaf)
+        if node in leaf:
+            return risk[node], 1
+        risk_left, leaves_left = subtree(tree.left[node])
+        risk_right, leaves_right = subtree(tree.right[node])
+        return risk_left + risk_right, leaves_left + leaves_right
+
+    def internal(node):
+        if node in leaf:
+            return []
+        return [node] + internal(tree.left[node]) + internal(tree.right[node])
+
+    alphas, impurities = [0.0], [subtree(0)[0]]
+    while 0 not in leaf:
+        g = {}
+        for node in internal(0):
+            subtree_risk, n_leaves = subtree(node)
+            g[node] = (risk[node] - subtree_risk) / (n_leaves - 1)
+        alpha = max(min(g.values()), alphas[-1])
+        leaf.update(node for node, value in g.items() if np.isclose(value, alpha, rtol=0, atol=1e-12))
+        if np.isclose(alpha, alphas[-1], rtol=0, atol=1e-12):
+            impurities[-1] = subtree(0)[0]
+        else:
+            alphas.append(alpha)
+            impurities.append(subtree(0)[0])
+
+    return np.array(alphas), np.array(impurities)
+
+def _leaf_risk(model):
+    tree = model.tree_
+    leaves = tree.left == TREE_LEAF
+    return np.sum(tree.weighted_n_samples[leaves] * tree.impurity[leaves]) / model.weighted_n_samples
+
+@pytest.fixture(params=["regressor", "weighted_classifier"])
+def fitted(request, regression_data, classification_data):
+    if request.param == "regressor":
+        X, y = regression_data
+        model = DecisionTreeRegressor(max_depth=6)
+        model.fit(X, y)
+    else:
+        X, y = classification_data
+        model = DecisionTreeClassifier(max_depth=6)
+        model.fit(X, y, sample_weight=np.random.default_rng(0).random(len(X)))
+    return model
+
+def test_pruning_path_matches_weakest_link(fitted):
+    expected_alphas, expected_impurities = _weakest_link_path(fitted)
+    path = fitted.cost_complexity_pruning_path()
+
+    np.testing.assert_allclose(path["ccp_alphas"], expected_alphas, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(path["impurities"], expected_impurities, rtol=1e-9, atol=1e-12)
+    assert np.all(np.diff(path["ccp_alphas"]) > 0)
+
+def test_prune_follows_pruning_path(fitted):
+    path = fitted.cost_complexity_pruning_path()
+    node_count = fitted.tree_.node_count
+    alphas, impurities = path["ccp_alphas"], path["impurities"]
+
+    previous = node_count + 1
+    for alpha, next_alpha, impurity in zip(alphas, np.append(alphas[1:], np.inf), impurities):
+        pruned = fitted.prune(alpha)
+        assert pruned.tree_.node_count < previous
+        assert np.isclose(_leaf_risk(pruned), impurity)
+        previous = pruned.tree_.node_count
+
+        # Alpha di antara dua titik path menghasilkan subtree yang sama dengan titik bawahnya
+        between = fitted.prune(np.nextafter(next_alpha, -np.inf))
+        assert between.tree_.node_count == pruned.tree_.node_count
+
+    assert fitted.prune(0.0).tree_.node_count == node_count
+    assert fitted.prune(alphas[-1]).tree_.node_count == 1
+    # Model asal tidak berubah
+    assert fitted.tree_.node_count == node_count
+
+def test_prune_rejects_negative_alpha(fitted):
+    with pytest.raises(ValueError):
+        fitted.prune(-1.0)
@@ -0,0 +1,68 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from ml_from_scratch.serving import MicroBatchPredictor
+from ml_from_scratch.tree import DecisionTreeRegressor
+
+@pytest.fixture
+def model(regression_data):
+    X, y = regression_data
+    model = DecisionTreeRegressor(max_depth=5)
+    model.fit(X, y)
+    return model
+
+def test_micro_batches_match_batch_predict(model, regression_data):
+    X, _ = regression_data
+
+    async def run():
+        async with MicroBatchPredictor(model, max_batch_size=16, max_wait=0.005) as service:
+            results = await asyncio.gather(*[service.predict(x) for x in X[:100]])
+        return results, service.stats()
+
+    results, stats = asyncio.run(run())
+    np.testing.assert_array_equal(results, model.predict(X[:100]))
+    assert stats["n_requests"] == 100
+    assert stats["n_batches"] >= 100 // 16
+    assert stats["batch_size"]["count"] == stats["n_batches"]
+    assert stats["latency"]["count"] == 100
+
+def test_stop_flushes_pending_requests(model, regression_data):
+    X, _ = regression_data
+
+    async def run():
+        service = MicroBatchPredictor(model, max_batch_size=8, max_wait=1.0)
+        await service.start()
+        tasks = [asyncio.create_task(service.predict(x)) for x in X[:20]]
+        await asyncio.sleep(0)
+        await service.stop()
+        return [task.result() for task in tasks]
+
+    np.testing.assert_array_equal(asyncio.run(run()), model.predict(X[:20]))
+
+def test_invalid_row_rejected(model):
+    async def run():
+        async with MicroBatchPredictor(model) as service:
+            await service.predict([1.0, 2.0])
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+
+def test_malformed_row_fails_only_its_batch(model, regression_data):
+    X, _ = regression_data
+
+    class WithoutNFitur:
+        def predict(self, X):
+            return model.predict(X)
+
+    async def run():
+        async with MicroBatchPredictor(WithoutNFitur(), max_batch_size=8, max_wait=0.01) as service:
+            batch = await asyncio.gather(service.predict(X[0]), service.predict(X[1, :2]),
+                                         return_exceptions=True)
+            after = await service.predict(X[2])
+        return batch, after
+
+    batch, after = asyncio.run(asyncio.wait_for(run(), 5))
+    assert all(isinstance(result, ValueError) for result in batch)
+    assert after == model.predict(X[2:3])[0]
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from ml_from_scratch.tree import DecisionTreeClassifier
+from ml_from_scratch.tree import DecisionTreeRegressor
+
+class SparseMatrix:
+    """Matriks CSR/CSC minimal (atribut yang sama dengan scipy.sparse) dari array dense."""
+    def __init__(self, dense, format):
+        self.format = format
+        self.shape = dense.shape
+        major = dense if format == "csr" else dense.T
+        nonzero = [np.flatnonzero(row) for row in major]
+        self.indptr = np.concatenate(([0], np.cumsum([len(index) for index in nonzero])))
+        self.indices = np.concatenate(nonzero)
+        self.data = np.concatenate([row[index] for row, index in zip(major, nonzero)])
+
+def sparsify(X, density=0.3, seed=0):
+    """Membuat sebagian besar elemen X menjadi nol."""
+    mask = np.random.default_rng(seed).random(X.shape) < density
+    return np.where(mask, X, 0.0)
+
+def tree_signature(tree):
+    return tree.feature.tolist(), np.nan_to_num(tree.threshold, nan=-1).tolist()
+
+@pytest.mark.parametrize("format", ["csr", "csc"])
+def test_sparse_fit_matches_dense_regressor(regression_data, format):
+    X, y = regression_data
+    X = sparsify(X)
+    dense = DecisionTreeRegressor(max_depth=6)
+    dense.fit(X, y)
+    sparse = DecisionTreeRegressor(max_depth=6)
+    sparse.fit(SparseMatrix(X, format), y)
+
+    assert tree_signature(sparse.tree_) == tree_signature(dense.tree_)
+    np.testing.assert_allclose(sparse.predict(SparseMatrix(X, format)), dense.predict(X))
+
+def test_sparse_fit_matches_dense_classifier(classification_data):
+    X, y = classification_data
+    X = sparsify(X, density=0.5)
+    dense = DecisionTreeClassifier(max_depth=5, criteria="entropy")
+    dense.fit(X, y)
+    sparse = DecisionTreeClassifier(max_depth=5, criteria="entropy")
+    sparse.fit(SparseMatrix(X, "csr"), y)
+
+    assert tree_signature(sparse.tree_) == tree_signature(dense.tree_)
+    np.testing.assert_array_equal(sparse.predict(SparseMatrix(X, "csr")), dense.predict(X))
+
+def test_sparse_with_max_bins_rejected(regression_data):
+    X, y = regression_data
+    with pytest.raises(ValueError):
+        DecisionTreeRegressor(max_bins=16).fit(SparseMatrix(sparsify(X), "csr"), y)
@@ -0,0 +1,49 @@
+import json
+import pickle
+
+import numpy as np
+
+from ml_from_scratch.tree import DecisionTreeRegressor
+
+def test_fit_stats_disabled_by_default(regression_data):
+    X, y = regression_data
+    model = DecisionTreeRegressor(max_depth=3)
+    model.fit(X, y)
+    assert model.fit_stats_ is None
+
+def test_fit_stats_counts_nodes_per_depth(regression_data):
+    X, y = regression_data
+    model = DecisionTreeRegressor(max_depth=4, fit_stats=True)
+    model.fit(X, y)
+    stats = model.fit_stats_.to_dict()
+
+    depth, _ = model._node_depth_size(model.tree_)
+    assert [level["nodes"] for level in stats["depths"]] == np.bincount(depth).tolist()
+    assert [level["depth"] for level in stats["depths"]] == list(range(5))
+    assert stats["total"]["nodes"] == model.tree_.node_count
+
+    # Root mengevaluasi threshold setiap fitur dan mempartisi index sample, leaf tidak dicari split-nya
+    root = stats["depths"][0]
+    assert root["thresholds"] >= X.shape[1]
+    assert root["criterion_calls"] > 0
+    assert root["partition_bytes"] > 0
+    assert stats["depths"][-1]["thresholds"] == 0
+    assert stats["fit_time"] >= stats["total"]["split_time"] > 0
+
+def test_fit_stats_serializable_and_thread_independent(regression_data):
+    X, y = regression_data
+    serial = DecisionTreeRegressor(max_depth=4, fit_stats=True)
+    serial.fit(X, y)
+    threaded = DecisionTreeRegressor(max_depth=4, fit_stats=True, n_jobs=2)
+    threaded.fit(X, y)
+
+    stats = serial.fit_stats_.to_dict()
+    assert json.loads(json.dumps(stats)) == stats
+
+    # Penghitung (bukan waktu) tidak bergantung pada jumlah thread
+    counters = ("nodes", "thresholds", "criterion_calls", "partition_bytes")
+    for level, expected in zip(threaded.fit_stats_.to_dict()["depths"], stats["depths"]):
+        assert {key: level[key] for key in counters} == {key: expected[key] for key in counters}
+
+    restored = pickle.loads(pickle.dumps(serial)).fit_stats_
+    assert restored.to_dict() == stats
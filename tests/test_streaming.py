@@ -0,0 +1,60 @@
+import numpy as np
+
+from ml_from_scratch.tree import ChunkedData
+from ml_from_scratch.tree import DecisionTreeClassifier
+from ml_from_scratch.tree import DecisionTreeRegressor
+from ml_from_scratch.tree import TreeDataset
+from ml_from_scratch.tree._streaming import _scan
+
+def test_chunked_fit_matches_array_fit(regression_data):
+    X, y = regression_data
+    chunks = ChunkedData([(X[start:start + 100], y[start:start + 100])
+                          for start in range(0, len(X), 100)])
+    streaming = DecisionTreeRegressor(max_depth=5, max_bins=32)
+    streaming.fit(chunks)
+    in_memory = DecisionTreeRegressor(max_depth=5, max_bins=32)
+    in_memory.fit(X, y)
+
+    np.testing.assert_allclose(streaming.predict(X), in_memory.predict(X))
+
+def test_memmap_fit_matches_array_fit(tmp_path, regression_data):
+    X, y = regression_data
+    path = str(tmp_path / "X.npy")
+    np.save(path, X)
+    mapped = DecisionTreeRegressor(max_depth=5)
+    mapped.fit(np.load(path, mmap_mode="r"), y)
+    in_memory = DecisionTreeRegressor(max_depth=5)
+    in_memory.fit(X, y)
+
+    np.testing.assert_array_equal(mapped.predict(X), in_memory.predict(X))
+
+def test_dataset_fit_matches_array_fit(regression_data):
+    X, y = regression_data
+    data = TreeDataset(X, y, max_bins=32)
+    for params in (dict(max_depth=4), dict(max_depth=4, max_bins=32)):
+        from_dataset = DecisionTreeRegressor(**params)
+        from_dataset.fit(data)
+        from_array = DecisionTreeRegressor(**params)
+        from_array.fit(X, y)
+        np.testing.assert_array_equal(from_dataset.predict(X), from_array.predict(X))
+
+def test_chunked_fit_classifier(classification_data):
+    X, y = classification_data
+    chunks = ChunkedData([(X[start:start + 100], y[start:start + 100])
+                          for start in range(0, len(X), 100)])
+    streaming = DecisionTreeClassifier(max_depth=4, max_bins=32)
+    streaming.fit(chunks)
+
+    np.testing.assert_array_equal(streaming.classes_, ["hi", "lo"])
+    assert set(streaming.predict(X)) <= {"hi", "lo"}
+
+def test_scan_skips_regression_target(regression_data):
+    X, y = regression_data
+    chunks = ChunkedData([(X[:300], y[:300]), (X[300:], y[300:])])
+
+    n_samples, _, y_unique = _scan(chunks)
+    assert n_samples == len(X)
+    assert y_unique is None
+
+    _, _, y_unique = _scan(chunks, classes=True)
+    np.testing.assert_array_equal(y_unique, np.unique(y))
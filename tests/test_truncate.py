@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from ml_from_scratch.tree import DecisionTreeClassifier
+from ml_from_scratch.tree import DecisionTreeRegressor
+from ml_from_scratch.tree._tree import TREE_LEAF
+
+def _assert_same_tree(tree, expected):
+    for name in ("feature", "threshold", "left", "right", "n_samples", "value"):
+        np.testing.assert_array_equal(getattr(tree, name), getattr(expected, name))
+    np.testing.assert_allclose(tree.impurity, expected.impurity, atol=1e-12)
+
+@pytest.mark.parametrize("stricter", [
+    dict(max_depth=3),
+    dict(sample_split_min=40),
+    dict(impurity_reduction_min=1e-3),
+    dict(max_leaf_nodes=7),
+    dict(max_depth=4, sample_split_min=20, max_leaf_nodes=9),
+])
+@pytest.mark.parametrize("max_bins", [None, 32])
+def test_truncate_matches_direct_fit(regression_data, stricter, max_bins):
+    X, y = regression_data
+    model = DecisionTreeRegressor(max_bins=max_bins)
+    model.fit(X, y)
+    node_count = model.tree_.node_count
+
+    truncated = model.truncate(**stricter)
+    expected = DecisionTreeRegressor(max_bins=max_bins, **stricter)
+    expected.fit(X, y)
+
+    _assert_same_tree(truncated.tree_, expected.tree_)
+    np.testing.assert_array_equal(truncated.predict(X), expected.predict(X))
+    assert model.tree_.node_count == node_count
+
+def test_truncate_classifier_matches_direct_fit(classification_data):
+    X, y = classification_data
+    model = DecisionTreeClassifier(max_depth=8)
+    model.fit(X, y)
+
+    truncated = model.truncate(max_depth=4, sample_split_min=10)
+    expected = DecisionTreeClassifier(max_depth=4, sample_split_min=10)
+    expected.fit(X, y)
+
+    _assert_same_tree(truncated.tree_, expected.tree_)
+    np.testing.assert_array_equal(truncated.predict(X), expected.predict(X))
+
+def test_truncate_sample_leaf_min(regression_data):
+    # Node dengan child terlalu kecil dijadikan leaf (fit langsung dapat memilih split lain)
+    X, y = regression_data
+    model = DecisionTreeRegressor()
+    model.fit(X, y)
+
+    tree = model.truncate(sample_leaf_min=15).tree_
+    assert tree.n_samples[tree.left == TREE_LEAF].min() >= 15
+    assert tree.node_count < model.tree_.node_count
+
+def test_truncate_rejects_looser_params(regression_data):
+    X, y = regression_data
+    model = DecisionTreeRegressor(max_depth=4, sample_split_min=10)
+    model.fit(X, y)
+
+    with pytest.raises(ValueError):
+        model.truncate(max_depth=6)
+    with pytest.raises(ValueError):
+        model.truncate(sample_split_min=5)
+    with pytest.raises(ValueError):
+        model.truncate(max_leaf_nodes=1)